@@ -11,6 +11,8 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.utils import ImageReader
 
+from data_assistant_app.downsampling import Downsampler, DEFAULT_MAX_POINTS
+
 
 # --- Traducciones simples (ES/EN) ---
 LANG = {
@@ -35,6 +37,9 @@ LANG = {
         "plot_tab_corr": "Correlación",
         "plot_tab_bar": "Barras",
         "tab_data": "Datos",
+        "page_size": "Filas por página",
+        "page": "Página",
+        "rows_range": "Filas {start}-{end} de {total}",
         "info_file": "Información del archivo",
         "preview": "Vista previa",
         "dtypes": "Tipos de datos",
@@ -90,6 +95,9 @@ LANG = {
         "plot_tab_corr": "Correlation",
         "plot_tab_bar": "Bar",
         "tab_data": "Data",
+        "page_size": "Rows per page",
+        "page": "Page",
+        "rows_range": "Rows {start}-{end} of {total}",
         "info_file": "File information",
         "preview": "Preview",
         "dtypes": "Data types",
@@ -166,6 +174,19 @@ def dataframe_overview(df: pd.DataFrame):
         dtypes_df = pd.DataFrame({"columna": df.columns, "dtype": df.dtypes.astype(str)})
         st.dataframe(dtypes_df, use_container_width=True)
 
+def data_page(df: pd.DataFrame):
+    """Muestra una página de filas en lugar de enviar el DataFrame completo al navegador."""
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox(t("page_size"), [50, 100, 500, 1000], index=1)
+    pages = max((len(df) - 1) // page_size + 1, 1)
+    with col2:
+        page = st.number_input(t("page"), min_value=1, max_value=pages, value=1, step=1)
+    start = (int(page) - 1) * page_size
+    # Corte posicional: solo se serializan las filas de la página
+    st.dataframe(df.iloc[start:start + page_size], use_container_width=True)
+    st.caption(t("rows_range").format(start=start + 1, end=min(start + page_size, len(df)), total=len(df)))
+
 def show_statistics(df: pd.DataFrame):
     """Estadísticas descriptivas y nulos por columna."""
     st.subheader(t("desc_stats"))
@@ -192,6 +213,13 @@ def show_statistics(df: pd.DataFrame):
     nulls = df.isna().sum().sort_values(ascending=False)
     st.bar_chart(nulls)
 
+def scatter_points(x: pd.Series, y: pd.Series, max_points: int):
+    """Puntos (x, y, tamaños) de una dispersión; si son muchos se agregan en una rejilla."""
+    px, py, counts = Downsampler.scatter_points(x, y, max(max_points, 1))
+    sizes = 20 if len(counts) == 0 or counts.max() == 1 else 8 + 72 * counts / counts.max()
+    return px, py, sizes
+
+
 def plot_section(df: pd.DataFrame):
     """Sección de gráficas con Matplotlib integrado en Streamlit."""
     st.subheader(t("tab_plots"))
@@ -236,12 +264,12 @@ def plot_section(df: pd.DataFrame):
                 color_choice = st.selectbox(t("color_by_optional"), [t("none_option")] + categorical_cols, key="scatter_color")
             fig, ax = plt.subplots()
             if color_choice == t("none_option") or color_choice not in df.columns:
-                ax.scatter(df[x], df[y], alpha=0.7)
+                ax.scatter(*scatter_points(df[x], df[y], DEFAULT_MAX_POINTS), alpha=0.7)
             else:
                 cats = df[color_choice].astype(str).fillna("NA").unique()[:10]
                 for c in cats:
                     m = (df[color_choice].astype(str) == c)
-                    ax.scatter(df.loc[m, x], df.loc[m, y], alpha=0.7, label=c)
+                    ax.scatter(*scatter_points(df.loc[m, x], df.loc[m, y], DEFAULT_MAX_POINTS // len(cats)), alpha=0.7, label=c)
                 ax.legend(bbox_to_anchor=(1.04, 1), loc="upper left")
             ax.set_xlabel(x)
             ax.set_ylabel(y)
@@ -345,7 +373,7 @@ def main():
 
     with tab_data:
         st.subheader(t("table_full"))
-        st.dataframe(df, use_container_width=True)
+        data_page(df)
 
     # Descarga de reporte PDF mejorado con KPIs, insights y gráficos
     def _build_pdf_report(data: pd.DataFrame, dataset_label: str) -> bytes:
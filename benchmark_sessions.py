@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Synapse Data Platform - Session Backend Benchmark
+
+Starts the development server once per session configuration and measures
+requests/second of N concurrent clients browsing the home page. Each
+client keeps its own session: it switches the language once (so its
+session has data) and then mixes page loads with language-switch requests
+that repeat the current language, like the AJAX language selector.
+
+Usage: python benchmark_sessions.py [--clients 8] [--requests 100]
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+import tempfile
+import subprocess
+import threading
+import urllib.parse
+import urllib.request
+from http.cookiejar import CookieJar
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# name: (SESSION_MODE, SESSION_SAVE_EVERY_REQUEST)
+CONFIGURATIONS = {
+    'db-every-request': ('db', 'True'),
+    'db': ('db', 'False'),
+    'file': ('file', 'False'),
+    'memory': ('memory', 'False'),
+}
+
+# Every n-th request of a client is a language switch instead of a page load
+LANGUAGE_SWITCH_EVERY = 5
+
+
+def free_port():
+    """Return an unused local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(name, workdir):
+    """Start the development server for one configuration; return (process, base URL)"""
+    mode, save_every_request = CONFIGURATIONS[name]
+    env = dict(
+        os.environ,
+        SESSION_MODE=mode,
+        SESSION_SAVE_EVERY_REQUEST=save_every_request,
+        DATABASE_PATH=os.path.join(workdir, f'{name}.sqlite3'),
+        SESSION_CACHE_LOCATION=os.path.join(workdir, f'{name}-sessions'),
+    )
+    manage = os.path.join(BASE_DIR, 'manage.py')
+    subprocess.run([sys.executable, manage, 'migrate', '--noinput', '-v', '0'], env=env, check=True)
+
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, manage, 'runserver', f'127.0.0.1:{port}', '--noreload'],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base_url = f'http://127.0.0.1:{port}'
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(base_url + '/', timeout=1).read()
+            return process, base_url
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"Server for {name} did not start")
+
+
+def run_client(base_url, requests, results):
+    """Browse as one user with its own cookies; append (ok, failed) to results"""
+    cookies = CookieJar()
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(cookies))
+    ok = failed = 0
+
+    def switch_language(language):
+        csrf_token = next((cookie.value for cookie in cookies if cookie.name == 'csrftoken'), '')
+        data = urllib.parse.urlencode({'action': 'change_language', 'language': language}).encode()
+        request = urllib.request.Request(base_url + '/', data=data, headers={'X-CSRFToken': csrf_token})
+        opener.open(request, timeout=30).read()
+
+    opener.open(base_url + '/', timeout=30).read()
+    switch_language('es')
+    for index in range(requests):
+        try:
+            if index % LANGUAGE_SWITCH_EVERY == 0:
+                switch_language('es')
+            else:
+                opener.open(base_url + '/', timeout=30).read()
+            ok += 1
+        except OSError:
+            failed += 1
+    results.append((ok, failed))
+
+
+def benchmark(name, clients, requests, workdir):
+    """Requests/second and failed requests of one configuration"""
+    process, base_url = start_server(name, workdir)
+    try:
+        results = []
+        threads = [threading.Thread(target=run_client, args=(base_url, requests, results)) for _ in range(clients)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        process.terminate()
+        process.wait()
+    ok = sum(result[0] for result in results)
+    failed = sum(result[1] for result in results)
+    return ok / elapsed, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the session backends against the home page')
+    parser.add_argument('--clients', type=int, default=8, help='concurrent clients')
+    parser.add_argument('--requests', type=int, default=100, help='requests per client')
+    parser.add_argument('--configurations', default=','.join(CONFIGURATIONS), help='comma-separated: ' + ', '.join(CONFIGURATIONS))
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients x {args.requests} requests against /")
+    print(f"{'configuration':<20}{'req/s':>10}{'failed':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in args.configurations.split(','):
+            rate, failed = benchmark(name, args.clients, args.requests, workdir)
+            print(f"{name:<20}{rate:>10.1f}{failed:>10}")
+
+
+if __name__ == '__main__':
+    main()
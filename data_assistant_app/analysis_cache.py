@@ -0,0 +1,85 @@
+"""
+Data Assistant App - Analysis Cache
+
+Stores analyze_dataset results in a Django cache backend (settings
+.ANALYSIS_CACHE_ALIAS, a compressed file cache by default) so repeated
+renders, API polls and PDF exports of an unchanged file cost a cache
+lookup instead of a full analysis. Keys combine the file version
+(path, mtime, size), the cleaning strategy applied to the dataset, the
+analysis options (with their defaults filled in, so omitted and explicit
+default options share an entry) and the settings that shape the result;
+a modified file or changed setting gets new keys, and stale entries expire.
+"""
+
+import hashlib
+import logging
+from django.conf import settings
+from django.core.cache import caches
+from .dataset_cache import file_fingerprint
+from .data_loader import MAX_MISSING_ROW_EXAMPLES, DEFAULT_CATEGORICAL_TOP_K
+from .sketches import DEFAULT_SKETCH_EPSILON
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ANALYSIS_CACHE_ALIAS = 'analysis'
+
+# Bumped when the layout of the analysis dictionary changes
+ANALYSIS_CACHE_VERSION = 1
+
+# Options of analyze_dataset as cached when the caller omits them
+DEFAULT_ANALYSIS_OPTIONS = {'quantiles': 'exact'}
+
+
+class AnalysisCache:
+    """Analysis results keyed by file version, cleaning strategy and options"""
+
+    def __init__(self, alias=None, namespace='analysis', defaults=None):
+        self._alias = alias
+        self.namespace = namespace
+        self.defaults = defaults or {}
+
+    @property
+    def backend(self):
+        return caches[self._alias or getattr(settings, 'ANALYSIS_CACHE_ALIAS', DEFAULT_ANALYSIS_CACHE_ALIAS)]
+
+    def key(self, file_path, strategy=None, **options):
+        """Cache key of the analysis of file_path after strategy, computed with options"""
+        options = {**self.defaults, **options}
+        parts = (
+            ANALYSIS_CACHE_VERSION, file_fingerprint(file_path), strategy or 'original',
+            sorted(options.items()), self.settings_key(),
+        )
+        return f'{self.namespace}:' + hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def settings_key():
+        """Settings that change analysis results, so editing one does not serve stale entries"""
+        return (
+            getattr(settings, 'CATEGORICAL_TOP_K', DEFAULT_CATEGORICAL_TOP_K),
+            getattr(settings, 'QUANTILE_SKETCH_EPSILON', DEFAULT_SKETCH_EPSILON),
+            getattr(settings, 'DATASET_OPTIMIZE_MEMORY', False),
+            MAX_MISSING_ROW_EXAMPLES,
+        )
+
+    def get_or_compute(self, file_path, compute, strategy=None, **options):
+        """Return the cached analysis, or run compute() and store its result"""
+        key = self.key(file_path, strategy, **options)
+        try:
+            analysis = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Analysis cache lookup failed for {file_path}: {e}")
+            analysis = None
+        if analysis is not None:
+            logger.debug(f"Analysis cache hit: {file_path} ({strategy or 'original'})")
+            return analysis
+
+        analysis = compute()
+        try:
+            self.backend.set(key, analysis)
+        except Exception as e:
+            logger.warning(f"Could not cache the analysis of {file_path}: {e}")
+        return analysis
+
+
+# Shared analysis cache for the whole process
+analysis_cache = AnalysisCache(defaults=DEFAULT_ANALYSIS_OPTIONS)
@@ -4,7 +4,12 @@ Data Assistant App - Application Configuration
 Django application configuration for the Synapse data analysis platform.
 """
 
+import logging
+import pandas as pd
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
 
 
 class DataAssistantAppConfig(AppConfig):
@@ -13,3 +18,16 @@ class DataAssistantAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'data_assistant_app'
     verbose_name = 'Data Analysis Assistant'
+
+    def ready(self):
+        # Opt-in, as it changes pandas semantics process-wide: copies made by
+        # cleaning then share unmodified columns with the cached original
+        if getattr(settings, 'PANDAS_COPY_ON_WRITE', False):
+            pd.set_option('mode.copy_on_write', True)
+
+        # Spilled working copies of processes that have stopped can never be read again
+        from .working_copies import working_copies
+        try:
+            working_copies.remove_orphaned_spills()
+        except OSError as e:
+            logger.warning(f"Could not clean up spilled working copies: {e}")
@@ -0,0 +1,219 @@
+"""
+Data Assistant App - Chart Aggregation
+
+Computes chart-ready series on the full dataset for the chart API instead
+of plotting the rows shown in the page: group-by aggregates for bar
+charts, x-ordered series reduced with LTTB for line charts, grid-aggregated
+points for dense scatter plots and histogram bins. Results are bounded by
+settings.CHART_MAX_POINTS and cached per file version, cleaning strategy
+and chart spec; the session keeps only the compact spec, and exports
+regenerate the data from the dataset.
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from .analysis_cache import AnalysisCache
+from .downsampling import Downsampler
+
+logger = logging.getLogger(__name__)
+
+CHART_TYPES = ('bar', 'line', 'scatter', 'histogram')
+CHART_AGGREGATIONS = ('mean', 'sum', 'count', 'min', 'max')
+
+DEFAULT_CHART_MAX_POINTS = 1000
+DEFAULT_HISTOGRAM_BINS = 20
+MAX_HISTOGRAM_BINS = 200
+
+# Bounds of a chart spec, which is stored in the session
+MAX_SPEC_NAME_LENGTH = 200
+MAX_FILTER_COLUMNS = 10
+MAX_FILTER_VALUES = 50
+
+
+class ChartAggregator:
+    """Chart series computed from a whole DataFrame"""
+
+    @staticmethod
+    def max_points():
+        return getattr(settings, 'CHART_MAX_POINTS', DEFAULT_CHART_MAX_POINTS)
+
+    @staticmethod
+    def spec(data):
+        """Compact chart spec {type, x, y, agg, bins, filters} from request data.
+
+        filters maps a column to the values (compared as text) of the rows
+        to keep. Specs are small enough to live in the session and
+        normalized so equal charts get equal cache keys. Raises ValueError
+        for an invalid spec; columns are checked against the dataset later.
+        """
+        chart_type = data.get('type') or 'bar'
+        if chart_type not in CHART_TYPES:
+            raise ValueError(f"Unknown chart type: {chart_type}")
+        agg = data.get('agg') or 'mean'
+        if agg not in CHART_AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation: {agg}")
+        # xColumn/yColumn: chart configs saved by earlier versions, which also carried the data arrays
+        x = ChartAggregator._name(data.get('x') or data.get('xColumn'), 'X-axis column')
+        y = data.get('y') or data.get('yColumn')
+        y = None if chart_type == 'histogram' or not y else ChartAggregator._name(y, 'Y-axis column')
+        try:
+            bins = int(data.get('bins') or DEFAULT_HISTOGRAM_BINS)
+        except (TypeError, ValueError):
+            raise ValueError("bins must be an integer")
+
+        filters = data.get('filters') or {}
+        if not isinstance(filters, dict) or len(filters) > MAX_FILTER_COLUMNS:
+            raise ValueError(f"filters must map at most {MAX_FILTER_COLUMNS} columns to lists of values")
+        normalized = {}
+        for column in sorted(filters):
+            values = filters[column] if isinstance(filters[column], list) else [filters[column]]
+            if len(values) > MAX_FILTER_VALUES:
+                raise ValueError(f"At most {MAX_FILTER_VALUES} filter values per column")
+            normalized[ChartAggregator._name(column, 'Filter column')] = sorted({str(value) for value in values})
+
+        return {'type': chart_type, 'x': x, 'y': y, 'agg': agg, 'bins': bins, 'filters': normalized}
+
+    @staticmethod
+    def from_spec(dataset, spec, max_points=None):
+        """Chart data of a spec returned by ChartAggregator.spec"""
+        return ChartAggregator.aggregate(
+            dataset, spec['type'], spec['x'], spec['y'], spec['agg'], spec['bins'], spec['filters'], max_points
+        )
+
+    @staticmethod
+    def aggregate(dataset, chart_type, x, y=None, agg='mean', bins=DEFAULT_HISTOGRAM_BINS, filters=None, max_points=None):
+        """Return {type, x, y, agg, labels, values, counts, rows, truncated} for one chart spec.
+
+        rows is the number of rows with usable values behind the chart;
+        truncated is set when categories or points were dropped or merged
+        to stay within max_points. counts (scatter plots only) holds the
+        number of rows behind each point. Raises ValueError for an invalid spec.
+        """
+        max_points = max_points or ChartAggregator.max_points()
+        counts = None
+        if chart_type not in CHART_TYPES:
+            raise ValueError(f"Unknown chart type: {chart_type}")
+        if agg not in CHART_AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation: {agg}")
+        if x not in dataset.columns:
+            raise ValueError(f"Unknown X-axis column: {x}")
+        if filters:
+            dataset = ChartAggregator._filtered(dataset, filters)
+
+        if chart_type == 'histogram':
+            if not 1 <= bins <= MAX_HISTOGRAM_BINS:
+                raise ValueError(f"bins must be between 1 and {MAX_HISTOGRAM_BINS}")
+            labels, values, rows, truncated = ChartAggregator._histogram(dataset[x], bins)
+            y = agg = None
+        else:
+            if y not in dataset.columns:
+                raise ValueError(f"Unknown Y-axis column: {y}")
+            if x == y:
+                raise ValueError("Cannot use the same column for both axes")
+            y_values = ChartAggregator._numeric(dataset[y], y, 'Y-axis')
+            if chart_type == 'bar':
+                labels, values, rows, truncated = ChartAggregator._bar(dataset[x], y_values, agg, max_points)
+            elif chart_type == 'line':
+                labels, values, rows, truncated = ChartAggregator._line(dataset[x], y_values, agg, max_points)
+            else:
+                x_values = ChartAggregator._numeric(dataset[x], x, 'X-axis')
+                labels, values, counts, rows, truncated = ChartAggregator._scatter(x_values, y_values, max_points)
+                agg = None
+
+        logger.debug(f"Chart {chart_type} of {y} by {x}: {len(labels)} points from {rows} rows")
+        return {
+            'type': chart_type,
+            'x': x,
+            'y': y,
+            'agg': agg,
+            'labels': ChartAggregator._json_values(labels),
+            'values': ChartAggregator._json_values(values),
+            'counts': counts.tolist() if counts is not None else None,
+            'rows': int(rows),
+            'truncated': truncated,
+        }
+
+    @staticmethod
+    def _filtered(dataset, filters):
+        """Rows whose value (as text) is one of the filter values, for every filter column"""
+        unknown = [col for col in filters if col not in dataset.columns]
+        if unknown:
+            raise ValueError(f"Unknown filter columns: {', '.join(unknown)}")
+        mask = np.ones(len(dataset), dtype=bool)
+        for col, values in filters.items():
+            mask &= dataset[col].astype(str).isin(values).to_numpy()
+        return dataset[mask]
+
+    @staticmethod
+    def _name(value, what):
+        if not isinstance(value, str) or not value or len(value) > MAX_SPEC_NAME_LENGTH:
+            raise ValueError(f"{what} must be a name of at most {MAX_SPEC_NAME_LENGTH} characters")
+        return value
+
+    @staticmethod
+    def _numeric(series, name, axis):
+        """Series as numbers; text columns holding numbers are converted"""
+        if pd.api.types.is_numeric_dtype(series):
+            return series
+        values = pd.to_numeric(series, errors='coerce')
+        if values.notna().sum() == 0:
+            raise ValueError(f"{axis} column {name} has no numeric values")
+        return values
+
+    @staticmethod
+    def _bar(x, y, agg, max_points):
+        frame = pd.DataFrame({'x': x, 'y': y}).dropna()
+        groups = frame.groupby('x', observed=True, sort=True)
+        grouped = groups['y'].agg(agg)
+        truncated = len(grouped) > max_points
+        if truncated:
+            # Keep the categories with the most rows, still in category order
+            largest = groups.size().nlargest(max_points).index
+            grouped = grouped[grouped.index.isin(largest)]
+        return grouped.index, grouped.to_numpy(), len(frame), truncated
+
+    @staticmethod
+    def _line(x, y, agg, max_points):
+        frame = pd.DataFrame({'x': x, 'y': y}).dropna()
+        grouped = frame.groupby('x', observed=True, sort=True)['y'].agg(agg)
+        truncated = len(grouped) > max_points
+        if truncated:
+            if ChartAggregator._is_ordered(grouped.index):
+                # Too many x values: LTTB keeps the points that shape the series
+                positions = grouped.index.astype('int64') if pd.api.types.is_datetime64_any_dtype(grouped.index) else grouped.index
+                grouped = grouped.iloc[Downsampler.lttb(positions, grouped.to_numpy(), max_points)]
+            else:
+                grouped = grouped.iloc[:max_points]
+        return grouped.index, grouped.to_numpy(), len(frame), truncated
+
+    @staticmethod
+    def _scatter(x, y, max_points):
+        frame = pd.DataFrame({'x': x, 'y': y}).dropna()
+        # Dense plots are aggregated on a grid; counts weights each point
+        x_values, y_values, counts = Downsampler.scatter_points(frame['x'], frame['y'], max_points)
+        return x_values, y_values, counts, len(frame), len(counts) < len(frame)
+
+    @staticmethod
+    def _histogram(series, bins):
+        values = ChartAggregator._numeric(series, series.name, 'X-axis').dropna()
+        counts, edges = np.histogram(values.to_numpy(dtype='float64'), bins=bins)
+        labels = [f"{edges[i]:.4g} - {edges[i + 1]:.4g}" for i in range(len(counts))]
+        return labels, counts, len(values), False
+
+    @staticmethod
+    def _is_ordered(series):
+        return pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series)
+
+    @staticmethod
+    def _json_values(values):
+        """Plain Python values for JSON (ISO strings for dates)"""
+        if isinstance(values, pd.Index) and pd.api.types.is_datetime64_any_dtype(values):
+            return [value.isoformat() for value in values]
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+        return [value if isinstance(value, (str, int, float, bool)) or value is None else str(value) for value in values]
+
+
+# Chart results share the analysis cache backend under their own key namespace
+chart_cache = AnalysisCache(namespace='chart')
@@ -0,0 +1,119 @@
+"""
+Data Assistant App - Cleaning Engine
+
+Applies missing-value strategies without touching the caller's DataFrame.
+Fill values for every affected column are computed in one vectorized pass
+and applied with a single fillna(dict); only columns that actually have
+missing values are filled, so with pandas copy-on-write the untouched
+columns keep sharing memory with the original. Each result carries a
+report of the cells changed per column, used for the PDF cleaning notes.
+"""
+
+import logging
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CLEANING_METHODS = ('remove_missing', 'fill_mean', 'fill_median', 'fill_mode', 'fill_zero')
+
+# Non-numeric column dtypes treated as text by the fill strategies
+TEXT_DTYPES = ['object', 'category', 'string']
+
+# Fill value of text columns without any value
+UNKNOWN_VALUE = 'Unknown'
+
+# Key of the cleaning report in DataFrame.attrs
+REPORT_ATTR = 'cleaning_report'
+
+
+class CleaningEngine:
+    """Vectorized, non-mutating missing-value cleaning"""
+
+    @staticmethod
+    def clean(dataset, strategy):
+        """Return (cleaned dataset, report) for one strategy.
+
+        If dataset is itself a cleaning result, the report covers every
+        strategy applied so far.
+        """
+        if strategy not in CLEANING_METHODS:
+            raise ValueError(f"Unknown cleaning strategy: {strategy}")
+
+        missing = dataset.isna().sum()
+        if strategy == 'remove_missing':
+            cleaned = dataset.dropna()
+            changed = {}
+            modified_rows = removed_rows = len(dataset) - len(cleaned)
+        else:
+            values = CleaningEngine.fill_values(dataset, strategy, missing[missing > 0].index)
+            cleaned = CleaningEngine._with_fill_categories(dataset, values).fillna(values) if values else dataset.copy()
+            changed = {col: int(missing[col]) for col in values}
+            modified_rows = int(dataset[list(values)].isna().any(axis=1).sum()) if values else 0
+            removed_rows = 0
+
+        report = CleaningEngine._merge(dataset.attrs.get(REPORT_ATTR), {
+            'strategy': strategy,
+            'columns': changed,
+            'filled_values': sum(changed.values()),
+            'modified_rows': modified_rows,
+            'removed_rows': removed_rows,
+            'date': datetime.now().strftime('%d/%m/%Y %H:%M:%S'),
+        })
+        cleaned.attrs[REPORT_ATTR] = report
+        logger.info(f"Applied cleaning strategy {strategy}: {report['filled_values']} cells filled, {removed_rows} rows removed")
+        return cleaned, report
+
+    @staticmethod
+    def fill_values(dataset, strategy, columns=None):
+        """Fill value per column for a fill strategy; columns without a usable value are left out"""
+        columns = dataset.columns if columns is None else columns
+        subset = dataset[list(columns)]
+        numeric = subset.select_dtypes(include=[np.number]).columns
+        text = subset.select_dtypes(include=TEXT_DTYPES).columns
+
+        if strategy == 'fill_zero':
+            values = {col: 0 for col in numeric}
+        elif strategy == 'fill_mean':
+            values = subset[numeric].mean().to_dict()
+        elif strategy == 'fill_median':
+            values = subset[numeric].median().to_dict()
+        elif strategy == 'fill_mode':
+            values = subset[numeric].median().to_dict()
+            # Other non-text columns (dates, timedeltas) use their median as well
+            for col in subset.columns.difference(numeric.union(text), sort=False):
+                values[col] = subset[col].median()
+            if len(text) > 0:
+                modes = subset[text].mode(dropna=True)
+                for col in text:
+                    mode = modes[col].iloc[0] if len(modes) > 0 else np.nan
+                    values[col] = UNKNOWN_VALUE if pd.isna(mode) else mode
+        else:
+            raise ValueError(f"Unknown fill strategy: {strategy}")
+
+        return {col: value for col, value in values.items() if not pd.isna(value)}
+
+    @staticmethod
+    def _with_fill_categories(dataset, values):
+        """Add fill values missing from the categories of categorical columns"""
+        for col, value in values.items():
+            if isinstance(dataset[col].dtype, pd.CategoricalDtype) and value not in dataset[col].cat.categories:
+                dataset = dataset.assign(**{col: dataset[col].cat.add_categories([value])})
+        return dataset
+
+    @staticmethod
+    def _merge(previous, report):
+        if not previous:
+            return report
+        columns = dict(previous['columns'])
+        for col, count in report['columns'].items():
+            columns[col] = columns.get(col, 0) + count
+        return {
+            'strategy': f"{previous['strategy']}+{report['strategy']}",
+            'columns': columns,
+            'filled_values': previous['filled_values'] + report['filled_values'],
+            'modified_rows': previous['modified_rows'] + report['modified_rows'],
+            'removed_rows': previous['removed_rows'] + report['removed_rows'],
+            'date': report['date'],
+        }
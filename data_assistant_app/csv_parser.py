@@ -0,0 +1,194 @@
+"""
+Data Assistant App - CSV Parser Backends
+
+Parses CSV files with the multi-threaded pyarrow reader when it is
+installed and with the pandas C engine otherwise. Both backends produce
+the same DataFrame: the C engine uses round-trip float parsing (pyarrow
+always parses floats exactly), Arrow nulls are converted to the NaN
+markers pandas uses and the Arrow reader gets the header names as pandas
+deduplicates them.
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PARSER_ENGINES = ('auto', 'pyarrow', 'c')
+
+# Missing-value markers of the pandas parsers, applied to the Arrow reader too
+NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# Smallest Arrow block read per batch in streaming mode
+MIN_BLOCK_BYTES = 1024 * 1024
+
+# Arrow types for the dtype names used by CsvSchema
+ARROW_TYPES = {'int64': 'int64', 'uint64': 'uint64', 'float64': 'float64', 'str': 'string'}
+
+
+class CsvParser:
+    """Whole-file and batched CSV reads on the configured engine"""
+
+    @staticmethod
+    def engine(engine=None):
+        """Resolve 'auto' (or settings.CSV_PARSER_ENGINE) to an available engine"""
+        engine = engine or getattr(settings, 'CSV_PARSER_ENGINE', 'auto')
+        if engine not in PARSER_ENGINES:
+            raise ValueError(f"Unknown CSV parser engine: {engine}")
+        if engine == 'auto':
+            return 'pyarrow' if PYARROW_AVAILABLE else 'c'
+        if engine == 'pyarrow' and not PYARROW_AVAILABLE:
+            logger.warning("pyarrow is not installed; using the C parser")
+            return 'c'
+        return engine
+
+    @staticmethod
+    def read(file_path, read_kwargs, engine=None):
+        """Parse a whole CSV file into a DataFrame.
+
+        The engines agree on integer columns only when read_kwargs types
+        them (CsvSchema does): pyarrow alone would read '+1' or integers
+        beyond int64 as floats. Integer values pyarrow rejects (such as
+        '+1') send the file to the C parser.
+        """
+        if CsvParser.engine(engine) == 'pyarrow':
+            try:
+                table = CsvParser._read_arrow_table(file_path, read_kwargs)
+                temporal = CsvParser._temporal_columns(table.schema)
+                if temporal:
+                    table = CsvParser._read_arrow_table(file_path, read_kwargs, temporal)
+                return CsvParser._to_pandas(table)
+            except (ValueError, TypeError, pa.ArrowException) as e:
+                logger.warning(f"pyarrow could not parse {file_path} ({e}); using the C parser")
+        return pd.read_csv(file_path, float_precision='round_trip', **read_kwargs)
+
+    @staticmethod
+    def iter_chunks(file_path, read_kwargs, chunk_size, skip_rows=0, engine=None):
+        """Yield (chunk, bytes_read) pairs of about chunk_size rows, starting after skip_rows data rows.
+
+        Chunk indexes continue the row numbering of the file; bytes_read is
+        the reader's position in the file, for progress reporting.
+        """
+        with open(file_path, 'rb') as source:
+            if CsvParser.engine(engine) == 'pyarrow':
+                yield from CsvParser._iter_arrow_batches(source, read_kwargs, chunk_size, skip_rows)
+                return
+
+            skiprows = range(1, skip_rows + 1) if skip_rows else None
+            reader = pd.read_csv(
+                source, chunksize=chunk_size, skiprows=skiprows, float_precision='round_trip', **read_kwargs
+            )
+            with reader:
+                for chunk in reader:
+                    chunk.index += skip_rows
+                    yield chunk, source.tell()
+
+    @staticmethod
+    def _iter_arrow_batches(source, read_kwargs, chunk_size, skip_rows):
+        read_options = pa_csv.ReadOptions(
+            block_size=CsvParser._block_bytes(source, chunk_size),
+            column_names=CsvParser._column_names(source, read_kwargs),
+            skip_rows=1,
+            skip_rows_after_names=skip_rows,
+        )
+        reader = CsvParser._open_arrow_reader(source, read_kwargs, read_options)
+        temporal = CsvParser._temporal_columns(reader.schema)
+        if temporal:
+            reader.close()
+            source.seek(0)
+            reader = CsvParser._open_arrow_reader(source, read_kwargs, read_options, temporal)
+
+        position = skip_rows
+        with reader:
+            for batch in reader:
+                if batch.num_rows == 0:
+                    continue
+                chunk = CsvParser._to_pandas(batch)
+                chunk.index = pd.RangeIndex(position, position + len(chunk))
+                position += len(chunk)
+                yield chunk, source.tell()
+
+    @staticmethod
+    def _read_arrow_table(file_path, read_kwargs, text_columns=()):
+        with open(file_path, 'rb') as source:
+            column_names = CsvParser._column_names(source, read_kwargs)
+        return pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(use_threads=True, column_names=column_names, skip_rows=1),
+            parse_options=CsvParser._parse_options(read_kwargs),
+            convert_options=CsvParser._convert_options(read_kwargs, text_columns),
+        )
+
+    @staticmethod
+    def _open_arrow_reader(file_path, read_kwargs, read_options, text_columns=()):
+        return pa_csv.open_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=CsvParser._parse_options(read_kwargs),
+            convert_options=CsvParser._convert_options(read_kwargs, text_columns),
+        )
+
+    @staticmethod
+    def _column_names(source, read_kwargs):
+        """Header names as the pandas parsers make them ('Unnamed: N' for blank names, '.1' suffixes for repeats)"""
+        names = pd.read_csv(source, sep=read_kwargs.get('sep', ','), nrows=0).columns
+        source.seek(0)
+        return [str(name) for name in names]
+
+    @staticmethod
+    def _temporal_columns(schema):
+        """Columns Arrow inferred as dates/timestamps (pandas keeps them as text)"""
+        return [field.name for field in schema if pa.types.is_temporal(field.type)]
+
+    @staticmethod
+    def _parse_options(read_kwargs):
+        return pa_csv.ParseOptions(delimiter=read_kwargs.get('sep', ','))
+
+    @staticmethod
+    def _convert_options(read_kwargs, text_columns=()):
+        """Arrow conversion options equivalent to the pandas read_csv keyword arguments"""
+        dtypes = read_kwargs.get('dtype', {})
+        column_types = {col: ARROW_TYPES[dtype] for col, dtype in dtypes.items() if dtype in ARROW_TYPES}
+        column_types.update({col: 'string' for col in text_columns})
+        return pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=read_kwargs.get('usecols'),
+            null_values=NA_VALUES,
+            strings_can_be_null=True,
+            decimal_point=read_kwargs.get('decimal', '.'),
+            true_values=['True', 'TRUE', 'true'],
+            false_values=['False', 'FALSE', 'false'],
+        )
+
+    @staticmethod
+    def _to_pandas(data):
+        chunk = data.to_pandas()
+        # Columns without any value are missing floats for the pandas parsers
+        empty = [field.name for field in data.schema if pa.types.is_null(field.type)]
+        if empty:
+            chunk[empty] = chunk[empty].astype('float64')
+        # Arrow yields None for missing strings; pandas parsers yield NaN
+        object_columns = chunk.select_dtypes(include=['object']).columns
+        if len(object_columns) > 0:
+            chunk[object_columns] = chunk[object_columns].fillna(np.nan)
+        return chunk
+
+    @staticmethod
+    def _block_bytes(source, chunk_size):
+        """Arrow block size holding about chunk_size rows, estimated from the head"""
+        head = source.read(MIN_BLOCK_BYTES)
+        source.seek(0)
+        lines = max(head.count(b'\n'), 1)
+        return max(int(len(head) / lines * chunk_size), MIN_BLOCK_BYTES)
@@ -3,29 +3,115 @@ import numpy as np
 import os
 from django.conf import settings
 import logging
+from .dataset_cache import dataset_cache
+from .sidecar import ColumnarSidecar
+from .schema import CsvSchema
+from .csv_parser import CsvParser
+from .excel_reader import ExcelReader
+from .memory_optimizer import MemoryOptimizer, DEFAULT_CATEGORY_MAX_RATIO
+from .numeric_stats import numeric_block, stats_to_dict
+from .sketches import DEFAULT_SKETCH_EPSILON
+from .parallel import analysis_executor
+from .lazy import LazyDataset
+from .cleaning import CleaningEngine, TEXT_DTYPES
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of incomplete rows materialized as examples in the analysis
+MAX_MISSING_ROW_EXAMPLES = 50
+
+# Most frequent values reported per categorical column
+DEFAULT_CATEGORICAL_TOP_K = 20
+
+# Rows per slice fed to categorical sketches, bounding their working memory
+CATEGORICAL_SLICE_ROWS = 65536
+
+# Supported ways of computing q1/median/q3
+QUANTILE_METHODS = ('exact', 'approx')
+
+# Rows per chunk when a CSV is parsed with progress reporting
+PROGRESS_CHUNK_ROWS = 10000
+
+
 class DataLoader:
     """Handles data loading and cleaning operations"""
     
     @staticmethod
-    def load_dataset(file_path):
-        """Load dataset based on file extension"""
+    def load_dataset(file_path, use_sidecar=True, progress_callback=None, optimize_memory=None):
+        """Load dataset based on file extension, preferring a fresh columnar sidecar.
+
+        With a progress_callback, CSV files are parsed in chunks and the
+        callback receives (processed_rows, bytes_read, total_bytes) after
+        each chunk.
+        optimize_memory (default: settings.DATASET_OPTIMIZE_MEMORY) narrows
+        dtypes after parsing; the before/after memory report is stored in
+        dataset.attrs['memory_optimization'].
+        """
         try:
-            if file_path.endswith('.csv'):
-                return pd.read_csv(file_path)
-            elif file_path.endswith('.xlsx'):
-                return pd.read_excel(file_path)
-            else:
-                raise ValueError("Unsupported file format")
+            dataset = DataLoader._parse_dataset(file_path, use_sidecar, progress_callback)
+            
+            if optimize_memory is None:
+                optimize_memory = getattr(settings, 'DATASET_OPTIMIZE_MEMORY', False)
+            if optimize_memory:
+                dataset, report = MemoryOptimizer.optimize(
+                    dataset,
+                    category_max_ratio=getattr(settings, 'DATASET_CATEGORY_MAX_RATIO', DEFAULT_CATEGORY_MAX_RATIO)
+                )
+                dataset.attrs['memory_optimization'] = report
+            return dataset
         except Exception as e:
             logger.error(f"Failed to load dataset from {file_path}: {e}")
             raise
     
     @staticmethod
-    def analyze_dataset(dataset):
-        """Generate comprehensive dataset analysis"""
+    def _parse_dataset(file_path, use_sidecar, progress_callback):
+        if use_sidecar:
+            dataset = ColumnarSidecar.read(file_path)
+            if dataset is not None:
+                return dataset
+        
+        if file_path.endswith('.csv'):
+            if progress_callback is not None:
+                return DataLoader._read_csv_with_progress(file_path, progress_callback)
+            return DataLoader._read_csv(file_path)
+        elif file_path.endswith('.xlsx'):
+            if progress_callback is not None:
+                chunks = ExcelReader.iter_chunks(file_path, PROGRESS_CHUNK_ROWS, progress_callback=progress_callback)
+                return pd.concat(chunks, ignore_index=True).infer_objects()
+            return ExcelReader.read(file_path)
+        else:
+            raise ValueError("Unsupported file format")
+    
+    @staticmethod
+    def get_dataset(file_path, progress_callback=None):
+        """Load dataset through the shared parsed-dataset cache.
+
+        The returned DataFrame is shared between requests and must not be
+        mutated in place; copy it before applying cleaning strategies.
+        """
+        if progress_callback is None:
+            return dataset_cache.get_or_load(file_path, DataLoader.load_dataset)
+        return dataset_cache.get_or_load(
+            file_path, lambda path: DataLoader.load_dataset(path, progress_callback=progress_callback)
+        )
+    
+    @staticmethod
+    def analyze_dataset(dataset, max_missing_examples=MAX_MISSING_ROW_EXAMPLES, quantiles='exact', epsilon=None):
+        """Generate comprehensive dataset analysis.
+
+        quantiles='approx' estimates q1/median/q3 with mergeable quantile
+        sketches of rank error epsilon instead of exact sorting.
+        """
+        if quantiles not in QUANTILE_METHODS:
+            raise ValueError(f"Unknown quantile method: {quantiles}")
+        epsilon = epsilon or getattr(settings, 'QUANTILE_SKETCH_EPSILON', DEFAULT_SKETCH_EPSILON)
+        
+        null_mask = dataset.isnull()
+        missing_by_column = null_mask.sum()
+        rows_with_missing, incomplete_rows = DataLoader._summarize_missing_rows(
+            dataset, null_mask, max_missing_examples
+        )
+        
         analysis = {
             'summary': {
                 'rows': dataset.shape[0],
@@ -33,109 +119,206 @@ class DataLoader:
                 'data_types': dataset.dtypes.astype(str).to_dict()
             },
             'missing_values': {
-                'total': int(dataset.isnull().sum().sum()),
-                'by_column': dataset.isnull().sum().to_dict()
+                'total': int(missing_by_column.sum()),
+                'by_column': missing_by_column.to_dict(),
+                'incomplete_rows': incomplete_rows
             },
-            'rows_with_missing': [],
+            'rows_with_missing': rows_with_missing,
             'numeric_stats': {},
-            'categorical_freqs': {}
+            'categorical_freqs': {},
+            'categorical_distinct': {}
         }
         
-        # Find rows with missing values
-        for idx, row in dataset.iterrows():
-            if row.isnull().any():
-                analysis['rows_with_missing'].append({
-                    'index': idx,
-                    'missing_columns': row[row.isnull()].index.tolist(),
-                    'available_data': row.dropna().to_dict()
-                })
-        
-        # Numeric statistics
-        for col in dataset.select_dtypes(include=[np.number]).columns:
-            analysis['numeric_stats'][col] = {
-                'mean': float(dataset[col].mean()),
-                'median': float(dataset[col].median()),
-                'std': float(dataset[col].std()),
-                'min': float(dataset[col].min()),
-                'max': float(dataset[col].max()),
-                'q1': float(dataset[col].quantile(0.25)),
-                'q3': float(dataset[col].quantile(0.75)),
-            }
+        # Numeric statistics (fused kernel over the numeric block, sharded across workers for large frames)
+        numeric_columns, block = numeric_block(dataset)
+        stats, rank_error = analysis_executor.numeric_stats(block, quantiles=quantiles, epsilon=epsilon)
+        analysis['numeric_stats'] = stats_to_dict(numeric_columns, stats)
+        analysis['quantiles'] = {'method': quantiles, 'rank_error': rank_error}
         
-        # Categorical frequencies
-        for col in dataset.select_dtypes(include=['object', 'category']).columns:
-            analysis['categorical_freqs'][col] = dataset[col].value_counts().to_dict()
+        # Categorical frequencies (bounded top-k and distinct count per column)
+        top_k = getattr(settings, 'CATEGORICAL_TOP_K', DEFAULT_CATEGORICAL_TOP_K)
+        categorical_columns = list(dataset.select_dtypes(include=TEXT_DTYPES).columns)
+        sketches = analysis_executor.categorical_sketches(dataset, categorical_columns, CATEGORICAL_SLICE_ROWS)
+        for col in categorical_columns:
+            analysis['categorical_freqs'][col] = sketches[col].top(top_k)
+            analysis['categorical_distinct'][col] = sketches[col].distinct_count()
         
         return analysis
     
+    @staticmethod
+    def _summarize_missing_rows(dataset, null_mask, max_examples):
+        """Return (example rows with missing values, total incomplete rows) from a null mask"""
+        mask = null_mask.to_numpy()
+        row_has_missing = mask.any(axis=1)
+        incomplete_rows = int(row_has_missing.sum())
+        
+        # Only the capped example rows are materialized as Python objects
+        positions = np.flatnonzero(row_has_missing)[:max_examples]
+        examples = dataset.iloc[positions]
+        example_mask = mask[positions]
+        columns = dataset.columns
+        
+        rows_with_missing = []
+        for label, values, missing in zip(examples.index, examples.itertuples(index=False, name=None), example_mask):
+            rows_with_missing.append({
+                'index': label,
+                'missing_columns': columns[missing].tolist(),
+                'available_data': {col: value for col, value, is_missing in zip(columns, values, missing) if not is_missing}
+            })
+        
+        return rows_with_missing, incomplete_rows
+    
     @staticmethod
     def clean_dataset(dataset, strategy):
-        """Apply data cleaning strategy"""
+        """Apply data cleaning strategy.
+
+        The given dataset is not modified. The report of changed cells per
+        column is stored in cleaned.attrs['cleaning_report'].
+        """
         try:
-            if strategy == 'remove_missing':
-                return dataset.dropna()
-            elif strategy == 'fill_mean':
-                for col in dataset.select_dtypes(include=[np.number]).columns:
-                    dataset[col] = dataset[col].fillna(dataset[col].mean())
-            elif strategy == 'fill_median':
-                for col in dataset.select_dtypes(include=[np.number]).columns:
-                    dataset[col] = dataset[col].fillna(dataset[col].median())
-            elif strategy == 'fill_mode':
-                for col in dataset.columns:
-                    if dataset[col].dtype == 'object':
-                        mode_value = dataset[col].mode()[0] if len(dataset[col].mode()) > 0 else 'Unknown'
-                        dataset[col] = dataset[col].fillna(mode_value)
-                    else:
-                        dataset[col] = dataset[col].fillna(dataset[col].median())
-            elif strategy == 'fill_zero':
-                for col in dataset.select_dtypes(include=[np.number]).columns:
-                    dataset[col] = dataset[col].fillna(0)
-            
-            logger.info(f"Applied cleaning strategy: {strategy}")
-            return dataset
+            cleaned, _ = CleaningEngine.clean(dataset, strategy)
+            return cleaned
             
         except Exception as e:
             logger.error(f"Error applying cleaning strategy {strategy}: {e}")
             raise 
     
     @staticmethod
-    def load_large_dataset(file_path, chunk_size=10000):
-        """Load large dataset using chunking to avoid memory issues"""
+    def analyze_large_dataset(file_path, chunk_size=10000, max_missing_examples=MAX_MISSING_ROW_EXAMPLES, epsilon=None):
+        """Analyze a dataset chunk by chunk without holding it in memory (quantiles are approximate)"""
         try:
-            logger.info(f"Loading large dataset: {file_path}")
+            logger.info(f"Streaming analysis of: {file_path}")
+            analyzer_options = {
+                'max_missing_examples': max_missing_examples,
+                'sketch_epsilon': epsilon or getattr(settings, 'QUANTILE_SKETCH_EPSILON', DEFAULT_SKETCH_EPSILON),
+                'top_k': getattr(settings, 'CATEGORICAL_TOP_K', DEFAULT_CATEGORICAL_TOP_K),
+            }
+            
+            # Row chunks are analyzed by the worker pool and merged in order
+            lazy_dataset = DataLoader.load_large_dataset(file_path, chunk_size)
+            analysis = lazy_dataset.analyze(analyzer_options)
+            logger.info(f"Streaming analysis complete: {lazy_dataset.rows_read} rows processed")
+            return analysis
             
-            # Determine file type
-            if file_path.endswith('.csv'):
-                # Count total rows for progress tracking
-                total_rows = sum(1 for _ in open(file_path)) - 1  # -1 for header
-                logger.info(f"Total rows to process: {total_rows}")
-                
-                # Process in chunks
-                chunks = []
-                processed_rows = 0
-                
-                for chunk in pd.read_csv(file_path, chunksize=chunk_size):
-                    processed_rows += len(chunk)
-                    progress = (processed_rows / total_rows) * 100 if total_rows > 0 else 0
-                    
-                    logger.info(f"Processing chunk: {progress:.1f}% complete ({processed_rows}/{total_rows} rows)")
-                    
-                    # Basic cleaning per chunk
-                    chunk_cleaned = chunk.dropna()
-                    chunks.append(chunk_cleaned)
-                
-                # Combine all chunks
-                final_dataset = pd.concat(chunks, ignore_index=True)
-                logger.info(f"Large dataset loaded successfully: {len(final_dataset)} rows")
-                
-                return final_dataset
-                
-            elif file_path.endswith('.xlsx'):
-                # For Excel files, load normally but with memory optimization
-                return pd.read_excel(file_path, engine='openpyxl')
-            else:
-                raise ValueError("Unsupported file format for large dataset")
-                
         except Exception as e:
-            logger.error(f"Failed to load large dataset from {file_path}: {e}")
-            raise 
\ No newline at end of file
+            logger.error(f"Failed streaming analysis of {file_path}: {e}")
+            raise
+    
+    @staticmethod
+    def load_large_dataset(file_path, chunk_size=10000, sheet_name=None):
+        """Return a LazyDataset over a large file.
+
+        Nothing is read here: cleaning steps (dropna, fillna, select,
+        filter) are chained on the handle and run chunk by chunk when a
+        consumer iterates it, analyzes it, exports it or collects it.
+        sheet_name selects the worksheet of XLSX files (default: the first).
+        """
+        if not file_path.endswith(('.csv', '.xlsx')):
+            raise ValueError("Unsupported file format for large dataset")
+        logger.info(f"Opening large dataset lazily: {file_path}")
+        return LazyDataset(
+            lambda progress_callback=None: DataLoader.iter_chunks(file_path, chunk_size, progress_callback, sheet_name)
+        )
+    
+    @staticmethod
+    def iter_chunks(file_path, chunk_size=10000, progress_callback=None, sheet_name=None):
+        """Yield the rows of a data file as DataFrame chunks"""
+        if file_path.endswith('.csv'):
+            yield from DataLoader._read_csv_chunks(file_path, chunk_size, progress_callback)
+        elif file_path.endswith('.xlsx'):
+            yield from ExcelReader.iter_chunks(file_path, chunk_size, sheet_name, progress_callback)
+        else:
+            raise ValueError("Unsupported file format for chunked reading")
+    
+    @staticmethod
+    def _read_csv(file_path):
+        """Parse a whole CSV with its inferred schema, falling back to pandas inference"""
+        schema = CsvSchema.for_file(file_path)
+        try:
+            return CsvParser.read(file_path, schema.read_kwargs())
+        except (ValueError, TypeError, OverflowError) as e:
+            return DataLoader._read_csv_untyped(file_path, schema, e)
+    
+    @staticmethod
+    def _read_csv_with_progress(file_path, progress_callback):
+        """Parse a whole CSV in chunks for progress reporting; same frame as _read_csv"""
+        schema = CsvSchema.for_file(file_path)
+        try:
+            chunks = list(DataLoader._read_csv_chunks(file_path, PROGRESS_CHUNK_ROWS, progress_callback, schema, resume_untyped=False))
+        except (ValueError, TypeError, OverflowError) as e:
+            # Chunks parsed with inferred types would not concatenate to the frame _read_csv returns
+            dataset = DataLoader._read_csv_untyped(file_path, schema, e)
+            total_bytes = os.stat(file_path).st_size
+            progress_callback(len(dataset), total_bytes, total_bytes)
+            return dataset
+        return pd.concat(chunks, ignore_index=True)
+    
+    @staticmethod
+    def _read_csv_untyped(file_path, schema, error):
+        """Parse a whole CSV with pandas type inference after its schema failed with error"""
+        untyped = schema.drop_types()
+        if untyped is None:
+            raise error
+        logger.warning(f"Inferred schema does not fit {file_path} ({error}); parsing with type inference")
+        # Untyped integer columns are only parsed as pandas does by the C parser
+        return CsvParser.read(file_path, untyped.read_kwargs(), engine='c')
+    
+    @staticmethod
+    def _read_csv_chunks(file_path, chunk_size, progress_callback=None, schema=None, resume_untyped=True):
+        """Yield CSV chunks, logging and reporting (processed_rows, bytes_read, total_bytes) progress.
+
+        Progress comes from the reader's position in the file, so the file
+        is read only once. Chunks are parsed with the file's inferred schema
+        (or schema) so every chunk has the same dtypes. If a chunk
+        contradicts the schema, reading resumes at that chunk on the C
+        engine, then with type inference; resumed chunks are cast to the
+        dtypes of the chunks already yielded where their values allow.
+        With resume_untyped=False the error is raised instead, so the
+        caller can parse the file again from the first row.
+        """
+        total_bytes = os.stat(file_path).st_size
+        schema = schema or CsvSchema.for_file(file_path)
+        engine = CsvParser.engine()
+        processed_rows = 0
+        bytes_read = 0
+        dtypes = None
+        resumed = False
+        while True:
+            try:
+                chunks = CsvParser.iter_chunks(file_path, schema.read_kwargs(), chunk_size, processed_rows, engine)
+                for chunk, position in chunks:
+                    if dtypes is None:
+                        dtypes = chunk.dtypes
+                    elif resumed:
+                        chunk = DataLoader._match_dtypes(chunk, dtypes)
+                    processed_rows += len(chunk)
+                    # A resumed read starts again at byte 0; progress never goes back
+                    bytes_read = max(bytes_read, position)
+                    progress = (bytes_read / total_bytes) * 100 if total_bytes > 0 else 100
+                    logger.info(f"Processing chunk: {progress:.1f}% complete ({processed_rows} rows, {bytes_read}/{total_bytes} bytes)")
+                    if progress_callback is not None:
+                        progress_callback(processed_rows, bytes_read, total_bytes)
+                    yield chunk
+                return
+            except (ValueError, TypeError, OverflowError) as e:
+                untyped = schema.drop_types() if resume_untyped else None
+                if engine != 'c':
+                    logger.warning(f"pyarrow could not parse {file_path} ({e}); resuming at row {processed_rows} with the C parser")
+                    engine = 'c'
+                elif untyped is not None:
+                    logger.warning(f"Inferred schema does not fit {file_path} ({e}); resuming at row {processed_rows} with type inference")
+                    schema = untyped
+                    resumed = True
+                else:
+                    raise
+    
+    @staticmethod
+    def _match_dtypes(chunk, dtypes):
+        """Cast the columns of a chunk to dtypes where every value fits"""
+        for col, dtype in dtypes.items():
+            if col in chunk.columns and chunk[col].dtype != dtype:
+                try:
+                    chunk[col] = chunk[col].astype(dtype)
+                except (ValueError, TypeError, OverflowError):
+                    pass
+        return chunk
@@ -0,0 +1,141 @@
+"""
+Data Assistant App - Parsed Dataset Cache
+
+Process-wide LRU cache of parsed DataFrames so repeated actions on the same
+upload do not re-read and re-parse the file from disk.
+"""
+
+import os
+import threading
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Default memory budget when DATASET_CACHE_MAX_BYTES is not configured
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def file_fingerprint(file_path):
+    """Return a (path, mtime, size) key identifying one version of a file"""
+    stat = os.stat(file_path)
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+class DatasetCache:
+    """LRU cache of parsed datasets bounded by total DataFrame memory"""
+
+    def __init__(self, max_bytes=None):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        # Futures of the files being parsed, so concurrent misses share one parse
+        self._loading = {}
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self):
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return getattr(settings, 'DATASET_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES)
+
+    def get_or_load(self, file_path, loader):
+        """Return the cached dataset for file_path, parsing it with loader on a miss.
+
+        Concurrent misses on the same file version wait for the first
+        parse instead of parsing the file again.
+        """
+        key = file_fingerprint(file_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            loading = self._loading.get(key)
+            waiting = loading is not None
+            if waiting:
+                self.hits += 1
+            else:
+                loading = self._loading[key] = Future()
+                self.misses += 1
+
+        if waiting:
+            return loading.result()
+
+        try:
+            # Parse outside the lock so other files stay available meanwhile
+            dataset = loader(file_path)
+            size = int(dataset.memory_usage(deep=True).sum())
+
+            with self._lock:
+                self._discard_stale_versions(key)
+                if key in self._entries:
+                    self._remove(key)
+                if size <= self.max_bytes:
+                    self._entries[key] = (dataset, size)
+                    self.current_bytes += size
+                    self._evict_to_budget()
+                else:
+                    logger.info(f"Dataset {key[0]} ({size} bytes) exceeds cache budget, not cached")
+        except BaseException as e:
+            loading.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+
+        loading.set_result(dataset)
+        return dataset
+
+    def invalidate(self, file_path):
+        """Drop every cached version of file_path"""
+        path = os.path.abspath(file_path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                self._remove(key)
+
+    def clear(self):
+        """Drop all cached datasets"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """Return cache counters for monitoring"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def _discard_stale_versions(self, key):
+        """Remove older versions of the same path (file was overwritten)"""
+        for stale_key in [k for k in self._entries if k[0] == key[0] and k != key]:
+            self._remove(stale_key)
+
+    def _evict_to_budget(self):
+        """Evict least recently used datasets until under the memory budget"""
+        while self.current_bytes > self.max_bytes and self._entries:
+            key, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+            logger.info(f"Evicted cached dataset {key[0]} ({size} bytes)")
+
+    def _remove(self, key):
+        _, size = self._entries.pop(key)
+        self.current_bytes -= size
+
+
+# Shared cache instance for the whole process
+dataset_cache = DatasetCache()
@@ -0,0 +1,119 @@
+"""
+Data Assistant App - Chart Downsampling
+
+Level-of-detail reduction shared by the chart API, the PDF renderer and
+the Streamlit app, so the points drawn stay bounded however many rows the
+dataset has. Line series use Largest-Triangle-Three-Buckets (LTTB), which
+keeps the peaks and troughs that give a series its visual shape; dense
+scatter plots are aggregated on a regular grid, one weighted point (the
+centroid of its points) per occupied cell. Only numpy is required, so the
+module can be imported outside Django.
+"""
+
+import math
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Points drawn for one series when the caller sets no limit
+DEFAULT_MAX_POINTS = 1000
+
+
+class Downsampler:
+    """LTTB and grid aggregation over numeric x/y arrays"""
+
+    @staticmethod
+    def lttb(x, y, threshold):
+        """Indices of the threshold points LTTB keeps from a series sorted by x.
+
+        The first and last points are always kept; x and y must not
+        contain missing values. All indices are returned when the series
+        already has threshold points or fewer.
+        """
+        x = np.asarray(x, dtype='float64')
+        y = np.asarray(y, dtype='float64')
+        n = len(x)
+        if threshold >= n or threshold < 3:
+            return np.arange(n)
+
+        indices = np.empty(threshold, dtype=np.int64)
+        indices[0], indices[-1] = 0, n - 1
+        # The points between the first and last are split into threshold - 2 buckets
+        every = (n - 2) / (threshold - 2)
+        selected = 0
+        for bucket in range(threshold - 2):
+            start = int(bucket * every) + 1
+            end = int((bucket + 1) * every) + 1
+            next_end = min(int((bucket + 2) * every) + 1, n)
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+            # Keep the point forming the largest triangle with the last kept point and the next bucket's average
+            areas = np.abs(
+                (x[selected] - avg_x) * (y[start:end] - y[selected])
+                - (x[selected] - x[start:end]) * (avg_y - y[selected])
+            )
+            selected = start + int(np.argmax(areas))
+            indices[bucket + 1] = selected
+        return indices
+
+    @staticmethod
+    def grid(x, y, size):
+        """Aggregate points on a size x size grid; return (x, y, counts) of the occupied cells.
+
+        Each cell is represented by the centroid of its points, weighted
+        by counts. x and y must not contain missing values.
+        """
+        x = np.asarray(x, dtype='float64')
+        y = np.asarray(y, dtype='float64')
+        if len(x) == 0:
+            return x, y, np.zeros(0, dtype=np.int64)
+
+        cells = Downsampler._cell(x, size) * size + Downsampler._cell(y, size)
+        counts = np.bincount(cells, minlength=size * size)
+        occupied = counts > 0
+        counts = counts[occupied]
+        sum_x = np.bincount(cells, weights=x, minlength=size * size)[occupied]
+        sum_y = np.bincount(cells, weights=y, minlength=size * size)[occupied]
+        return sum_x / counts, sum_y / counts, counts
+
+    @staticmethod
+    def line_points(x, y, max_points=DEFAULT_MAX_POINTS):
+        """(x, y) of a series sorted by x, reduced with LTTB to at most max_points"""
+        x, y = Downsampler._finite(x, y)
+        order = np.argsort(x, kind='stable')
+        x, y = x[order], y[order]
+        if len(x) > max_points:
+            keep = Downsampler.lttb(x, y, max_points)
+            logger.debug(f"LTTB kept {len(keep)} of {len(x)} line points")
+            x, y = x[keep], y[keep]
+        return x, y
+
+    @staticmethod
+    def scatter_points(x, y, max_points=DEFAULT_MAX_POINTS):
+        """(x, y, counts) of a scatter plot with at most max_points points.
+
+        Below the limit every point is returned with a count of 1;
+        otherwise the points are aggregated on the largest square grid
+        with no more than max_points cells.
+        """
+        x, y = Downsampler._finite(x, y)
+        if len(x) <= max_points:
+            return x, y, np.ones(len(x), dtype=np.int64)
+        size = max(int(math.sqrt(max_points)), 1)
+        grid_x, grid_y, counts = Downsampler.grid(x, y, size)
+        logger.debug(f"Grid aggregation reduced {len(x)} scatter points to {len(counts)} cells")
+        return grid_x, grid_y, counts
+
+    @staticmethod
+    def _finite(x, y):
+        x = np.asarray(x, dtype='float64')
+        y = np.asarray(y, dtype='float64')
+        keep = np.isfinite(x) & np.isfinite(y)
+        return x[keep], y[keep]
+
+    @staticmethod
+    def _cell(values, size):
+        low, high = values.min(), values.max()
+        span = high - low if high > low else 1.0
+        return np.clip(((values - low) / span * size).astype(np.int64), 0, size - 1)
@@ -0,0 +1,166 @@
+"""
+Data Assistant App - Streaming Excel Reader
+
+Reads XLSX workbooks with openpyxl in read-only mode, which streams the
+sheet XML row by row instead of building the cell tree of the whole
+workbook, and turns the rows into bounded DataFrame chunks. The chunks
+feed the same consumers as CSV chunks (streaming analysis, lazy
+cleaning, exports).
+"""
+
+import os
+import logging
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+logger = logging.getLogger(__name__)
+
+# Rows per chunk when a whole workbook is loaded through the streaming reader
+DEFAULT_EXCEL_CHUNK_ROWS = 10000
+
+
+class ExcelReader:
+    """Chunked read-only access to the sheets of an XLSX workbook"""
+
+    @staticmethod
+    def sheet_names(file_path):
+        """Names of the sheets in the workbook, in workbook order"""
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            return workbook.sheetnames
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def read(file_path, sheet_name=None, chunk_size=DEFAULT_EXCEL_CHUNK_ROWS):
+        """Read one sheet into a DataFrame without loading the workbook in normal mode"""
+        chunks = list(ExcelReader.iter_chunks(file_path, chunk_size, sheet_name))
+        if not chunks:
+            return pd.DataFrame()
+        # Booleans with blanks in some chunks are floats there, as in pd.read_excel
+        mixed = [
+            col for col in chunks[0].columns
+            if {str(chunk[col].dtype) for chunk in chunks} == {'bool', 'float64'}
+        ]
+        if mixed:
+            chunks = [chunk.astype({col: 'float64' for col in mixed}) for chunk in chunks]
+        # A column's dtype may differ between chunks (e.g. ints next to all-missing rows)
+        return pd.concat(chunks).infer_objects()
+
+    @staticmethod
+    def iter_chunks(file_path, chunk_size, sheet_name=None, progress_callback=None):
+        """Yield DataFrame chunks of about chunk_size rows from one sheet (default: the first).
+
+        The first row holds the column names, as in pd.read_excel; blank rows
+        are NaN rows except at the end of the sheet, and cells right of the
+        header get Unnamed: N columns (from the chunk where they first
+        appear, when the sheet declares no dimensions). progress_callback receives
+        (processed_rows, bytes_read, total_bytes) where bytes_read is
+        estimated from the rows read and the sheet's declared dimensions,
+        because the compressed XML stream has no usable file position.
+        """
+        total_bytes = os.stat(file_path).st_size
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = ExcelReader._sheet(workbook, sheet_name)
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = ExcelReader._column_names(header)
+            total_rows = sheet.max_row - 1 if sheet.max_row else None
+
+            buffer = []
+            blank_rows = 0
+            processed_rows = 0
+            for row in rows:
+                width = ExcelReader._row_width(row)
+                if width == 0:
+                    # Blank rows are NaN rows unless nothing follows them
+                    blank_rows += 1
+                    continue
+                if width > len(columns):
+                    columns = ExcelReader._column_names(header, width)
+                buffer.extend([()] * blank_rows)
+                blank_rows = 0
+                buffer.append(row[:width])
+                if len(buffer) >= chunk_size:
+                    chunk = ExcelReader._to_frame(buffer, columns, processed_rows)
+                    processed_rows += len(chunk)
+                    buffer = []
+                    ExcelReader._report(processed_rows, total_rows, total_bytes, progress_callback)
+                    yield chunk
+            if buffer:
+                chunk = ExcelReader._to_frame(buffer, columns, processed_rows)
+                processed_rows += len(chunk)
+                ExcelReader._report(processed_rows, None, total_bytes, progress_callback)
+                yield chunk
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _sheet(workbook, sheet_name):
+        if sheet_name is None:
+            return workbook.worksheets[0]
+        if isinstance(sheet_name, int):
+            return workbook.worksheets[sheet_name]
+        if sheet_name not in workbook.sheetnames:
+            raise ValueError(f"Worksheet {sheet_name} not found")
+        return workbook[sheet_name]
+
+    @staticmethod
+    def _row_width(row):
+        """Number of cells up to the last one with a value"""
+        width = len(row)
+        while width and row[width - 1] is None:
+            width -= 1
+        return width
+
+    @staticmethod
+    def _column_names(header, width=0):
+        """Header names with pandas' placeholders for blank and duplicate names, for at least width columns"""
+        header = tuple(header[:ExcelReader._row_width(header)])
+        header += (None,) * (width - len(header))
+        columns, seen = [], {}
+        for index, name in enumerate(header):
+            name = f"Unnamed: {index}" if name is None else name
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            columns.append(name)
+        return columns
+
+    @staticmethod
+    def _to_frame(rows, columns, start):
+        rows = [tuple(row) + (None,) * (len(columns) - len(row)) for row in rows]
+        chunk = pd.DataFrame(rows, columns=columns, index=pd.RangeIndex(start, start + len(rows)))
+        object_columns = chunk.select_dtypes(include=['object']).columns
+        # Columns with no values in this chunk are read as missing floats, as pandas parsers do
+        empty = [col for col in object_columns if chunk[col].isnull().all()]
+        if empty:
+            chunk[empty] = chunk[empty].astype('float64')
+        # Booleans with blanks are read by pd.read_excel as 1.0/0.0/NaN
+        booleans = [
+            col for col in object_columns.difference(empty, sort=False)
+            if chunk[col].dropna().map(type).eq(bool).all()
+        ]
+        if booleans:
+            chunk[booleans] = chunk[booleans].astype('float64')
+        # openpyxl yields None for empty cells; pandas parsers yield NaN
+        text = object_columns.difference(empty + booleans, sort=False)
+        if len(text) > 0:
+            chunk[text] = chunk[text].fillna(np.nan)
+        return chunk
+
+    @staticmethod
+    def _report(processed_rows, total_rows, total_bytes, progress_callback):
+        if total_rows:
+            bytes_read = int(total_bytes * min(processed_rows / total_rows, 1.0))
+        else:
+            bytes_read = total_bytes
+        logger.info(f"Processing sheet chunk: {processed_rows} rows ({bytes_read}/{total_bytes} bytes)")
+        if progress_callback is not None:
+            progress_callback(processed_rows, bytes_read, total_bytes)
@@ -0,0 +1,152 @@
+"""
+Data Assistant App - Background Jobs
+
+In-process job queue for work that is too slow to run inside an HTTP
+request (parsing and analyzing uploads). Jobs run on a thread pool and
+report their stage and progress (rows parsed, bytes read), which clients
+poll through /api/jobs/<id>/. No external broker is needed; job state
+lives in the memory of the server process.
+"""
+
+import time
+import uuid
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Default number of jobs processed concurrently
+DEFAULT_JOB_WORKERS = 2
+
+# Finished jobs are forgotten after this many seconds
+DEFAULT_JOB_TTL_SECONDS = 3600
+
+# Job states
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class Job:
+    """State of one background job, updated by the worker running it"""
+
+    def __init__(self, kind):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = PENDING
+        self.stage = 'queued'
+        self.processed_rows = 0
+        self.bytes_read = 0
+        self.total_bytes = None
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+
+    @property
+    def progress(self):
+        """Percentage of the file consumed in the current stage, if known"""
+        if not self.total_bytes:
+            return None
+        return round(min(self.bytes_read / self.total_bytes, 1.0) * 100, 1)
+
+    def set_stage(self, stage):
+        self.stage = stage
+        self.processed_rows = 0
+        self.bytes_read = 0
+        self.total_bytes = None
+        logger.info(f"Job {self.id} ({self.kind}): {stage}")
+
+    def report_progress(self, processed_rows, bytes_read, total_bytes):
+        """Progress callback in the (processed_rows, bytes_read, total_bytes) form used by DataLoader"""
+        self.processed_rows = processed_rows
+        self.bytes_read = bytes_read
+        self.total_bytes = total_bytes
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'stage': self.stage,
+            'processed_rows': self.processed_rows,
+            'bytes_read': self.bytes_read,
+            'total_bytes': self.total_bytes,
+            'progress': self.progress,
+            'result': self.result,
+            'error': self.error,
+        }
+
+
+class JobQueue:
+    """Thread-pool job runner with an in-memory registry of jobs"""
+
+    def __init__(self, workers=None, ttl_seconds=None):
+        self._workers = workers
+        self._ttl_seconds = ttl_seconds
+        self._jobs = {}
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def workers(self):
+        if self._workers is not None:
+            return self._workers
+        return getattr(settings, 'JOB_WORKERS', DEFAULT_JOB_WORKERS)
+
+    @property
+    def ttl_seconds(self):
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return getattr(settings, 'JOB_TTL_SECONDS', DEFAULT_JOB_TTL_SECONDS)
+
+    def submit(self, kind, func, *args, **kwargs):
+        """Queue func(job, *args, **kwargs); its return value becomes the job result"""
+        job = Job(kind)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='synapse-job')
+            self._pool.submit(self._run, job, func, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        """Return the job with this id, or None if unknown or expired"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
+
+    def _run(self, job, func, args, kwargs):
+        job.status = RUNNING
+        try:
+            job.result = func(job, *args, **kwargs)
+            job.status = DONE
+            job.stage = 'done'
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed in stage {job.stage}: {e}")
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+
+    def _prune(self):
+        cutoff = time.time() - self.ttl_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# Shared job queue for the whole process
+job_queue = JobQueue()
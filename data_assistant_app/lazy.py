@@ -0,0 +1,195 @@
+"""
+Data Assistant App - Lazy Datasets
+
+A LazyDataset is a handle on a chunked data source plus a chain of
+transformations (missing-value cleaning, column selection, row filters).
+Nothing is read until a consumer (analysis, export, preview) pulls
+chunks through it, so cleaning, analysis and export can stream over files
+that never fit in memory as a whole.
+"""
+
+import logging
+import pandas as pd
+from .parallel import analysis_executor
+from .streaming import StreamingAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Fill strategies of DataLoader.clean_dataset that need column statistics
+FILL_STRATEGIES = ('fill_mean', 'fill_median', 'fill_mode', 'fill_zero')
+
+# Rank error of the sketch that estimates medians for fill values
+FILL_SKETCH_EPSILON = 0.001
+
+
+class LazyDataset:
+    """Chunked data source with deferred transformations.
+
+    Every transformation returns a new LazyDataset; the original is left
+    unchanged. source(progress_callback) must return a fresh iterator of
+    DataFrame chunks each time it is called.
+    """
+
+    def __init__(self, source, steps=()):
+        self._source = source
+        self._steps = tuple(steps)
+        self.rows_read = 0
+
+    def dropna(self, subset=None):
+        """Drop rows with missing values (in subset, or in any column)"""
+        return self._then(_DropNa(subset))
+
+    def fillna(self, strategy):
+        """Fill missing values with a clean_dataset fill strategy"""
+        if strategy not in FILL_STRATEGIES:
+            raise ValueError(f"Unknown fill strategy: {strategy}")
+        return self._then(_FillNa(strategy))
+
+    def clean(self, strategy):
+        """Apply a DataLoader.clean_dataset strategy lazily"""
+        if strategy == 'remove_missing':
+            return self.dropna()
+        return self.fillna(strategy)
+
+    def select(self, columns):
+        """Keep only the given columns"""
+        return self._then(_Select(list(columns)))
+
+    def filter(self, predicate):
+        """Keep rows matching a DataFrame.query expression or a callable returning a boolean mask"""
+        return self._then(_Filter(predicate))
+
+    def iter_chunks(self, progress_callback=None):
+        """Read the source and yield transformed chunks"""
+        for step_index, step in enumerate(self._steps):
+            step.prepare(self, step_index)
+
+        self.rows_read = 0
+        for chunk in self._source(progress_callback):
+            self.rows_read += len(chunk)
+            for step in self._steps:
+                chunk = step.apply(chunk)
+            yield chunk
+
+    def __iter__(self):
+        return self.iter_chunks()
+
+    def collect(self, progress_callback=None):
+        """Materialize the transformed dataset as one DataFrame"""
+        chunks = list(self.iter_chunks(progress_callback))
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks)
+
+    def head(self, n=5):
+        """Return the first n transformed rows, reading only as much of the source as needed"""
+        rows = []
+        collected = 0
+        for chunk in self.iter_chunks():
+            rows.append(chunk.head(n - collected))
+            collected += len(rows[-1])
+            if collected >= n:
+                break
+        return pd.concat(rows) if rows else pd.DataFrame()
+
+    def analyze(self, analyzer_options=None, progress_callback=None):
+        """Run the streaming analysis over the transformed chunks"""
+        analyzer = analysis_executor.analyze_chunks(self.iter_chunks(progress_callback), analyzer_options or {})
+        return analyzer.result()
+
+    def to_csv(self, path, progress_callback=None):
+        """Stream the transformed dataset into a CSV file; returns the number of rows written"""
+        written = 0
+        with open(path, 'w', newline='') as f:
+            for chunk in self.iter_chunks(progress_callback):
+                chunk.to_csv(f, index=False, header=(written == 0))
+                written += len(chunk)
+        logger.info(f"Lazy dataset exported to {path}: {written} of {self.rows_read} rows")
+        return written
+
+    def _then(self, step):
+        return LazyDataset(self._source, self._steps + (step,))
+
+    def _upstream(self, step_index):
+        """The dataset as seen by the step at step_index"""
+        return LazyDataset(self._source, self._steps[:step_index])
+
+
+class _DropNa:
+    def __init__(self, subset):
+        self.subset = subset
+
+    def prepare(self, dataset, step_index):
+        pass
+
+    def apply(self, chunk):
+        return chunk.dropna(subset=self.subset)
+
+
+class _Select:
+    def __init__(self, columns):
+        self.columns = columns
+
+    def prepare(self, dataset, step_index):
+        pass
+
+    def apply(self, chunk):
+        return chunk[self.columns]
+
+
+class _Filter:
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+    def prepare(self, dataset, step_index):
+        pass
+
+    def apply(self, chunk):
+        if isinstance(self.predicate, str):
+            return chunk.query(self.predicate)
+        return chunk[self.predicate(chunk)]
+
+
+class _FillNa:
+    """Fill step whose values come from one streaming statistics pass over its input"""
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self.values = None
+
+    def prepare(self, dataset, step_index):
+        if self.values is not None:
+            return
+        if self.strategy == 'fill_zero':
+            self.values = {}
+            return
+
+        analyzer = StreamingAnalyzer(max_missing_examples=0, sketch_epsilon=FILL_SKETCH_EPSILON)
+        for chunk in dataset._upstream(step_index).iter_chunks():
+            analyzer.update(chunk)
+
+        values = {}
+        for col, accumulator in analyzer.numeric.items():
+            stats = accumulator.stats()
+            values[col] = stats['mean'] if self.strategy == 'fill_mean' else stats['median']
+        if self.strategy == 'fill_mode':
+            for col, sketch in analyzer.categorical.items():
+                values[col] = _mode(sketch.counter.counts)
+        self.values = {col: value for col, value in values.items() if not pd.isna(value)}
+
+    def apply(self, chunk):
+        if self.strategy == 'fill_zero':
+            numeric = chunk.select_dtypes(include='number').columns
+            return chunk.fillna({col: 0 for col in numeric})
+        return chunk.fillna({col: value for col, value in self.values.items() if col in chunk.columns})
+
+
+def _mode(counts):
+    """Most frequent value; ties resolve to the smallest value like Series.mode()[0]"""
+    if counts.empty:
+        return 'Unknown'
+    top = counts[counts == counts.max()].index
+    try:
+        return sorted(top)[0]
+    except TypeError:
+        return top[0]
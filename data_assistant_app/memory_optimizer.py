@@ -0,0 +1,89 @@
+"""
+Data Assistant App - Memory Optimizer
+
+Shrinks parsed DataFrames after loading: integers and floats are narrowed
+to the smallest dtype that holds every value exactly, repeated strings
+become categoricals and the remaining text columns use Arrow-backed
+strings when pyarrow is installed.
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401 - only needed by the string[pyarrow] dtype
+    ARROW_STRINGS_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ARROW_STRINGS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Object columns with at most this ratio of distinct to non-null values become categoricals
+DEFAULT_CATEGORY_MAX_RATIO = 0.5
+
+
+class MemoryOptimizer:
+    """Narrows DataFrame dtypes without changing any value"""
+
+    @staticmethod
+    def optimize(dataset, category_max_ratio=DEFAULT_CATEGORY_MAX_RATIO):
+        """Return (optimized copy, report) with before/after deep memory usage"""
+        before_bytes = int(dataset.memory_usage(deep=True).sum())
+        optimized = dataset.copy()
+        changes = {}
+
+        for col in optimized.columns:
+            values = optimized[col]
+            converted = MemoryOptimizer._optimize_column(values, category_max_ratio)
+            if converted is not None and converted.dtype != values.dtype:
+                optimized[col] = converted
+                changes[col] = {'from': str(values.dtype), 'to': str(converted.dtype)}
+
+        after_bytes = int(optimized.memory_usage(deep=True).sum())
+        report = {
+            'before_bytes': before_bytes,
+            'after_bytes': after_bytes,
+            'reduction': round(before_bytes / after_bytes, 2) if after_bytes else None,
+            'columns': changes,
+        }
+        logger.info(
+            f"Memory optimization: {before_bytes / 1024 / 1024:.2f}MB -> {after_bytes / 1024 / 1024:.2f}MB "
+            f"({len(changes)} columns converted)"
+        )
+        return optimized, report
+
+    @staticmethod
+    def _optimize_column(values, category_max_ratio):
+        dtype = values.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            return None
+        if pd.api.types.is_unsigned_integer_dtype(dtype):
+            return pd.to_numeric(values, downcast='unsigned')
+        if pd.api.types.is_integer_dtype(dtype):
+            return pd.to_numeric(values, downcast='integer')
+        if pd.api.types.is_float_dtype(dtype):
+            return MemoryOptimizer._downcast_float(values)
+        if pd.api.types.is_object_dtype(dtype):
+            return MemoryOptimizer._encode_text(values, category_max_ratio)
+        return None
+
+    @staticmethod
+    def _downcast_float(values):
+        # Only lossless: float32 would otherwise shift means and quantiles
+        narrowed = values.astype(np.float32)
+        if np.array_equal(narrowed.to_numpy(dtype=np.float64), values.to_numpy(), equal_nan=True):
+            return narrowed
+        return None
+
+    @staticmethod
+    def _encode_text(values, category_max_ratio):
+        # Mixed-type object columns are left alone
+        non_null = values.dropna()
+        if non_null.empty or pd.api.types.infer_dtype(non_null, skipna=True) != 'string':
+            return None
+        if non_null.nunique() <= category_max_ratio * len(non_null):
+            return values.astype('category')
+        if ARROW_STRINGS_AVAILABLE:
+            return values.astype('string[pyarrow]')
+        return None
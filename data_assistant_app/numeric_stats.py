@@ -0,0 +1,122 @@
+"""
+Data Assistant App - Fused Numeric Statistics
+
+Computes the descriptive statistics of every numeric column at once over a
+single float64 block instead of running separate pandas reductions per
+column.
+"""
+
+import warnings
+import numpy as np
+from .sketches import QuantileSketch
+
+# Statistics reported per numeric column, in output order
+STAT_KEYS = ('mean', 'median', 'std', 'min', 'max', 'q1', 'q3')
+
+QUANTILE_PROBS = (0.25, 0.5, 0.75)
+
+
+def numeric_block(dataset):
+    """Return (column names, column-major float64 block) for the numeric columns"""
+    numeric = dataset.select_dtypes(include=[np.number])
+    block = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    return list(numeric.columns), np.asfortranarray(block)
+
+
+def fused_numeric_stats(block, quantiles=True):
+    """Compute all STAT_KEYS for each column of a 2D float64 block (NaN = missing).
+
+    Returns a dict mapping each statistic to an array with one value per column.
+    Columns without values yield NaN, matching pandas reductions. With
+    quantiles=False the q1/median/q3 arrays are left as NaN for the caller
+    to fill (e.g. from quantile sketches).
+    """
+    n_rows, n_cols = block.shape
+    if n_rows == 0 or n_cols == 0:
+        empty = np.full(n_cols, np.nan)
+        return {key: empty.copy() for key in STAT_KEYS}
+
+    with warnings.catch_warnings(), np.errstate(all='ignore'):
+        # All-NaN columns are expected here and reported as NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        nan_mask = np.isnan(block)
+        has_nan = nan_mask.any(axis=0)
+
+        mean = np.nanmean(block, axis=0)
+        std = np.nanstd(block, axis=0, ddof=1)
+        minimum = np.nanmin(block, axis=0)
+        maximum = np.nanmax(block, axis=0)
+
+        # Complete columns share one partition-based quantile call;
+        # columns with gaps are sorted once and interpolated by count
+        values = np.full((len(QUANTILE_PROBS), n_cols), np.nan)
+        complete = ~has_nan
+        if quantiles and complete.any():
+            values[:, complete] = np.quantile(block[:, complete], QUANTILE_PROBS, axis=0)
+        if quantiles and has_nan.any():
+            counts = (~nan_mask[:, has_nan]).sum(axis=0)
+            values[:, has_nan] = _sorted_quantiles(block[:, has_nan], counts)
+
+    return {
+        'mean': mean,
+        'median': values[1],
+        'std': std,
+        'min': minimum,
+        'max': maximum,
+        'q1': values[0],
+        'q3': values[2],
+    }
+
+
+def _sorted_quantiles(block, counts):
+    """Linear-interpolated QUANTILE_PROBS for columns with NaN gaps.
+
+    np.sort places NaN last, so the first counts[i] entries of column i are
+    its valid values; this avoids np.nanquantile's per-column Python loop.
+    """
+    ordered = np.sort(block, axis=0)
+    col_index = np.arange(block.shape[1])
+    last = np.maximum(counts - 1, 0)
+    result = np.empty((len(QUANTILE_PROBS), block.shape[1]))
+
+    for i, prob in enumerate(QUANTILE_PROBS):
+        position = last * prob
+        lower = np.floor(position).astype(np.intp)
+        upper = np.ceil(position).astype(np.intp)
+        fraction = position - lower
+        low_values = ordered[lower, col_index]
+        high_values = ordered[upper, col_index]
+        result[i] = low_values + (high_values - low_values) * fraction
+
+    result[:, counts == 0] = np.nan
+    return result
+
+
+def column_statistics(block, quantiles='exact', epsilon=None, chunk_size=65536):
+    """Fused statistics of a block with exact or sketched quartiles.
+
+    Returns (stats, rank_error). With quantiles='approx' each column is fed
+    to a QuantileSketch in row slices of chunk_size and rank_error is the
+    largest error bound among them.
+    """
+    stats = fused_numeric_stats(block, quantiles=(quantiles == 'exact'))
+    if quantiles != 'approx':
+        return stats, 0.0
+
+    rank_error = 0.0
+    for i in range(block.shape[1]):
+        sketch = QuantileSketch(epsilon=epsilon)
+        for start in range(0, block.shape[0], chunk_size):
+            sketch.update(block[start:start + chunk_size, i])
+        stats['q1'][i], stats['median'][i], stats['q3'][i] = sketch.quantiles(QUANTILE_PROBS)
+        rank_error = max(rank_error, sketch.error_bound)
+    return stats, rank_error
+
+
+def stats_to_dict(columns, stats):
+    """Convert fused statistic arrays into the analysis['numeric_stats'] layout"""
+    return {
+        col: {key: float(stats[key][i]) for key in STAT_KEYS}
+        for i, col in enumerate(columns)
+    }
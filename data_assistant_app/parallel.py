@@ -0,0 +1,158 @@
+"""
+Data Assistant App - Parallel Analysis Executor
+
+Spreads column statistics (in-memory analysis) and row chunks (streaming
+analysis) across a process pool. Numeric column buffers are handed to the
+workers through shared memory instead of being pickled; every worker
+returns a partial result that is merged in the request process.
+"""
+
+import threading
+import logging
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from django.conf import settings
+from .numeric_stats import column_statistics, STAT_KEYS
+from .sketches import CategoricalSketch
+from .streaming import StreamingAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Frames smaller than this many cells are analyzed serially
+DEFAULT_PARALLEL_MIN_CELLS = 5_000_000
+
+
+def _attach_shared_block(name, shape):
+    """Attach to a shared float64 block created by the parent process"""
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track argument
+        shm = shared_memory.SharedMemory(name=name)
+        # The parent owns (and unlinks) the segment; stop this process's tracker from doing it too
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm, np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order='F')
+
+
+def _numeric_shard_worker(name, shape, start, stop, quantiles, epsilon):
+    """Compute column statistics for columns [start, stop) of the shared block"""
+    shm, block = _attach_shared_block(name, shape)
+    try:
+        return column_statistics(block[:, start:stop], quantiles=quantiles, epsilon=epsilon)
+    finally:
+        del block
+        shm.close()
+
+
+def _categorical_worker(values, slice_rows):
+    return CategoricalSketch.from_series(values, slice_rows)
+
+
+def _chunk_worker(chunk, analyzer_options):
+    analyzer = StreamingAnalyzer(**analyzer_options)
+    analyzer.update(chunk)
+    return analyzer
+
+
+class AnalysisExecutor:
+    """Runs analysis kernels on a shared process pool, or serially for small inputs"""
+
+    def __init__(self, workers=None, min_cells=None):
+        self._workers = workers
+        self._min_cells = min_cells
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def workers(self):
+        if self._workers is not None:
+            return self._workers
+        return getattr(settings, 'ANALYSIS_WORKERS', None) or 1
+
+    @property
+    def min_cells(self):
+        if self._min_cells is not None:
+            return self._min_cells
+        return getattr(settings, 'ANALYSIS_PARALLEL_MIN_CELLS', DEFAULT_PARALLEL_MIN_CELLS)
+
+    def should_parallelize(self, cells):
+        return self.workers > 1 and cells >= self.min_cells
+
+    def numeric_stats(self, block, quantiles='exact', epsilon=None):
+        """Column statistics of a float64 block, sharded by column across workers"""
+        n_rows, n_cols = block.shape
+        if n_cols < 2 or not self.should_parallelize(block.size):
+            return column_statistics(block, quantiles=quantiles, epsilon=epsilon)
+
+        shm = shared_memory.SharedMemory(create=True, size=block.nbytes)
+        try:
+            shared = np.ndarray(block.shape, dtype=np.float64, buffer=shm.buf, order='F')
+            shared[:] = block
+            del shared
+
+            bounds = np.linspace(0, n_cols, min(self.workers, n_cols) + 1).astype(int)
+            futures = [
+                self._get_pool().submit(_numeric_shard_worker, shm.name, block.shape, start, stop, quantiles, epsilon)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            partials = [future.result() for future in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+        stats = {key: np.concatenate([part[key] for part, _ in partials]) for key in STAT_KEYS}
+        rank_error = max(error for _, error in partials)
+        return stats, rank_error
+
+    def categorical_sketches(self, dataset, columns, slice_rows):
+        """CategoricalSketch per column, one column per task"""
+        if len(columns) < 2 or not self.should_parallelize(len(dataset) * len(columns)):
+            return {col: CategoricalSketch.from_series(dataset[col], slice_rows) for col in columns}
+
+        # Object columns cannot live in shared memory; they are pickled per task
+        pool = self._get_pool()
+        futures = {col: pool.submit(_categorical_worker, dataset[col], slice_rows) for col in columns}
+        return {col: future.result() for col, future in futures.items()}
+
+    def analyze_chunks(self, chunks, analyzer_options):
+        """Fold an iterable of DataFrame chunks into one StreamingAnalyzer.
+
+        Chunks are analyzed serially until they add up to min_cells; the
+        rest go to workers (at most two per worker in flight, so memory
+        stays bounded) and are merged in file order.
+        """
+        result = StreamingAnalyzer(**analyzer_options)
+        cells = 0
+        pending = []
+        for chunk in chunks:
+            if not pending and not self.should_parallelize(cells):
+                cells += chunk.size
+                result.update(chunk)
+                continue
+            pending.append(self._get_pool().submit(_chunk_worker, chunk, analyzer_options))
+            if len(pending) >= 2 * self.workers:
+                result.merge(pending.pop(0).result())
+        for future in pending:
+            result.merge(future.result())
+        return result
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                # spawn avoids forking a threaded server process
+                context = multiprocessing.get_context('spawn')
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+                logger.info(f"Analysis process pool started with {self.workers} workers")
+            return self._pool
+
+
+# Shared executor for the whole process
+analysis_executor = AnalysisExecutor()
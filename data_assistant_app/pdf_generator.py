@@ -10,15 +10,21 @@ import base64
 from datetime import datetime
 import os
 import tempfile
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')
 from PIL import Image as PILImage
 import logging
 from .translations import get_text
+from .downsampling import Downsampler, DEFAULT_MAX_POINTS
 
 logger = logging.getLogger(__name__)
 
+# Line charts draw markers, and label each point, only when there are few points
+LINE_MARKER_MAX_POINTS = 100
+LINE_ANNOTATION_MAX_POINTS = 20
+
 class PDFGenerator:
     def __init__(self, language='en'):
         self.language = language
@@ -473,16 +479,18 @@ class PDFGenerator:
         elements.append(Paragraph(get_text('CATEGORICAL_FREQUENCIES', self.language), self.styles['CustomSubtitle']))
         
         categorical_freqs = pdf_data.get('categorical_freqs', {})
+        categorical_distinct = pdf_data.get('categorical_distinct', {})
         if categorical_freqs:
             for col, freqs in categorical_freqs.items():
+                distinct = categorical_distinct.get(col, {}).get('distinct', len(freqs))
                 elements.append(Paragraph(f"<b>{col}:</b>", self.styles['CustomBody']))
                 
                 table_data = [[get_text('VALUE', self.language), get_text('FREQUENCY', self.language)]]
                 for value, freq in list(freqs.items())[:5]:
                     table_data.append([str(value), str(freq)])
                 
-                if len(freqs) > 5:
-                    table_data.append(['...', f'and {len(freqs) - 5} more values'])
+                if distinct > 5:
+                    table_data.append(['...', f'and {distinct - 5} more values'])
                 
                 table = Table(table_data, colWidths=[3*inch, 1.5*inch])
                 table.setStyle(TableStyle([
@@ -583,24 +591,25 @@ class PDFGenerator:
             y_label = chart_data.get('y_label', 'Y')
             title = chart_data.get('title', 'Scatter Plot')
             
-            x_numeric = []
-            y_numeric = []
-            
-            for value in x_data:
-                try:
-                    x_numeric.append(float(value))
-                except (ValueError, TypeError):
-                    pass
-            
-            for value in y_data:
-                try:
-                    y_numeric.append(float(value))
-                except (ValueError, TypeError):
-                    pass
+            x_points = self._float_array(x_data)
+            y_points = self._float_array(y_data)
+            counts = chart_data.get('counts')
+            if len(x_points) != len(y_points):
+                x_points = y_points = np.empty(0)
+            elif counts is None or len(counts) != len(x_points):
+                # Raw points: dense plots are drawn as grid cells sized by their number of points
+                x_points, y_points, counts = Downsampler.scatter_points(x_points, y_points, DEFAULT_MAX_POINTS)
+            else:
+                # Points from the chart API are already aggregated; counts weights each one
+                counts = np.asarray(counts, dtype='float64')
+                finite = np.isfinite(x_points) & np.isfinite(y_points) & np.isfinite(counts)
+                x_points, y_points, counts = x_points[finite], y_points[finite], counts[finite]
             
-            if x_numeric and y_numeric and len(x_numeric) == len(y_numeric):
+            if len(x_points) > 0:
+                sizes = 30 if counts.max() <= 1 else 10 + 90 * counts / counts.max()
+                
                 fig, ax = plt.subplots(figsize=(8, 6))
-                ax.scatter(x_numeric, y_numeric, alpha=0.6, color='#2ecc71', s=30)
+                ax.scatter(x_points, y_points, alpha=0.6, color='#2ecc71', s=sizes)
                 ax.set_xlabel(x_label)
                 ax.set_ylabel(y_label)
                 ax.set_title(title)
@@ -621,6 +630,17 @@ class PDFGenerator:
         
         return elements
     
+    @staticmethod
+    def _float_array(values):
+        """Values as a float64 array; values that are not numbers become NaN"""
+        numbers = []
+        for value in values:
+            try:
+                numbers.append(float(value))
+            except (ValueError, TypeError):
+                numbers.append(np.nan)
+        return np.asarray(numbers, dtype='float64')
+    
     def _render_line_chart(self, chart_data):
         """Render line chart"""
         elements = []
@@ -648,14 +668,15 @@ class PDFGenerator:
                     pass
             
             if x_numeric and y_numeric and len(x_numeric) == len(y_numeric):
-                sorted_data = sorted(zip(x_numeric, y_numeric), key=lambda x: x[0])
-                x_sorted, y_sorted = zip(*sorted_data)
+                # Sorted by x and reduced with LTTB to a bounded number of points
+                x_sorted, y_sorted = Downsampler.line_points(x_numeric, y_numeric, DEFAULT_MAX_POINTS)
+                few_points = len(x_sorted) <= LINE_MARKER_MAX_POINTS
                 
                 fig, ax = plt.subplots(figsize=(10, 6))
                 
                 ax.plot(x_sorted, y_sorted, 
-                       marker='o', 
-                       linewidth=3, 
+                       marker='o' if few_points else None, 
+                       linewidth=3 if few_points else 1.5, 
                        markersize=8, 
                        color='#3498db', 
                        alpha=0.9,
@@ -677,7 +698,8 @@ class PDFGenerator:
                 ax.set_xlim(x_min - x_padding, x_max + x_padding)
                 ax.set_ylim(y_min - y_padding, y_max + y_padding)
                 
-                for x, y in zip(x_sorted, y_sorted):
+                labelled = zip(x_sorted, y_sorted) if len(x_sorted) <= LINE_ANNOTATION_MAX_POINTS else []
+                for x, y in labelled:
                     ax.annotate(f'{y:.0f}', 
                               (x, y), 
                               textcoords="offset points", 
@@ -717,6 +739,9 @@ class PDFGenerator:
             elements.append(Paragraph(f"Applied strategy: <b>{cleaning_notes.get('strategy', 'N/A')}</b>", self.styles['CustomBody']))
             elements.append(Paragraph(f"Modified rows: <b>{cleaning_notes.get('modified_rows', 0)}</b>", self.styles['CustomBody']))
             elements.append(Paragraph(f"Filled values: <b>{cleaning_notes.get('filled_values', 0)}</b>", self.styles['CustomBody']))
+            filled_columns = [f"{col}: {count}" for col, count in cleaning_notes.get('columns', {}).items() if count]
+            if filled_columns:
+                elements.append(Paragraph(f"Filled values by column: <b>{', '.join(filled_columns)}</b>", self.styles['CustomBody']))
             elements.append(Paragraph(f"Cleaning date: <b>{cleaning_notes.get('date', 'N/A')}</b>", self.styles['CustomBody']))
         else:
             elements.append(Paragraph("No cleaning strategy was applied.", self.styles['CustomBody']))
@@ -780,9 +805,11 @@ class PDFGenerator:
                 recommendations.append(get_text('RECOMMENDATION_SKEWNESS', self.language, column=col))
         
         # Categorical data recommendations
+        categorical_distinct = pdf_data.get('categorical_distinct', {})
         for col, freqs in categorical_freqs.items():
-            unique_count = len(freqs)
-            total_count = sum(freqs.values())
+            # Frequencies are truncated to the top values; use full-column counts
+            unique_count = categorical_distinct.get(col, {}).get('distinct', len(freqs))
+            total_count = total_rows - missing_by_column.get(col, 0) if col in missing_by_column else sum(freqs.values())
             
             if unique_count > total_count * 0.5:
                 recommendations.append(get_text('WARNING_HIGH_CARDINALITY', self.language, col=col, n=unique_count))
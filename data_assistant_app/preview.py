@@ -0,0 +1,92 @@
+"""
+Data Assistant App - Row Preview Windows
+
+Serves pages of rows from an already parsed (cached) dataset for the rows
+API: the page is a positional slice, so only the requested rows and
+columns are copied and serialized. Sorted pages use a row order computed
+once per dataset version and sort key and kept in a small LRU cache.
+"""
+
+import json
+import threading
+import logging
+from collections import OrderedDict
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_ROWS = 100
+MAX_PAGE_ROWS = 1000
+
+# Sort orders kept in memory (one int64 array per dataset version and sort key)
+SORT_CACHE_ENTRIES = 32
+
+
+class RowPreview:
+    """Windowed, optionally sorted access to the rows of a DataFrame"""
+
+    @staticmethod
+    def window(dataset, offset=0, limit=DEFAULT_PAGE_ROWS, columns=None, sort=None, cache_key=None):
+        """Return one page of rows as a JSON-ready dict.
+
+        columns restricts the page to a subset; sort is a column name,
+        prefixed with '-' for descending order (missing values last).
+        cache_key identifies the dataset version for reusing sort orders.
+        Raises ValueError for invalid arguments.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        if not 1 <= limit <= MAX_PAGE_ROWS:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_ROWS}")
+        columns = list(columns) if columns else list(dataset.columns)
+        unknown = [col for col in columns if col not in dataset.columns]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(map(str, unknown))}")
+
+        total_rows = len(dataset)
+        if sort:
+            order = RowPreview._sort_order(dataset, sort, cache_key)
+            page = dataset.iloc[order[offset:offset + limit]][columns]
+        else:
+            page = dataset.iloc[offset:offset + limit][columns]
+
+        end = offset + len(page)
+        return {
+            'offset': offset,
+            'limit': limit,
+            'total_rows': total_rows,
+            'columns': [str(col) for col in columns],
+            'index': page.index.tolist(),
+            'rows': json.loads(page.to_json(orient='values', date_format='iso')),
+            'next_offset': end if end < total_rows else None,
+        }
+
+    @staticmethod
+    def _sort_order(dataset, sort, cache_key):
+        ascending = not sort.startswith('-')
+        column = sort.lstrip('-')
+        if column not in dataset.columns:
+            raise ValueError(f"Unknown sort column: {column}")
+
+        key = (cache_key, column, ascending) if cache_key is not None else None
+        if key is not None:
+            with _sort_lock:
+                order = _sort_orders.get(key)
+                if order is not None:
+                    _sort_orders.move_to_end(key)
+                    return order
+
+        values = dataset[column].reset_index(drop=True)
+        order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy(dtype=np.int64)
+        logger.debug(f"Computed sort order of {column} ({'asc' if ascending else 'desc'}) for {len(order)} rows")
+
+        if key is not None:
+            with _sort_lock:
+                _sort_orders[key] = order
+                while len(_sort_orders) > SORT_CACHE_ENTRIES:
+                    _sort_orders.popitem(last=False)
+        return order
+
+
+_sort_orders = OrderedDict()
+_sort_lock = threading.Lock()
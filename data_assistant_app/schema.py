@@ -0,0 +1,212 @@
+"""
+Data Assistant App - CSV Schema Inference
+
+Decides the delimiter, decimal separator and column dtypes of a CSV file
+from a sample (the head plus blocks read at random offsets) so the full
+parse gets an explicit schema instead of letting pandas re-infer types
+chunk by chunk. Schemas are cached per file version.
+"""
+
+import io
+import csv
+import re
+import threading
+import logging
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from .dataset_cache import file_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Default sample: rows read from the head plus rows read at random offsets
+DEFAULT_SAMPLE_ROWS = 1000
+DEFAULT_SAMPLE_BLOCKS = 10
+
+# Bytes of the head used to sniff the delimiter
+SNIFF_BYTES = 64 * 1024
+
+# Number of file versions whose schema is kept in memory
+SCHEMA_CACHE_ENTRIES = 256
+
+CANDIDATE_DELIMITERS = ',;\t|'
+INTEGER_PATTERN = re.compile(r'^[+-]?\d+$')
+DATE_PATTERN = re.compile(r'^(\d{4}-\d{1,2}-\d{1,2}|\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})([ T]\d{1,2}:\d{2}(:\d{2})?)?$')
+BOOLEAN_VALUES = {'true', 'false'}
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+UINT64_MAX = 2 ** 64 - 1
+
+
+class CsvSchema:
+    """Delimiter, decimal separator and column types inferred for one CSV file"""
+
+    def __init__(self, sep=',', decimal='.', columns=None, dtypes=None, date_columns=None):
+        self.sep = sep
+        self.decimal = decimal
+        self.columns = columns or []
+        self.dtypes = dtypes or {}
+        self.date_columns = date_columns or []
+
+    def read_kwargs(self, columns=None, parse_dates=None):
+        """Keyword arguments for pd.read_csv; columns restricts the parse to a subset"""
+        if parse_dates is None:
+            parse_dates = getattr(settings, 'CSV_PARSE_DATES', False)
+        kwargs = {'sep': self.sep, 'decimal': self.decimal}
+        selected = columns if columns is not None else self.columns
+        dtypes = {col: dtype for col, dtype in self.dtypes.items() if col in selected}
+        dates = [col for col in self.date_columns if col in selected]
+
+        if columns is not None:
+            kwargs['usecols'] = list(columns)
+        if parse_dates and dates:
+            kwargs['parse_dates'] = dates
+            dtypes = {col: dtype for col, dtype in dtypes.items() if col not in dates}
+        if dtypes:
+            kwargs['dtype'] = dtypes
+        return kwargs
+
+    def drop_types(self):
+        """Schema without the sampled numeric types, for when they failed on the full file.
+
+        Text types cannot fail and are kept. Returns None if there is
+        nothing to drop. The schema itself is left unchanged, since it is
+        shared through the schema cache.
+        """
+        text_dtypes = {col: dtype for col, dtype in self.dtypes.items() if dtype == 'str'}
+        if len(text_dtypes) == len(self.dtypes) and not self.date_columns:
+            return None
+        return CsvSchema(sep=self.sep, decimal=self.decimal, columns=self.columns, dtypes=text_dtypes)
+
+    @staticmethod
+    def for_file(file_path, sep=None):
+        """Return the cached schema of this file version, inferring it on a miss.
+
+        sep is a delimiter already sniffed from the head (e.g. during upload).
+        """
+        key = file_fingerprint(file_path)
+        with _cache_lock:
+            schema = _schema_cache.get(key)
+            if schema is not None:
+                _schema_cache.move_to_end(key)
+                return schema
+
+        schema = CsvSchema.infer(file_path, sep=sep)
+        with _cache_lock:
+            _schema_cache[key] = schema
+            while len(_schema_cache) > SCHEMA_CACHE_ENTRIES:
+                _schema_cache.popitem(last=False)
+        return schema
+
+    @staticmethod
+    def infer(file_path, sample_rows=None, sample_blocks=None, sep=None):
+        """Infer the schema of a CSV file from its head and random blocks; sep skips sniffing"""
+        sample_rows = sample_rows or getattr(settings, 'CSV_SCHEMA_SAMPLE_ROWS', DEFAULT_SAMPLE_ROWS)
+        sample_blocks = sample_blocks if sample_blocks is not None else getattr(
+            settings, 'CSV_SCHEMA_SAMPLE_BLOCKS', DEFAULT_SAMPLE_BLOCKS
+        )
+
+        if sep is None:
+            with open(file_path, 'rb') as f:
+                head = f.read(SNIFF_BYTES).decode('utf-8', errors='replace')
+            sep = CsvSchema.sniff_delimiter(head)
+
+        head_sample = pd.read_csv(file_path, sep=sep, nrows=sample_rows, dtype=str)
+        columns = list(head_sample.columns)
+        if len(set(columns)) != len(columns) or len(head_sample) < sample_rows:
+            # Duplicate headers are renamed by pandas; short files were sampled whole
+            samples = [head_sample]
+        else:
+            samples = [head_sample] + CsvSchema._random_blocks(file_path, sep, columns, sample_rows, sample_blocks)
+        sample = pd.concat(samples, ignore_index=True)
+
+        decimal = CsvSchema._detect_decimal(sample, sep)
+        dtypes, date_columns = {}, []
+        for col in columns:
+            kind = CsvSchema._column_kind(sample[col].dropna(), decimal)
+            if kind == 'float':
+                dtypes[col] = 'float64'
+            elif kind == 'integer':
+                # Missing values make pandas read integer columns as float64
+                dtypes[col] = 'float64' if sample[col].isnull().any() else 'int64'
+            elif kind == 'unsigned':
+                dtypes[col] = 'str' if sample[col].isnull().any() else 'uint64'
+            elif kind in ('text', 'date'):
+                dtypes[col] = 'str'
+                if kind == 'date':
+                    date_columns.append(col)
+
+        logger.info(f"Inferred CSV schema for {file_path}: sep={sep!r}, decimal={decimal!r}, {len(dtypes)} typed columns")
+        return CsvSchema(sep=sep, decimal=decimal, columns=columns, dtypes=dtypes, date_columns=date_columns)
+
+    @staticmethod
+    def sniff_delimiter(head):
+        """Delimiter of a CSV from the text of its head (',' if it cannot be told)"""
+        lines = head.splitlines()[:50]
+        if len(lines) > 1 and not head.endswith('\n'):
+            lines = lines[:-1]  # last line may be cut in the middle
+        try:
+            sep = csv.Sniffer().sniff('\n'.join(lines), delimiters=CANDIDATE_DELIMITERS).delimiter
+        except csv.Error:
+            return ','
+        # A sniffed delimiter that does not split the header is not trusted
+        if lines and sep != ',' and sep not in lines[0]:
+            return ','
+        return sep
+
+    @staticmethod
+    def _random_blocks(file_path, sep, columns, sample_rows, sample_blocks):
+        if sample_blocks <= 0:
+            return []
+        block_rows = max(sample_rows // sample_blocks, 1)
+        blocks = []
+        with open(file_path, 'rb') as f:
+            size = f.seek(0, io.SEEK_END)
+            rng = np.random.default_rng(size)
+            for offset in np.sort(rng.integers(0, size, sample_blocks)):
+                f.seek(int(offset))
+                f.readline()  # skip the partial line at the offset
+                lines = [f.readline() for _ in range(block_rows)]
+                text = b''.join(lines).decode('utf-8', errors='replace')
+                if not text.strip():
+                    continue
+                try:
+                    blocks.append(pd.read_csv(io.StringIO(text), sep=sep, header=None, names=columns, dtype=str))
+                except (pd.errors.ParserError, ValueError):
+                    # Offset landed inside a quoted multi-line field
+                    continue
+        return blocks
+
+    @staticmethod
+    def _detect_decimal(sample, sep):
+        if sep == ',':
+            return '.'
+        values = pd.Series(sample.to_numpy().ravel()).dropna().astype(str)
+        comma_numbers = values.str.fullmatch(r'[+-]?\d+,\d+').sum()
+        dot_numbers = values.str.fullmatch(r'[+-]?\d+\.\d+').sum()
+        return ',' if comma_numbers > dot_numbers else '.'
+
+    @staticmethod
+    def _column_kind(values, decimal):
+        """Classify sampled string values as integer, unsigned, float, boolean, date or text"""
+        if values.empty:
+            return None
+        values = values.str.strip()
+        if values.str.lower().isin(BOOLEAN_VALUES).all():
+            return 'boolean'
+        if values.str.fullmatch(INTEGER_PATTERN).all():
+            integers = values.map(int)
+            if integers.between(INT64_MIN, INT64_MAX).all():
+                return 'integer'
+            # pandas reads integers beyond int64 as uint64 when they fit, else as text
+            return 'unsigned' if integers.between(0, UINT64_MAX).all() else 'text'
+        numeric_text = values.str.replace(decimal, '.', regex=False) if decimal != '.' else values
+        if pd.to_numeric(numeric_text, errors='coerce').notna().all():
+            return 'float'
+        if values.str.fullmatch(DATE_PATTERN).all():
+            return 'date'
+        return 'text'
+
+
+_schema_cache = OrderedDict()
+_cache_lock = threading.Lock()
@@ -0,0 +1,109 @@
+"""
+Data Assistant App - Columnar Sidecar Storage
+
+Stores the parsed DataFrame of an upload next to it as an uncompressed
+Feather (Arrow IPC) file, so later loads skip CSV/XLSX parsing and can
+memory-map the columns instead. A sidecar is served only while the
+source file and the settings that shape the parsed frame (parser engine,
+memory optimization) are those it was written with.
+"""
+
+import os
+import json
+import logging
+import numpy as np
+from django.conf import settings
+from .csv_parser import CsvParser
+from .memory_optimizer import DEFAULT_CATEGORY_MAX_RATIO
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = '.feather'
+SOURCE_METADATA_KEY = b'synapse_source'
+
+
+class ColumnarSidecar:
+    """Reads and writes Feather sidecars for uploaded data files"""
+
+    @staticmethod
+    def path_for(file_path):
+        """Return the sidecar path for a source data file"""
+        return f"{file_path}{SIDECAR_SUFFIX}"
+
+    @staticmethod
+    def _source_signature(file_path):
+        """Source file version and the settings the sidecar's frame was parsed with"""
+        stat = os.stat(file_path)
+        return {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'parser_engine': CsvParser.engine(),
+            'optimize_memory': getattr(settings, 'DATASET_OPTIMIZE_MEMORY', False),
+            'category_max_ratio': getattr(settings, 'DATASET_CATEGORY_MAX_RATIO', DEFAULT_CATEGORY_MAX_RATIO),
+        }
+
+    @staticmethod
+    def write(file_path, dataset):
+        """Store dataset as the sidecar of file_path. Returns True on success."""
+        if not PYARROW_AVAILABLE:
+            return False
+
+        sidecar_path = ColumnarSidecar.path_for(file_path)
+        temp_path = f"{sidecar_path}.tmp"
+        try:
+            table = pa.Table.from_pandas(dataset, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[SOURCE_METADATA_KEY] = json.dumps(ColumnarSidecar._source_signature(file_path)).encode()
+            table = table.replace_schema_metadata(metadata)
+
+            # Uncompressed so the file can be memory-mapped on read
+            feather.write_feather(table, temp_path, compression='uncompressed')
+            os.replace(temp_path, sidecar_path)
+            logger.info(f"Columnar sidecar written: {sidecar_path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not write columnar sidecar for {file_path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+    @staticmethod
+    def read(file_path):
+        """Return the sidecar DataFrame of file_path, or None if missing or stale"""
+        if not PYARROW_AVAILABLE:
+            return None
+
+        sidecar_path = ColumnarSidecar.path_for(file_path)
+        if not os.path.exists(sidecar_path):
+            return None
+
+        try:
+            table = feather.read_table(sidecar_path, memory_map=True)
+            stored = json.loads((table.schema.metadata or {}).get(SOURCE_METADATA_KEY, b'{}'))
+            if stored != ColumnarSidecar._source_signature(file_path):
+                logger.info(f"Columnar sidecar is stale: {sidecar_path}")
+                return None
+
+            dataset = table.to_pandas()
+            # Arrow yields None for missing strings; pandas parsers yield NaN
+            object_columns = dataset.select_dtypes(include=['object']).columns
+            if len(object_columns) > 0:
+                dataset[object_columns] = dataset[object_columns].fillna(np.nan)
+            return dataset
+        except Exception as e:
+            logger.warning(f"Could not read columnar sidecar {sidecar_path}: {e}")
+            return None
+
+    @staticmethod
+    def remove(file_path):
+        """Delete the sidecar of file_path if it exists"""
+        sidecar_path = ColumnarSidecar.path_for(file_path)
+        if os.path.exists(sidecar_path):
+            os.remove(sidecar_path)
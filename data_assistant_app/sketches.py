@@ -0,0 +1,313 @@
+"""
+Data Assistant App - Mergeable Sketches
+
+Bounded-memory summaries used to analyze data that is read in chunks:
+a KLL-style quantile sketch for numeric columns, plus a Space-Saving top-k
+counter and a HyperLogLog distinct-count estimator for categorical columns.
+All of them can be updated with whole chunks and merged with sketches
+built from other chunks or parallel workers.
+
+Quantile sketches are sized from a normalized rank error epsilon: a
+reported median of a column with n values has a true rank within
+0.5n +/- epsilon*n (with high probability).
+"""
+
+import numpy as np
+import pandas as pd
+
+# Default normalized rank error of quantile sketches (1% of the rank)
+DEFAULT_SKETCH_EPSILON = 0.01
+
+# Empirical KLL constant: rank error is about KLL_ERROR_CONSTANT / k
+KLL_ERROR_CONSTANT = 1.7
+
+# Default number of distinct values tracked per categorical column
+DEFAULT_TOPK_CAPACITY = 1000
+
+# Default HyperLogLog precision: 2**12 registers, about 1.6% standard error
+DEFAULT_HLL_PRECISION = 12
+
+
+class QuantileSketch:
+    """KLL-style quantile sketch over float values.
+
+    Values are stored in levels of compactors; an item on level h stands for
+    2**h original values. When the sketch is over capacity, a full level is
+    sorted and every other item is promoted to the next level. While no
+    compaction has happened the sketch holds every value and is exact.
+    """
+
+    def __init__(self, epsilon=DEFAULT_SKETCH_EPSILON, seed=None):
+        self.epsilon = epsilon
+        self.k = max(int(np.ceil(KLL_ERROR_CONSTANT / epsilon)), 8)
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def is_exact(self):
+        return len(self.levels) == 1
+
+    @property
+    def error_bound(self):
+        """Normalized rank error of reported quantiles (0 while exact)"""
+        return 0.0 if self.is_exact else self.epsilon
+
+    def update(self, values):
+        """Add an array of values (NaN entries are ignored)"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.count += values.size
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        """Fold another sketch into this one (the coarser error bound is kept)"""
+        self.epsilon = max(self.epsilon, other.epsilon)
+        self.k = min(self.k, other.k)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def quantiles(self, probs):
+        """Return the estimated values at each probability in probs"""
+        if self.count == 0:
+            return [float('nan')] * len(probs)
+
+        if self.is_exact:
+            return [float(v) for v in np.quantile(self.levels[0], probs)]
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level), 2.0 ** height) for height, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind='stable')
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        total = cumulative[-1]
+
+        result = []
+        for prob in probs:
+            rank = prob * total
+            position = min(int(np.searchsorted(cumulative, rank, side='left')), len(items) - 1)
+            result.append(float(items[position]))
+        return result
+
+    def _capacity(self, height):
+        depth = len(self.levels) - height - 1
+        return max(int(np.ceil(self.k * (2.0 / 3.0) ** depth)), 2)
+
+    def _compress(self):
+        while True:
+            full_level = next(
+                (h for h, items in enumerate(self.levels) if len(items) > self._capacity(h)),
+                None
+            )
+            if full_level is None:
+                return
+            self._compact(full_level)
+
+    def _compact(self, height):
+        items = np.sort(self.levels[height])
+        if height + 1 == len(self.levels):
+            self.levels.append(np.empty(0))
+
+        # Keep one item behind when the level holds an odd count
+        leftover = items[:len(items) % 2]
+        pairs = items[len(items) % 2:]
+        offset = int(self._rng.integers(2))
+        promoted = pairs[offset::2]
+
+        self.levels[height] = leftover
+        self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+
+
+class TopKCounter:
+    """Space-Saving heavy-hitters counter with bounded capacity.
+
+    Counts are exact while fewer than `capacity` distinct values have been
+    seen. Afterwards the stored counts are upper bounds whose overestimate
+    is tracked per value in `errors`.
+    """
+
+    def __init__(self, capacity=DEFAULT_TOPK_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.truncated = False
+
+    def update(self, values):
+        """Add the values of a pandas Series (missing values are ignored)"""
+        self.update_counts(values.value_counts(dropna=True))
+
+    def update_counts(self, chunk_counts):
+        """Add exact {value: count} totals of a chunk, as returned by value_counts"""
+        chunk_counts = chunk_counts[chunk_counts > 0]
+        if chunk_counts.empty:
+            return
+        other = TopKCounter(self.capacity)
+        other.counts = chunk_counts.astype(np.int64)
+        other.errors = pd.Series(0, index=chunk_counts.index, dtype=np.int64)
+        other._trim()
+        self.merge(other)
+
+    def merge(self, other):
+        """Fold another counter into this one"""
+        floor_self = self._floor()
+        floor_other = other._floor()
+        index = self.counts.index.union(other.counts.index, sort=False)
+
+        self.counts = (
+            self.counts.reindex(index, fill_value=floor_self)
+            + other.counts.reindex(index, fill_value=floor_other)
+        )
+        self.errors = (
+            self.errors.reindex(index, fill_value=floor_self)
+            + other.errors.reindex(index, fill_value=floor_other)
+        )
+        self.truncated = self.truncated or other.truncated
+        self._trim()
+
+    def top(self, n=None):
+        """Return {value: count} for the n most frequent values, highest first"""
+        ordered = self.counts.sort_values(ascending=False, kind='stable')
+        if n is not None:
+            ordered = ordered.head(n)
+        return {value: int(count) for value, count in ordered.items()}
+
+    def _floor(self):
+        """Upper bound on the count of any value this counter no longer tracks"""
+        if not self.truncated or self.counts.empty:
+            return 0
+        return int(self.counts.min())
+
+    def _trim(self):
+        if len(self.counts) > self.capacity:
+            keep = self.counts.nlargest(self.capacity, keep='first').index
+            self.counts = self.counts.loc[keep]
+            self.errors = self.errors.loc[keep]
+            self.truncated = True
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count estimator over pandas values.
+
+    Values are hashed with pandas' stable 64-bit object hash; the first
+    `precision` bits select a register and the position of the leading one
+    bit of the rest is kept as the register maximum.
+    """
+
+    def __init__(self, precision=DEFAULT_HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        """Standard error of the estimate"""
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values):
+        """Add the values of a pandas Series (missing values are ignored)"""
+        values = values.dropna()
+        if values.empty:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+        value_bits = 64 - self.precision
+        buckets = (hashes >> np.uint64(value_bits)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << value_bits) - 1)
+        ranks = value_bits - _bit_length(remainder) + 1
+        np.maximum.at(self.registers, buckets, ranks.astype(np.uint8))
+
+    def merge(self, other):
+        """Fold another estimator of the same precision into this one"""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        """Return the estimated number of distinct values"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+
+        # Small-range correction via linear counting
+        empty_registers = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and empty_registers > 0:
+            return int(round(m * np.log(m / empty_registers)))
+        return int(round(raw))
+
+
+def _bit_length(values):
+    """Vectorized int.bit_length for uint64 arrays"""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    # frexp exponents are exact bit lengths for values below 2**53
+    high_bits = np.frexp(high)[1]
+    low_bits = np.frexp(low)[1]
+    return np.where(high > 0, high_bits + 32, low_bits)
+
+
+class CategoricalSketch:
+    """Top-k frequencies plus distinct count for one categorical column.
+
+    The distinct count is exact until the top-k counter overflows; at that
+    point the values seen so far are exactly the counter's keys, so they
+    seed a HyperLogLog that estimates the distinct count from then on.
+    """
+
+    def __init__(self, capacity=DEFAULT_TOPK_CAPACITY, precision=DEFAULT_HLL_PRECISION):
+        self.counter = TopKCounter(capacity)
+        self.precision = precision
+        self.distinct = None
+
+    @classmethod
+    def from_series(cls, values, slice_rows=65536, **options):
+        """Build a sketch from a whole Series, fed in slices of slice_rows"""
+        sketch = cls(**options)
+        for start in range(0, len(values), slice_rows):
+            sketch.update(values.iloc[start:start + slice_rows])
+        return sketch
+
+    def update(self, values):
+        """Add the values of a pandas Series (missing values are ignored)"""
+        chunk_counts = values.value_counts(dropna=True)
+        chunk_counts = chunk_counts[chunk_counts > 0]
+        if self.distinct is None:
+            seen = self.counter.counts.index.union(chunk_counts.index, sort=False)
+            if len(seen) > self.counter.capacity:
+                self._start_distinct()
+        if self.distinct is not None:
+            # HLL registers are idempotent, so hashing each chunk's unique values suffices
+            self.distinct.update(pd.Series(chunk_counts.index, dtype=object))
+        self.counter.update_counts(chunk_counts)
+
+    def merge(self, other):
+        """Fold another categorical sketch into this one"""
+        if self.distinct is None and other.distinct is None:
+            seen = self.counter.counts.index.union(other.counter.counts.index, sort=False)
+            if len(seen) > self.counter.capacity:
+                self._start_distinct()
+        if self.distinct is not None or other.distinct is not None:
+            self._start_distinct()
+            other._start_distinct()
+            self.distinct.merge(other.distinct)
+        self.counter.merge(other.counter)
+
+    def top(self, n=None):
+        """Return {value: count} for the n most frequent values"""
+        return self.counter.top(n)
+
+    def distinct_count(self):
+        """Return {'distinct': n, 'approximate': bool} for this column"""
+        if self.distinct is None:
+            return {'distinct': len(self.counter.counts), 'approximate': False}
+        return {'distinct': self.distinct.estimate(), 'approximate': True}
+
+    def _start_distinct(self):
+        if self.distinct is None:
+            self.distinct = HyperLogLog(self.precision)
+            self.distinct.update(pd.Series(self.counter.counts.index, dtype=object))
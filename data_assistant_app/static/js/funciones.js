@@ -196,66 +196,21 @@ dynamicStyles.textContent = `
 `;
 document.head.appendChild(dynamicStyles);
 
-// ===== DATA EXTRACTION UTILITIES =====
-function extractColumnData(columnName) {
-    console.log('Extracting data for column:', columnName);
-    
-    const tableRows = document.querySelectorAll('#main-table tbody tr');
-    console.log('Found table rows:', tableRows.length);
-    
-    const data = [];
-    let columnIndex = -1;
-    
-    // Find column index
-    const headers = document.querySelectorAll('#main-table thead th');
-    console.log('Found headers:', headers.length);
-    
-    headers.forEach((header, index) => {
-        console.log(`Header ${index}: "${header.textContent.trim()}"`);
-        if (header.textContent.trim() === columnName) {
-            columnIndex = index;
-            console.log('Found column at index:', index);
-        }
-    });
-    
-    if (columnIndex === -1) {
-        console.log('Column not found, returning empty array');
-        return [];
-    }
-    
-    tableRows.forEach((row, rowIndex) => {
-        const cells = row.querySelectorAll('td');
-        if (cells[columnIndex]) {
-            const cellValue = cells[columnIndex].textContent.trim();
-            // Skip empty values but log them
-            if (cellValue === '' || cellValue === 'nan' || cellValue === 'NaN') {
-                console.log(`Row ${rowIndex}: Empty/NaN value skipped`);
-            } else {
-                data.push(cellValue);
-                console.log(`Row ${rowIndex}: "${cellValue}"`);
-            }
-        }
-    });
-    
-    console.log('Extracted data:', data);
-    return data;
-}
-
 // ===== CHART GENERATION =====
 function generateChart() {
     console.log('Chart generation initiated');
     
-    // Check if table exists
-    const table = document.getElementById('main-table');
-    if (!table) {
-        console.error('Table with ID "main-table" not found');
-        displayChartError('Data table not found. Please upload a file first.');
+    const chartContainer = document.getElementById('chartContainer');
+    if (!chartContainer) {
+        console.error('Chart container not found');
+        displayChartError('Chart data not available. Please upload a file first.');
         return;
     }
     
     const chartTypeSelect = document.getElementById('tipo_grafico');
     const xColumnSelect = document.getElementById('columna_x');
     const yColumnSelect = document.getElementById('columna_y');
+    const aggregationSelect = document.getElementById('agregacion');
     
     if (!chartTypeSelect || !xColumnSelect || !yColumnSelect) {
         console.error('Chart form elements not found');
@@ -266,41 +221,46 @@ function generateChart() {
     const chartType = chartTypeSelect.value;
     const xColumn = xColumnSelect.value;
     const yColumn = yColumnSelect.value;
-    const xLabels = extractColumnData(xColumn);
-    const yData = extractColumnData(yColumn).map(value => {
-        // Handle different number formats
-        const cleanValue = value.toString().replace(/[^\d.,-]/g, '').replace(',', '.');
-        const parsed = parseFloat(cleanValue);
-        console.log(`Converting "${value}" to "${cleanValue}" = ${parsed}`);
-        return parsed;
-    });
-
-    console.log('Chart parameters:', { 
-        type: chartType, 
-        xColumn, 
-        yColumn, 
-        labelCount: xLabels.length, 
-        dataCount: yData.length 
-    });
-
-    const validationError = validateChartData(chartType, xColumn, yColumn, xLabels, yData);
+    const aggregation = aggregationSelect ? aggregationSelect.value : 'mean';
+    
+    const validationError = validateChartSelection(chartType, xColumn, yColumn);
     if (validationError) {
         console.log('Chart validation failed:', validationError);
         displayChartError(validationError);
         return;
     }
-
-    cleanupPreviousChart();
-    createNewChart(chartType, xColumn, yColumn, xLabels, yData);
     
-    showTemporaryMessage('Chart generated successfully', 'success');
-    saveChartConfiguration(chartType, xColumn, yColumn, xLabels, yData);
+    // The server aggregates the whole dataset; the page only holds a preview
+    const params = new URLSearchParams({type: chartType, x: xColumn, agg: aggregation});
+    if (chartType !== 'histogram') {
+        params.append('y', yColumn);
+    }
+    
+    fetch(`${chartContainer.dataset.chartUrl}?${params}`)
+    .then(response => response.json())
+    .then(data => {
+        if (data.error) {
+            console.log('Chart request rejected:', data.error);
+            displayChartError(data.error);
+            return;
+        }
+        const chart = data.chart;
+        console.log('Chart data received:', {type: chart.type, points: chart.labels.length, rows: chart.rows, truncated: chart.truncated});
+        
+        cleanupPreviousChart();
+        createNewChart(chart);
+        
+        showTemporaryMessage('Chart generated successfully', 'success');
+        saveChartConfiguration(chart);
+    })
+    .catch(error => {
+        console.error('Chart request failed:', error);
+        displayChartError('Chart data could not be loaded. Please try again.');
+    });
 }
 
 function cleanupPreviousChart() {
     console.log('Cleaning up previous chart');
-    const canvas = document.getElementById('miGrafico');
-    const context = canvas.getContext('2d');
     
     if (window.currentChart) {
         console.log('Destroying previous chart instance');
@@ -311,36 +271,47 @@ function cleanupPreviousChart() {
     }
 }
 
-function createNewChart(chartType, xColumn, yColumn, xLabels, yData) {
+function createNewChart(chart) {
     console.log('Creating new chart instance');
     
     const canvas = document.getElementById('miGrafico');
     const context = canvas.getContext('2d');
+    const isScatter = chart.type === 'scatter';
+    const isHistogram = chart.type === 'histogram';
+    const datasetLabel = isHistogram
+        ? `${chart.x} (count)`
+        : isScatter ? `${chart.y} vs ${chart.x}` : `${chart.agg} of ${chart.y} by ${chart.x}`;
     
     const chartData = {
-        type: chartType === 'scatter' ? 'scatter' : chartType,
+        type: isHistogram ? 'bar' : chart.type,
         data: {
-            labels: chartType === 'scatter' ? undefined : xLabels,
+            labels: isScatter ? undefined : chart.labels,
             datasets: [{
-                label: `${yColumn} vs ${xColumn}`,
-                data: chartType === 'scatter'
-                    ? xLabels.map((x, i) => ({x: parseFloat(x.replace(',', '.')), y: yData[i]}))
-                    : yData,
+                label: datasetLabel,
+                data: isScatter
+                    ? chart.labels.map((x, i) => ({x: x, y: chart.values[i]}))
+                    : chart.values,
                 backgroundColor: 'rgba(54, 162, 235, 0.5)',
                 borderColor: 'rgba(54, 162, 235, 1)',
                 borderWidth: 1,
-                showLine: chartType === 'line' || chartType === 'scatter'
+                barPercentage: isHistogram ? 1.0 : 0.9,
+                categoryPercentage: isHistogram ? 1.0 : 0.8,
+                // Grid-aggregated scatter points grow with the rows they stand for
+                pointRadius: isScatter && chart.counts
+                    ? chart.counts.map(count => Math.min(2 + Math.log2(count), 10))
+                    : 3,
+                showLine: chart.type === 'line'
             }]
         },
         options: {
-            scales: chartType === 'scatter' ? {
+            scales: isScatter ? {
                 x: { 
                     type: 'linear', 
                     position: 'bottom', 
-                    title: { display: true, text: xColumn } 
+                    title: { display: true, text: chart.x } 
                 },
                 y: { 
-                    title: { display: true, text: yColumn } 
+                    title: { display: true, text: chart.y } 
                 }
             } : {}
         }
@@ -350,65 +321,15 @@ function createNewChart(chartType, xColumn, yColumn, xLabels, yData) {
 }
 
 // ===== DATA VALIDATION =====
-function validateChartData(chartType, xColumn, yColumn, xLabels, yData) {
-    if (xColumn === yColumn) {
-        return 'Cannot use the same column for both axes';
-    }
-
-    if (xLabels.length === 0) {
-        return `No data found for X-axis column "${xColumn}". Please check if the column exists and contains data.`;
+function validateChartSelection(chartType, xColumn, yColumn) {
+    if (!xColumn) {
+        return 'Please select a column for the X-axis.';
     }
     
-    if (yData.length === 0) {
-        return `No data found for Y-axis column "${yColumn}". Please check if the column exists and contains data.`;
-    }
-
-    if (xLabels.length !== yData.length) {
-        return `Data mismatch: X-axis has ${xLabels.length} values, Y-axis has ${yData.length} values.`;
+    if (chartType !== 'histogram' && xColumn === yColumn) {
+        return 'Cannot use the same column for both axes';
     }
     
-    // Check for valid numeric data in Y-axis
-    const validNumericData = yData.filter(value => !isNaN(value));
-    if (validNumericData.length === 0) {
-        return `No valid numeric data found in Y-axis column "${yColumn}". Please select a column with numeric values.`;
-    }
-
-    if (chartType === 'bar') {
-        const numericValues = yData.filter(value => !isNaN(value));
-        if (numericValues.length === 0) {
-            return `INCOMPATIBLE DATA FOR BAR CHART
-
-To create a bar chart you need:
-• X-axis: Categories (text)
-• Y-axis: Numeric values (numbers)
-
-Valid examples:
-• Name vs Income
-• City vs Average Age
-• Gender vs Average Income
-
-Your current selection is not compatible.`;
-        }
-    } else if (chartType === 'scatter') {
-        const xNumeric = xLabels.filter(value => !isNaN(parseFloat(value.replace(',', '.'))));
-        const yNumeric = yData.filter(value => !isNaN(value));
-        
-        if (xNumeric.length === 0 || yNumeric.length === 0) {
-            return `INCOMPATIBLE DATA FOR SCATTER PLOT
-
-To create a scatter plot you need:
-• X-axis: Numeric values (numbers)
-• Y-axis: Numeric values (numbers)
-
-Valid examples:
-• Age vs Income
-• Height vs Weight
-• Temperature vs Humidity
-
-Your current selection is not compatible.`;
-        }
-    }
-
     return null;
 }
 
@@ -461,13 +382,13 @@ function createErrorElement(message) {
 }
 
 // ===== CHART CONFIGURATION SAVING =====
-function saveChartConfiguration(chartType, xColumn, yColumn, xLabels, yData) {
+function saveChartConfiguration(chart) {
+    // Only the spec is saved; the server regenerates the data for exports
     const chartConfig = {
-        type: chartType,
-        xColumn: xColumn,
-        yColumn: yColumn,
-        labels: xLabels,
-        data: yData
+        type: chart.type,
+        x: chart.x,
+        y: chart.y,
+        agg: chart.agg
     };
     
     const formData = new FormData();
@@ -540,6 +461,102 @@ function setupDragAndDrop(uploadArea, fileInput, uploadForm) {
     });
 }
 
+// ===== UPLOAD JOB PROGRESS =====
+function initializeJobPolling() {
+    const jobStatus = document.getElementById('jobStatus');
+    
+    if (!jobStatus) return;
+    
+    const statusUrl = jobStatus.dataset.statusUrl;
+    const filename = jobStatus.dataset.filename;
+    const progressElement = document.getElementById('jobProgress');
+    
+    function poll() {
+        fetch(statusUrl)
+        .then(response => response.json())
+        .then(job => {
+            if (job.status === 'done') {
+                window.location.href = '?file=' + encodeURIComponent(filename);
+                return;
+            }
+            if (job.status === 'failed' || job.error) {
+                showTemporaryMessage(job.error || 'File processing failed', 'error');
+                progressElement.textContent = job.error || '';
+                return;
+            }
+            
+            const progress = job.progress !== null ? ` ${job.progress}% (${job.processed_rows} rows)` : '';
+            progressElement.textContent = job.stage + progress;
+            setTimeout(poll, 1000);
+        })
+        .catch(error => {
+            console.error('Job status request failed:', error);
+            setTimeout(poll, 3000);
+        });
+    }
+    
+    poll();
+}
+
+// ===== ROW BROWSER =====
+function initializeRowBrowser() {
+    const rowBrowser = document.getElementById('rowBrowser');
+    
+    if (!rowBrowser) return;
+    
+    const rowsUrl = rowBrowser.dataset.rowsUrl;
+    const pageRows = 20;
+    const table = document.getElementById('rowBrowserTable');
+    const rangeElement = document.getElementById('rowBrowserRange');
+    const prevButton = document.getElementById('rowBrowserPrev');
+    const nextButton = document.getElementById('rowBrowserNext');
+    let offset = 0;
+    
+    function renderPage(page) {
+        const head = document.createElement('tr');
+        page.columns.forEach(column => {
+            const th = document.createElement('th');
+            th.textContent = column;
+            head.appendChild(th);
+        });
+        table.tHead.replaceChildren(head);
+        
+        const rows = page.rows.map(values => {
+            const tr = document.createElement('tr');
+            values.forEach(value => {
+                const td = document.createElement('td');
+                td.textContent = value === null ? 'NaN' : value;
+                tr.appendChild(td);
+            });
+            return tr;
+        });
+        table.tBodies[0].replaceChildren(...rows);
+        
+        const first = page.rows.length ? page.offset + 1 : 0;
+        rangeElement.textContent = `${first}-${page.offset + page.rows.length} / ${page.total_rows}`;
+        prevButton.disabled = page.offset === 0;
+        nextButton.disabled = page.next_offset === null;
+    }
+    
+    function load(newOffset) {
+        fetch(`${rowsUrl}?offset=${newOffset}&limit=${pageRows}`)
+        .then(response => response.json())
+        .then(page => {
+            if (page.error) {
+                showTemporaryMessage(page.error, 'error');
+                return;
+            }
+            offset = page.offset;
+            renderPage(page);
+        })
+        .catch(error => console.error('Row preview request failed:', error));
+    }
+    
+    prevButton.addEventListener('click', () => load(Math.max(offset - pageRows, 0)));
+    nextButton.addEventListener('click', () => load(offset + pageRows));
+    load(0);
+}
+
 // ===== TEMPORARY MESSAGE INITIALIZATION =====
 function initializeTemporaryMessages() {
     const temporaryMessages = document.querySelectorAll('.temporary-message');
@@ -566,6 +583,12 @@ document.addEventListener('DOMContentLoaded', function() {
     // Initialize temporary messages
     initializeTemporaryMessages();
     
+    // Follow a running upload job
+    initializeJobPolling();
+    
+    // Page through the rows of the loaded dataset
+    initializeRowBrowser();
+    
     console.log('All functions initialized successfully');
 });
 
@@ -0,0 +1,219 @@
+"""
+Data Assistant App - Streaming Analysis
+
+Builds the same result as DataLoader.analyze_dataset by folding chunks into
+mergeable accumulators, so files larger than memory can be analyzed
+without ever materializing the full DataFrame.
+"""
+
+import warnings
+import numpy as np
+import pandas as pd
+import logging
+from .numeric_stats import STAT_KEYS, QUANTILE_PROBS
+from .sketches import QuantileSketch, CategoricalSketch, DEFAULT_SKETCH_EPSILON, DEFAULT_TOPK_CAPACITY
+
+logger = logging.getLogger(__name__)
+
+
+class NumericAccumulator:
+    """Count, Welford mean/variance, min/max and quantile sketch for one column"""
+
+    def __init__(self, epsilon=DEFAULT_SKETCH_EPSILON):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.sketch = QuantileSketch(epsilon=epsilon)
+
+    def update(self, values):
+        """Add a float64 array of values (NaN = missing)"""
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        chunk = NumericAccumulator(self.sketch.epsilon)
+        chunk.count = values.size
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(((values - chunk.mean) ** 2).sum())
+        chunk.minimum = float(values.min())
+        chunk.maximum = float(values.max())
+        self._merge_moments(chunk)
+        self.sketch.update(values)
+
+    def merge(self, other):
+        """Fold another accumulator into this one"""
+        self._merge_moments(other)
+        self.sketch.merge(other.sketch)
+
+    def _merge_moments(self, other):
+        # Chan et al. parallel combination of Welford moments
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def stats(self):
+        """Return the numeric_stats entry for this column"""
+        if self.count == 0:
+            return {key: float('nan') for key in STAT_KEYS}
+        q1, median, q3 = self.sketch.quantiles(QUANTILE_PROBS)
+        std = (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else float('nan')
+        return {
+            'mean': float(self.mean),
+            'median': median,
+            'std': float(std),
+            'min': float(self.minimum),
+            'max': float(self.maximum),
+            'q1': q1,
+            'q3': q3,
+        }
+
+
+class StreamingAnalyzer:
+    """Folds DataFrame chunks into an analyze_dataset-compatible result.
+
+    Column kinds (numeric or categorical) are fixed by the first chunk that
+    contains the column; later chunks are coerced to that kind.
+    """
+
+    def __init__(self, max_missing_examples=50, sketch_epsilon=DEFAULT_SKETCH_EPSILON,
+                 topk_capacity=DEFAULT_TOPK_CAPACITY, top_k=None):
+        self.max_missing_examples = max_missing_examples
+        self.sketch_epsilon = sketch_epsilon
+        self.topk_capacity = topk_capacity
+        self.top_k = top_k
+        self.rows = 0
+        self.columns = []
+        self.dtypes = {}
+        self.null_counts = {}
+        self.incomplete_rows = 0
+        self.rows_with_missing = []
+        self.numeric = {}
+        self.categorical = {}
+
+    def update(self, chunk):
+        """Fold one DataFrame chunk into the accumulators"""
+        self._register_columns(chunk)
+        self.rows += len(chunk)
+
+        null_mask = chunk.isnull()
+        for col, nulls in null_mask.sum().items():
+            self.null_counts[col] += int(nulls)
+        self._collect_missing_rows(chunk, null_mask.to_numpy())
+
+        for col, accumulator in self.numeric.items():
+            values = chunk[col]
+            if not pd.api.types.is_numeric_dtype(values):
+                values = pd.to_numeric(values, errors='coerce')
+            accumulator.update(values.to_numpy(dtype=np.float64, na_value=np.nan))
+
+        for col, sketch in self.categorical.items():
+            sketch.update(chunk[col])
+
+    def merge(self, other):
+        """Fold the analyzer of a later range of rows into this one"""
+        for col in other.columns:
+            if col not in self.dtypes:
+                self.columns.append(col)
+                self.dtypes[col] = other.dtypes[col]
+                self.null_counts[col] = 0
+            else:
+                self.dtypes[col] = _combine_dtype(self.dtypes[col], other.dtypes[col])
+            self.null_counts[col] += other.null_counts[col]
+
+        for col, accumulator in other.numeric.items():
+            if col in self.numeric:
+                self.numeric[col].merge(accumulator)
+            elif col not in self.categorical:
+                self.numeric[col] = accumulator
+
+        for col, sketch in other.categorical.items():
+            if col in self.categorical:
+                self.categorical[col].merge(sketch)
+            elif col not in self.numeric:
+                self.categorical[col] = sketch
+
+        room = self.max_missing_examples - len(self.rows_with_missing)
+        self.rows_with_missing.extend(other.rows_with_missing[:max(room, 0)])
+        self.incomplete_rows += other.incomplete_rows
+        self.rows += other.rows
+
+    def result(self):
+        """Return the analysis dictionary in the analyze_dataset layout"""
+        return {
+            'summary': {
+                'rows': self.rows,
+                'columns': len(self.columns),
+                'data_types': {col: str(self.dtypes[col]) for col in self.columns}
+            },
+            'missing_values': {
+                'total': int(sum(self.null_counts.values())),
+                'by_column': dict(self.null_counts),
+                'incomplete_rows': self.incomplete_rows
+            },
+            'rows_with_missing': self.rows_with_missing,
+            'numeric_stats': {
+                col: self.numeric[col].stats() for col in self.columns if col in self.numeric
+            },
+            'categorical_freqs': {
+                col: self.categorical[col].top(self.top_k) for col in self.columns if col in self.categorical
+            },
+            'categorical_distinct': {
+                col: self.categorical[col].distinct_count() for col in self.columns if col in self.categorical
+            },
+            'quantiles': {
+                'method': 'approx',
+                'rank_error': max((acc.sketch.error_bound for acc in self.numeric.values()), default=0.0)
+            }
+        }
+
+    def _register_columns(self, chunk):
+        for col, dtype in chunk.dtypes.items():
+            if col not in self.dtypes:
+                self.columns.append(col)
+                self.dtypes[col] = dtype
+                self.null_counts[col] = 0
+                if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                    self.numeric[col] = NumericAccumulator(self.sketch_epsilon)
+                elif pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+                    self.categorical[col] = CategoricalSketch(self.topk_capacity)
+            elif dtype != self.dtypes[col]:
+                combined = _combine_dtype(self.dtypes[col], dtype)
+                if col in self.numeric and not pd.api.types.is_numeric_dtype(combined):
+                    logger.warning(f"Column {col} changed type to {dtype} while streaming; coercing to numeric")
+                self.dtypes[col] = combined
+
+    def _collect_missing_rows(self, chunk, mask):
+        row_has_missing = mask.any(axis=1)
+        self.incomplete_rows += int(row_has_missing.sum())
+
+        room = self.max_missing_examples - len(self.rows_with_missing)
+        if room <= 0:
+            return
+        positions = np.flatnonzero(row_has_missing)[:room]
+        examples = chunk.iloc[positions]
+        columns = chunk.columns
+        for label, values, missing in zip(examples.index, examples.itertuples(index=False, name=None), mask[positions]):
+            self.rows_with_missing.append({
+                'index': label,
+                'missing_columns': columns[missing].tolist(),
+                'available_data': {col: value for col, value, is_missing in zip(columns, values, missing) if not is_missing}
+            })
+
+
+def _combine_dtype(first, second):
+    """Common dtype of a column seen with different dtypes in different chunks"""
+    if first == second:
+        return first
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        try:
+            return np.result_type(first, second)
+        except TypeError:
+            return np.dtype(object)
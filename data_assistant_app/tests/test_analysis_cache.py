@@ -0,0 +1,64 @@
+import os
+import time
+import tempfile
+import pandas as pd
+from django.test import TestCase, override_settings
+from ..analysis_cache import AnalysisCache, DEFAULT_ANALYSIS_OPTIONS
+
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'analysis': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'analysis-tests'},
+}
+
+@override_settings(CACHES=TEST_CACHES)
+class TestAnalysisCache(TestCase):
+    """Test cases for the analysis result cache"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.cache = AnalysisCache(defaults=DEFAULT_ANALYSIS_OPTIONS)
+        self.cache.backend.clear()
+        self.calls = []
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            pd.DataFrame({'a': [1, 2, None]}).to_csv(f.name, index=False)
+            self.temp_file = f.name
+
+    def tearDown(self):
+        os.unlink(self.temp_file)
+
+    def compute(self):
+        self.calls.append(1)
+        return {'summary': {'rows': 3}, 'call': len(self.calls)}
+
+    def test_repeated_lookups_do_not_recompute(self):
+        """The same file, strategy and options are analyzed once"""
+        first = self.cache.get_or_compute(self.temp_file, self.compute)
+        second = self.cache.get_or_compute(self.temp_file, self.compute)
+        cleaned = self.cache.get_or_compute(self.temp_file, self.compute, strategy='fill_mean')
+        approx = self.cache.get_or_compute(self.temp_file, self.compute, quantiles='approx')
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual((cleaned['call'], approx['call']), (2, 3))
+
+    def test_modified_file_is_analyzed_again(self):
+        """Changing the file invalidates its cached analysis"""
+        self.cache.get_or_compute(self.temp_file, self.compute)
+        time.sleep(0.01)
+        pd.DataFrame({'a': [1, 2, 3, 4]}).to_csv(self.temp_file, index=False)
+
+        self.assertEqual(self.cache.get_or_compute(self.temp_file, self.compute)['call'], 2)
+
+    def test_default_options_and_settings_in_key(self):
+        """Omitted options match their defaults; settings shaping the analysis change the key"""
+        first = self.cache.get_or_compute(self.temp_file, self.compute)
+        exact = self.cache.get_or_compute(self.temp_file, self.compute, quantiles='exact')
+        with override_settings(CATEGORICAL_TOP_K=5):
+            top_k = self.cache.get_or_compute(self.temp_file, self.compute)
+        with override_settings(QUANTILE_SKETCH_EPSILON=0.05):
+            epsilon = self.cache.get_or_compute(self.temp_file, self.compute)
+        with override_settings(DATASET_OPTIMIZE_MEMORY=True):
+            optimized = self.cache.get_or_compute(self.temp_file, self.compute)
+
+        self.assertEqual(exact, first)
+        self.assertEqual((top_k['call'], epsilon['call'], optimized['call']), (2, 3, 4))
@@ -0,0 +1,104 @@
+import os
+import json
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from django.test import TestCase, override_settings
+from ..charts import ChartAggregator
+
+class TestChartAggregator(TestCase):
+    """Test cases for chart aggregation over whole datasets"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.df = pd.DataFrame({
+            'Ciudad': np.tile(['Lima', 'Quito', 'Cali', 'Lima'], 250),
+            'Edad': np.tile([30.0, np.nan, 20.0, 40.0], 250),
+            'Ingreso': np.arange(1000, dtype='float64'),
+        })
+
+    def test_bar_groups_all_rows(self):
+        """Bar charts aggregate y by category over every row"""
+        mean = ChartAggregator.aggregate(self.df, 'bar', 'Ciudad', 'Edad')
+        total = ChartAggregator.aggregate(self.df, 'bar', 'Ciudad', 'Edad', agg='sum')
+
+        self.assertEqual(mean['labels'], ['Cali', 'Lima'])
+        self.assertEqual(mean['values'], [20.0, 35.0])
+        self.assertEqual(mean['rows'], 750)
+        self.assertEqual(total['values'], [5000.0, 17500.0])
+        # Truncation keeps the most frequent categories, not the highest values
+        frequent = ChartAggregator.aggregate(self.df, 'bar', 'Ciudad', 'Ingreso', agg='min', max_points=1)
+        self.assertEqual((frequent['labels'], frequent['truncated']), (['Lima'], True))
+        with self.assertRaises(ValueError):
+            ChartAggregator.aggregate(self.df, 'bar', 'Edad', 'Ciudad')
+        with self.assertRaises(ValueError):
+            ChartAggregator.aggregate(self.df, 'pie', 'Ciudad', 'Edad')
+
+    def test_points_are_bounded(self):
+        """Line and scatter charts are downsampled to max_points; histograms count every value"""
+        line = ChartAggregator.aggregate(self.df, 'line', 'Ingreso', 'Edad', max_points=50)
+        scatter = ChartAggregator.aggregate(self.df, 'scatter', 'Ingreso', 'Edad', max_points=50)
+        histogram = ChartAggregator.aggregate(self.df, 'histogram', 'Ingreso', bins=10)
+
+        self.assertEqual(len(line['labels']), 50)
+        self.assertTrue(line['truncated'])
+        self.assertLessEqual(len(scatter['values']), 50)
+        self.assertEqual(sum(scatter['counts']), 750)
+        self.assertTrue(scatter['truncated'])
+        self.assertEqual(histogram['values'], [100] * 10)
+        self.assertIsNone(histogram['y'])
+
+    def test_spec_and_filters(self):
+        """Specs are validated and normalized; filters restrict the aggregated rows"""
+        spec = ChartAggregator.spec({'type': 'bar', 'xColumn': 'Ciudad', 'yColumn': 'Edad', 'labels': list(range(1000)), 'filters': {'Ciudad': ['Lima', 'Cali']}})
+        chart = ChartAggregator.from_spec(self.df, dict(spec, filters={'Ciudad': ['Lima']}))
+
+        self.assertEqual(spec, {'type': 'bar', 'x': 'Ciudad', 'y': 'Edad', 'agg': 'mean', 'bins': 20, 'filters': {'Ciudad': ['Cali', 'Lima']}})
+        self.assertEqual(chart['labels'], ['Lima'])
+        self.assertEqual(chart['rows'], 500)
+        self.assertIsNone(ChartAggregator.spec({'type': 'histogram', 'x': 'Ingreso', 'y': 'Edad'})['y'])
+        with self.assertRaises(ValueError):
+            ChartAggregator.spec({'type': 'bar'})
+        with self.assertRaises(ValueError):
+            ChartAggregator.from_spec(self.df, dict(spec, filters={'Pais': ['Peru']}))
+
+
+class TestChartApi(TestCase):
+    """Test cases for the /api/chart/ endpoint"""
+
+    def setUp(self):
+        """Set up an isolated media directory with one dataset"""
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        pd.DataFrame({'a': range(30), 'b': ['x', 'y', 'z'] * 10}).to_csv(os.path.join(self.media_root, 'datos.csv'), index=False)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root)
+
+    def test_chart_endpoint(self):
+        """The endpoint aggregates the file and validates the chart spec"""
+        response = self.client.get('/api/chart/datos.csv/', {'type': 'bar', 'x': 'b', 'y': 'a', 'agg': 'sum'})
+        cached = self.client.get('/api/chart/datos.csv/', {'type': 'bar', 'x': 'b', 'y': 'a', 'agg': 'sum'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['chart']['labels'], ['x', 'y', 'z'])
+        self.assertEqual(response.json()['chart']['values'], [135, 145, 155])
+        self.assertEqual(cached.json(), response.json())
+        self.assertEqual(self.client.get('/api/chart/datos.csv/', {'type': 'bar', 'x': 'b', 'y': 'c'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/chart/datos.csv/', {'type': 'histogram', 'x': 'a', 'bins': 'x'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/chart/otro.csv/', {'x': 'a'}).status_code, 404)
+
+    def test_session_keeps_spec_only(self):
+        """Saving a chart stores its compact spec, whatever the size of the posted data"""
+        chart_data = {'type': 'line', 'x': 'a', 'y': 'b', 'agg': 'sum', 'labels': list(range(10000)), 'data': list(range(10000))}
+        response = self.client.post('/', {'action': 'save_chart', 'chart_data': json.dumps(chart_data)})
+        filtered = self.client.get('/api/chart/datos.csv/', {'type': 'histogram', 'x': 'a', 'bins': 3, 'filters': '{"b": ["x"]}'})
+
+        self.assertEqual(response.json()['status'], 'success')
+        spec = self.client.session['current_chart']
+        self.assertEqual(spec, {'type': 'line', 'x': 'a', 'y': 'b', 'agg': 'sum', 'bins': 20, 'filters': {}})
+        self.assertLess(len(json.dumps(spec)), 200)
+        self.assertEqual(sum(filtered.json()['chart']['values']), 10)
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+from django.test import TestCase
+from ..cleaning import CleaningEngine, REPORT_ATTR
+
+class TestCleaningEngine(TestCase):
+    """Test cases for the vectorized cleaning engine"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.df = pd.DataFrame({
+            'Edad': [25, np.nan, 35, np.nan, 45],
+            'Ingresos': [1000.0, 2000.0, 3000.0, 4000.0, 5000.0],
+            'Ciudad': ['Lima', None, 'Quito', 'Lima', None],
+            'Sector': pd.Categorical(['A', 'B', None, 'B', 'A']),
+        })
+        self.original = self.df.copy()
+
+    def test_fill_strategies_report_changed_cells(self):
+        """All fill values are applied at once and counted per column"""
+        cleaned, report = CleaningEngine.clean(self.df, 'fill_mode')
+
+        self.assertEqual(cleaned['Edad'].tolist(), [25, 35, 35, 35, 45])
+        self.assertEqual(cleaned['Ciudad'].tolist(), ['Lima', 'Lima', 'Quito', 'Lima', 'Lima'])
+        self.assertEqual(cleaned['Sector'].tolist(), ['A', 'B', 'A', 'B', 'A'])
+        self.assertEqual(report['columns'], {'Edad': 2, 'Ciudad': 2, 'Sector': 1})
+        self.assertEqual((report['filled_values'], report['modified_rows']), (5, 4))
+        self.assertIs(cleaned.attrs[REPORT_ATTR], report)
+
+        cleaned, report = CleaningEngine.clean(self.df, 'fill_mean')
+        self.assertEqual(cleaned['Edad'].tolist(), [25, 35, 35, 35, 45])
+        self.assertEqual(report['columns'], {'Edad': 2})
+
+    def test_original_is_not_modified(self):
+        """Cleaning leaves the input frame and its untouched columns alone"""
+        cleaned, _ = CleaningEngine.clean(self.df, 'fill_zero')
+
+        pd.testing.assert_frame_equal(self.df, self.original)
+        self.assertNotIn(REPORT_ATTR, self.df.attrs)
+        if pd.get_option('mode.copy_on_write'):
+            self.assertTrue(np.shares_memory(cleaned['Ingresos'].to_numpy(), self.df['Ingresos'].to_numpy()))
+
+    def test_chained_strategies_accumulate_report(self):
+        """A cleaned frame cleaned again reports every step"""
+        cleaned, _ = CleaningEngine.clean(self.df, 'fill_zero')
+        cleaned, report = CleaningEngine.clean(cleaned, 'remove_missing')
+
+        self.assertEqual(report['strategy'], 'fill_zero+remove_missing')
+        self.assertEqual(report['removed_rows'], 3)
+        self.assertEqual(report['columns'], {'Edad': 2})
+        self.assertEqual(len(cleaned), 2)
+        with self.assertRaises(ValueError):
+            CleaningEngine.clean(self.df, 'invalid_strategy')
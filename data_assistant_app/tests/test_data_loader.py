@@ -3,8 +3,9 @@ import pandas as pd
 import numpy as np
 import tempfile
 import os
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from ..data_loader import DataLoader
+from ..sidecar import ColumnarSidecar
 
 class TestDataLoader(TestCase):
     """Test cases for DataLoader functionality"""
@@ -40,6 +41,32 @@ class TestDataLoader(TestCase):
         self.assertIn('Name', analysis['categorical_freqs'])
         self.assertIn('City', analysis['categorical_freqs'])
     
+    def test_analyze_dataset_missing_rows(self):
+        """Test incomplete row examples and their cap"""
+        analysis = DataLoader.analyze_dataset(self.df, max_missing_examples=2)
+        
+        self.assertEqual(analysis['missing_values']['incomplete_rows'], 3)
+        self.assertEqual(len(analysis['rows_with_missing']), 2)
+        
+        first = analysis['rows_with_missing'][0]
+        self.assertEqual(first['index'], 2)
+        self.assertEqual(first['missing_columns'], ['Age'])
+        self.assertEqual(first['available_data'], {'Name': 'Bob', 'Income': 45000, 'City': 'Chicago'})
+    
+    def test_analyze_dataset_numeric_stats_match_pandas(self):
+        """Test fused numeric statistics against per-column pandas reductions"""
+        analysis = DataLoader.analyze_dataset(self.df)
+        
+        for col in ['Age', 'Income']:
+            stats = analysis['numeric_stats'][col]
+            self.assertAlmostEqual(stats['mean'], self.df[col].mean())
+            self.assertAlmostEqual(stats['median'], self.df[col].median())
+            self.assertAlmostEqual(stats['std'], self.df[col].std())
+            self.assertAlmostEqual(stats['min'], self.df[col].min())
+            self.assertAlmostEqual(stats['max'], self.df[col].max())
+            self.assertAlmostEqual(stats['q1'], self.df[col].quantile(0.25))
+            self.assertAlmostEqual(stats['q3'], self.df[col].quantile(0.75))
+    
     def test_clean_dataset_remove_missing(self):
         """Test remove missing values strategy"""
         cleaned_df = DataLoader.clean_dataset(self.df.copy(), 'remove_missing')
@@ -86,6 +113,40 @@ class TestDataLoader(TestCase):
         finally:
             os.unlink(temp_file)
     
+    def test_load_dataset_uses_fresh_sidecar(self):
+        """Test that a columnar sidecar is used until the source changes"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            self.df.to_csv(f.name, index=False)
+            temp_file = f.name
+        
+        try:
+            ColumnarSidecar.write(temp_file, self.df.head(2))
+            self.assertEqual(len(DataLoader.load_dataset(temp_file)), 2)
+            
+            # Rewriting the source makes the sidecar stale
+            self.df.to_csv(temp_file, index=False, sep=',', lineterminator='\r\n')
+            self.assertTrue(DataLoader.load_dataset(temp_file).equals(self.df))
+        finally:
+            ColumnarSidecar.remove(temp_file)
+            os.unlink(temp_file)
+    
+    def test_sidecar_is_stale_after_settings_change(self):
+        """A sidecar written under other parser or memory settings is not served"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            self.df.to_csv(f.name, index=False)
+            temp_file = f.name
+        
+        try:
+            ColumnarSidecar.write(temp_file, self.df.head(2))
+            with override_settings(CSV_PARSER_ENGINE='c'):
+                self.assertIsNone(ColumnarSidecar.read(temp_file))
+            with override_settings(DATASET_OPTIMIZE_MEMORY=True):
+                self.assertIsNone(ColumnarSidecar.read(temp_file))
+            self.assertEqual(len(ColumnarSidecar.read(temp_file)), 2)
+        finally:
+            ColumnarSidecar.remove(temp_file)
+            os.unlink(temp_file)
+    
     def test_load_dataset_unsupported_format(self):
         """Test handling of unsupported file format"""
         with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
@@ -0,0 +1,85 @@
+import time
+import threading
+import pandas as pd
+import tempfile
+import os
+from django.test import TestCase
+from ..dataset_cache import DatasetCache
+from ..data_loader import DataLoader
+
+class TestDatasetCache(TestCase):
+    """Test cases for the parsed dataset cache"""
+
+    def setUp(self):
+        """Create a temporary CSV file"""
+        self.df = pd.DataFrame({'Name': ['John', 'Jane', None], 'Age': [25, None, 35]})
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            self.df.to_csv(f.name, index=False)
+            self.temp_file = f.name
+
+    def tearDown(self):
+        os.unlink(self.temp_file)
+
+    def test_hit_after_first_load(self):
+        """Second load of an unchanged file is served from the cache"""
+        cache = DatasetCache(max_bytes=10 * 1024 * 1024)
+        first = cache.get_or_load(self.temp_file, DataLoader.load_dataset)
+        second = cache.get_or_load(self.temp_file, DataLoader.load_dataset)
+
+        self.assertIs(first, second)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_modified_file_is_reloaded(self):
+        """Changing the file contents invalidates the cached version"""
+        cache = DatasetCache(max_bytes=10 * 1024 * 1024)
+        cache.get_or_load(self.temp_file, DataLoader.load_dataset)
+
+        self.df.head(1).to_csv(self.temp_file, index=False)
+        reloaded = cache.get_or_load(self.temp_file, DataLoader.load_dataset)
+
+        self.assertEqual(len(reloaded), 1)
+        self.assertEqual(cache.stats()['entries'], 1)
+        self.assertEqual(cache.stats()['misses'], 2)
+
+    def test_eviction_respects_memory_budget(self):
+        """Least recently used datasets are evicted when over budget"""
+        size = int(self.df.memory_usage(deep=True).sum())
+        cache = DatasetCache(max_bytes=size + 1)
+        loader = lambda path: pd.DataFrame(self.df)
+
+        cache.get_or_load(self.temp_file, loader)
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            other_file = f.name
+        try:
+            cache.get_or_load(other_file, loader)
+        finally:
+            os.unlink(other_file)
+
+        stats = cache.stats()
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertLessEqual(stats['bytes'], stats['max_bytes'])
+
+    def test_concurrent_misses_parse_once(self):
+        """Concurrent misses on one file share a single parse and byte count"""
+        cache = DatasetCache(max_bytes=10 * 1024 * 1024)
+        calls = []
+
+        def slow_loader(path):
+            calls.append(path)
+            time.sleep(0.2)
+            return DataLoader.load_dataset(path)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load(self.temp_file, slow_loader))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(cache.stats()['bytes'], int(results[0].memory_usage(deep=True).sum()))
+        cache.invalidate(self.temp_file)
+        self.assertEqual(cache.stats()['bytes'], 0)
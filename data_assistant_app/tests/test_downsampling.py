@@ -0,0 +1,66 @@
+import numpy as np
+from unittest import mock
+from django.test import TestCase
+from reportlab.platypus import Image
+from ..downsampling import Downsampler
+from ..pdf_generator import PDFGenerator
+
+class TestDownsampler(TestCase):
+    """Test cases for chart downsampling"""
+
+    def test_lttb_keeps_shape(self):
+        """LTTB keeps the requested number of points, the endpoints and the extremes"""
+        x = np.arange(10000, dtype='float64')
+        y = np.sin(x / 500.0)
+        y[4321] = 50.0
+
+        indices = Downsampler.lttb(x, y, 200)
+
+        self.assertEqual(len(indices), 200)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 9999)
+        self.assertIn(4321, indices)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertEqual(len(Downsampler.lttb(x[:50], y[:50], 200)), 50)
+
+    def test_line_points_sort_and_drop_missing(self):
+        """Line series are sorted by x, without missing values, and bounded"""
+        x, y = Downsampler.line_points([3, 1, np.nan, 2], [30, 10, 5, np.nan])
+
+        self.assertEqual(x.tolist(), [1.0, 3.0])
+        self.assertEqual(y.tolist(), [10.0, 30.0])
+        self.assertEqual(len(Downsampler.line_points(np.arange(5000), np.arange(5000), 100)[0]), 100)
+
+    def test_scatter_grid_aggregation(self):
+        """Dense scatter plots are reduced to weighted grid cells"""
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=50000), rng.normal(size=50000)
+
+        grid_x, grid_y, counts = Downsampler.scatter_points(x, y, 400)
+        small = Downsampler.scatter_points(x[:10], y[:10], 400)
+
+        self.assertLessEqual(len(counts), 400)
+        self.assertEqual(counts.sum(), 50000)
+        self.assertAlmostEqual(np.average(grid_x, weights=counts), x.mean())
+        self.assertEqual(small[2].tolist(), [1] * 10)
+
+
+class TestScatterRendering(TestCase):
+    """Test cases for scatter plots in PDF reports"""
+
+    def test_aggregated_points_are_drawn_as_given(self):
+        """Grid-aggregated points from the chart API are not downsampled again"""
+        generator = PDFGenerator()
+        chart = {'x_data': [1.0, 2.0, 3.0], 'y_data': [4.0, 5.0, 6.0], 'counts': [10, 1, 3]}
+        with mock.patch.object(Downsampler, 'scatter_points') as scatter_points:
+            elements = generator._render_scatter_chart(chart)
+
+        scatter_points.assert_not_called()
+        self.assertIsInstance(elements[0], Image)
+
+    def test_no_finite_points(self):
+        """A chart without finite points is reported instead of failing"""
+        generator = PDFGenerator()
+        for counts in (None, [1, 1]):
+            elements = generator._render_scatter_chart({'x_data': ['a', None], 'y_data': [1.0, 2.0], 'counts': counts})
+            self.assertEqual(elements[0].text, "Incompatible data for scatter plot")
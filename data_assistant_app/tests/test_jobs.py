@@ -0,0 +1,77 @@
+import time
+import shutil
+import tempfile
+from django.test import TestCase, override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from ..jobs import JobQueue, job_queue, DONE, FAILED
+
+def wait_for(job, timeout=10):
+    deadline = time.time() + timeout
+    while job.status not in (DONE, FAILED) and time.time() < deadline:
+        time.sleep(0.02)
+    return job
+
+class TestJobQueue(TestCase):
+    """Test cases for the in-process background job queue"""
+
+    def setUp(self):
+        """Set up a private queue"""
+        self.queue = JobQueue(workers=1)
+
+    def tearDown(self):
+        self.queue.shutdown()
+
+    def test_job_reports_progress_and_result(self):
+        """Jobs expose their stage, row progress and return value"""
+        def work(job, total):
+            job.set_stage('counting')
+            job.report_progress(total // 2, 512, 1024)
+            return {'rows': total}
+
+        job = wait_for(self.queue.submit('test', work, 10))
+
+        self.assertEqual(job.status, DONE)
+        self.assertEqual(job.progress, 50.0)
+        self.assertEqual(job.result, {'rows': 10})
+        self.assertIs(self.queue.get(job.id), job)
+
+    def test_failed_job_keeps_error(self):
+        """Exceptions are stored on the job instead of propagating"""
+        def work(job):
+            job.set_stage('parsing')
+            raise ValueError('bad file')
+
+        job = wait_for(self.queue.submit('test', work))
+
+        self.assertEqual(job.status, FAILED)
+        self.assertEqual(job.error, 'bad file')
+        self.assertEqual(job.to_dict()['stage'], 'parsing')
+
+
+class TestUploadJobApi(TestCase):
+    """Test cases for asynchronous uploads through the API"""
+
+    def setUp(self):
+        """Set up an isolated media directory"""
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root)
+
+    def test_upload_returns_job_and_result(self):
+        """Upload answers 202 at once and the job result is polled afterwards"""
+        upload = SimpleUploadedFile('data.csv', b'a,b\n1,x\n2,\n3,z\n', content_type='text/csv')
+        response = self.client.post('/api/upload/', {'file': upload})
+
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()['job_id']
+        wait_for(job_queue.get(job_id))
+
+        status = self.client.get(response.json()['status_url']).json()
+        self.assertEqual(status['status'], DONE)
+        self.assertEqual(status['result']['rows'], 3)
+        self.assertEqual(status['result']['missing_values'], 1)
+        self.assertEqual(self.client.get('/api/jobs/unknown/').status_code, 404)
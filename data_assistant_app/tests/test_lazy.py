@@ -0,0 +1,62 @@
+import pandas as pd
+import numpy as np
+import tempfile
+import os
+from django.test import TestCase
+from ..data_loader import DataLoader
+
+class TestLazyDataset(TestCase):
+    """Test cases for lazily cleaned chunked datasets"""
+
+    def setUp(self):
+        """Set up test data"""
+        rng = np.random.default_rng(6)
+        self.df = pd.DataFrame({
+            'Edad': rng.integers(18, 80, 400).astype(float),
+            'Ingresos': rng.normal(50000, 8000, 400),
+            'Ciudad': rng.choice(['Madrid', 'Lima', 'Bogotá'], 400, p=[0.5, 0.3, 0.2]),
+        })
+        self.df.loc[::7, 'Edad'] = np.nan
+        self.df.loc[::11, 'Ciudad'] = np.nan
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            self.df.to_csv(f.name, index=False)
+            self.temp_file = f.name
+        self.expected = DataLoader.load_dataset(self.temp_file, use_sidecar=False)
+
+    def tearDown(self):
+        os.unlink(self.temp_file)
+
+    def test_loading_does_not_clean(self):
+        """load_large_dataset keeps incomplete rows unless dropna is chained"""
+        lazy_dataset = DataLoader.load_large_dataset(self.temp_file, chunk_size=50)
+
+        pd.testing.assert_frame_equal(lazy_dataset.collect(), self.expected)
+        pd.testing.assert_frame_equal(lazy_dataset.dropna().collect(), self.expected.dropna())
+
+    def test_chained_steps_match_eager_cleaning(self):
+        """Fill, select and filter steps give the eager clean_dataset result"""
+        lazy_dataset = DataLoader.load_large_dataset(self.temp_file, chunk_size=50)
+
+        for strategy in ['fill_mean', 'fill_mode', 'fill_zero']:
+            eager = DataLoader.clean_dataset(self.expected.copy(), strategy)
+            pd.testing.assert_frame_equal(lazy_dataset.clean(strategy).collect(), eager)
+
+        chained = lazy_dataset.fillna('fill_mean').select(['Edad', 'Ciudad']).filter('Edad > 40')
+        eager = DataLoader.clean_dataset(self.expected.copy(), 'fill_mean')[['Edad', 'Ciudad']]
+        pd.testing.assert_frame_equal(chained.collect(), eager[eager['Edad'] > 40])
+        self.assertEqual(len(chained.head(3)), 3)
+
+    def test_streaming_export(self):
+        """Cleaned chunks are exported without materializing the dataset"""
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            export_path = f.name
+        try:
+            lazy_dataset = DataLoader.load_large_dataset(self.temp_file, chunk_size=50).dropna()
+            written = lazy_dataset.to_csv(export_path)
+            exported = pd.read_csv(export_path)
+        finally:
+            os.unlink(export_path)
+
+        self.assertEqual(written, len(self.expected.dropna()))
+        self.assertEqual(lazy_dataset.rows_read, 400)
+        self.assertEqual(exported.isnull().sum().sum(), 0)
@@ -0,0 +1,57 @@
+import pandas as pd
+import numpy as np
+import tempfile
+import os
+from django.test import TestCase
+from ..memory_optimizer import MemoryOptimizer
+from ..data_loader import DataLoader
+
+class TestMemoryOptimizer(TestCase):
+    """Test cases for dtype narrowing on load"""
+
+    def setUp(self):
+        """Set up test data"""
+        rng = np.random.default_rng(2)
+        self.df = pd.DataFrame({
+            'ID': np.arange(5000),
+            'Edad': rng.integers(18, 80, 5000),
+            'Ingresos': rng.normal(50000, 8000, 5000),
+            'Puntos': rng.integers(0, 10, 5000) / 2,
+            'Ciudad': rng.choice(['Madrid', 'Lima', 'Bogotá'], 5000),
+            'Nombre': [f'persona_{i}' for i in range(5000)],
+        })
+        self.df.loc[::9, 'Ciudad'] = np.nan
+
+    def test_narrows_dtypes_without_changing_values(self):
+        """Integers, exact floats and repeated strings shrink; lossy floats do not"""
+        optimized, report = MemoryOptimizer.optimize(self.df)
+
+        self.assertEqual(str(optimized['ID'].dtype), 'int16')
+        self.assertEqual(str(optimized['Edad'].dtype), 'int8')
+        self.assertEqual(str(optimized['Puntos'].dtype), 'float32')
+        self.assertEqual(str(optimized['Ingresos'].dtype), 'float64')
+        self.assertEqual(str(optimized['Ciudad'].dtype), 'category')
+        self.assertEqual(str(optimized['Nombre'].dtype), 'string')
+        self.assertLess(report['after_bytes'], report['before_bytes'])
+        pd.testing.assert_frame_equal(optimized.astype(object), self.df.astype(object), check_dtype=False)
+
+    def test_optimized_load_gives_same_analysis(self):
+        """Analysis and cleaning work on the optimized dtypes"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            self.df.to_csv(f.name, index=False)
+            temp_file = f.name
+
+        try:
+            plain = DataLoader.load_dataset(temp_file, use_sidecar=False, optimize_memory=False)
+            optimized = DataLoader.load_dataset(temp_file, use_sidecar=False, optimize_memory=True)
+        finally:
+            os.unlink(temp_file)
+
+        self.assertIn('memory_optimization', optimized.attrs)
+        expected, result = DataLoader.analyze_dataset(plain), DataLoader.analyze_dataset(optimized)
+        self.assertEqual(result['missing_values'], expected['missing_values'])
+        self.assertEqual(result['numeric_stats'], expected['numeric_stats'])
+        self.assertEqual(result['categorical_freqs'], expected['categorical_freqs'])
+
+        cleaned = DataLoader.clean_dataset(optimized.copy(), 'fill_mode')
+        self.assertEqual(cleaned['Ciudad'].isnull().sum(), 0)
@@ -0,0 +1,66 @@
+import pandas as pd
+import numpy as np
+from django.test import TestCase
+from ..numeric_stats import numeric_block, column_statistics, STAT_KEYS
+from ..parallel import AnalysisExecutor
+
+class TestAnalysisExecutor(TestCase):
+    """Test cases for the parallel analysis executor"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.executor = AnalysisExecutor(workers=2, min_cells=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+        super().tearDownClass()
+
+    def setUp(self):
+        """Set up test data"""
+        rng = np.random.default_rng(11)
+        self.df = pd.DataFrame({
+            'a': rng.normal(size=2000),
+            'b': rng.integers(0, 100, 2000).astype(float),
+            'c': rng.exponential(size=2000),
+            'city': rng.choice(['NYC', 'LA', 'Chicago'], 2000),
+            'team': rng.choice(['red', 'blue'], 2000),
+        })
+        self.df.loc[::13, 'b'] = np.nan
+
+    def test_numeric_shards_match_serial(self):
+        """Sharded column statistics equal the single-process kernel"""
+        _, block = numeric_block(self.df)
+        parallel_stats, rank_error = self.executor.numeric_stats(block)
+        serial_stats, _ = column_statistics(block)
+
+        self.assertEqual(rank_error, 0.0)
+        for key in STAT_KEYS:
+            np.testing.assert_allclose(parallel_stats[key], serial_stats[key])
+
+    def test_categorical_sketches_match_serial(self):
+        """Per-column sketches from workers give the same frequencies"""
+        sketches = self.executor.categorical_sketches(self.df, ['city', 'team'], 500)
+
+        for col in ['city', 'team']:
+            self.assertEqual(sketches[col].top(), self.df[col].value_counts().to_dict())
+
+    def test_chunks_merge_in_order(self):
+        """Chunks analyzed by workers merge into the sequential result"""
+        chunks = [self.df.iloc[start:start + 300] for start in range(0, len(self.df), 300)]
+        result = self.executor.analyze_chunks(chunks, {'max_missing_examples': 5}).result()
+
+        self.assertEqual(result['summary']['rows'], 2000)
+        self.assertEqual(result['missing_values']['by_column']['b'], int(self.df['b'].isnull().sum()))
+        self.assertEqual([row['index'] for row in result['rows_with_missing']], [0, 13, 26, 39, 52])
+        self.assertAlmostEqual(result['numeric_stats']['a']['mean'], self.df['a'].mean())
+
+    def test_small_streams_stay_serial(self):
+        """Chunk streams below min_cells never start a process pool"""
+        executor = AnalysisExecutor(workers=2, min_cells=10 ** 9)
+        chunks = [self.df.iloc[start:start + 300] for start in range(0, len(self.df), 300)]
+        result = executor.analyze_chunks(chunks, {'max_missing_examples': 5}).result()
+
+        self.assertEqual(result['summary']['rows'], 2000)
+        self.assertIsNone(executor._pool)
@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from django.test import TestCase, override_settings
+from ..preview import RowPreview
+
+class TestRowPreview(TestCase):
+    """Test cases for windowed row previews"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.df = pd.DataFrame({
+            'ID': np.arange(1, 251),
+            'Edad': np.tile([30.0, np.nan, 20.0, 40.0, 10.0], 50),
+            'Ciudad': np.tile(['Lima', 'Quito', 'Cali', 'Lima', 'Quito'], 50),
+        })
+
+    def test_positional_window(self):
+        """Pages are positional slices with the requested columns"""
+        page = RowPreview.window(self.df, offset=240, limit=20, columns=['ID', 'Ciudad'])
+
+        self.assertEqual(page['total_rows'], 250)
+        self.assertEqual(page['columns'], ['ID', 'Ciudad'])
+        self.assertEqual(page['rows'][0], [241, 'Lima'])
+        self.assertEqual(len(page['rows']), 10)
+        self.assertIsNone(page['next_offset'])
+        self.assertEqual(RowPreview.window(self.df, limit=5)['rows'][1], [2, None, 'Quito'])
+
+    def test_sorted_window(self):
+        """Sorted pages follow the column order with missing values last"""
+        descending = RowPreview.window(self.df, limit=3, sort='-Edad', cache_key='test')
+        last = RowPreview.window(self.df, offset=240, limit=10, sort='Edad', cache_key='test')
+
+        self.assertEqual([row[1] for row in descending['rows']], [40.0, 40.0, 40.0])
+        self.assertEqual(descending['index'], [3, 8, 13])
+        self.assertEqual([row[1] for row in last['rows']], [None] * 10)
+        with self.assertRaises(ValueError):
+            RowPreview.window(self.df, sort='Desconocida')
+        with self.assertRaises(ValueError):
+            RowPreview.window(self.df, limit=0)
+
+
+class TestRowsApi(TestCase):
+    """Test cases for the /api/rows/ endpoint"""
+
+    def setUp(self):
+        """Set up an isolated media directory with one dataset"""
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        pd.DataFrame({'a': range(30), 'b': ['x', 'y', 'z'] * 10}).to_csv(os.path.join(self.media_root, 'datos.csv'), index=False)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root)
+
+    def test_rows_endpoint(self):
+        """The endpoint pages, filters columns and validates its arguments"""
+        page = self.client.get('/api/rows/datos.csv/', {'offset': 10, 'limit': 5, 'columns': 'a', 'sort': '-a'}).json()
+
+        self.assertEqual(page['rows'], [[19], [18], [17], [16], [15]])
+        self.assertEqual(page['next_offset'], 15)
+        self.assertEqual(self.client.get('/api/rows/datos.csv/', {'columns': 'c'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/rows/datos.csv/', {'limit': 'x'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/rows/otro.csv/').status_code, 404)
@@ -0,0 +1,86 @@
+import pandas as pd
+import numpy as np
+import tempfile
+import os
+from django.test import TestCase
+from ..schema import CsvSchema
+from ..data_loader import DataLoader
+
+class TestCsvSchema(TestCase):
+    """Test cases for sampled CSV schema inference"""
+
+    def setUp(self):
+        """Set up test data"""
+        rng = np.random.default_rng(4)
+        self.df = pd.DataFrame({
+            'ID': np.arange(3000),
+            'Edad': rng.integers(18, 80, 3000).astype(float),
+            'Ingresos': rng.normal(50000, 8000, 3000).round(2),
+            'Ciudad': rng.choice(['Madrid', 'Lima', 'Bogotá'], 3000),
+            'Fecha': pd.date_range('2024-01-01', periods=3000, freq='h').strftime('%Y-%m-%d'),
+            'Activo': rng.choice([True, False], 3000),
+        })
+        self.df.loc[::17, 'Edad'] = np.nan
+        self.temp_files = []
+
+    def tearDown(self):
+        for path in self.temp_files:
+            os.unlink(path)
+
+    def write_csv(self, df, **kwargs):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            df.to_csv(f.name, index=False, **kwargs)
+            self.temp_files.append(f.name)
+            return f.name
+
+    def test_infers_types_and_dialect(self):
+        """Delimiter, decimal separator and column kinds come from the sample"""
+        path = self.write_csv(self.df, sep=';', decimal=',')
+        schema = CsvSchema.infer(path, sample_rows=200, sample_blocks=5)
+
+        self.assertEqual((schema.sep, schema.decimal), (';', ','))
+        self.assertEqual(schema.dtypes['Edad'], 'float64')
+        self.assertEqual(schema.dtypes['Ingresos'], 'float64')
+        self.assertEqual(schema.dtypes['Ciudad'], 'str')
+        self.assertEqual(schema.date_columns, ['Fecha'])
+        self.assertEqual(schema.dtypes['ID'], 'int64')
+        self.assertNotIn('Activo', schema.dtypes)
+
+    def test_schema_parse_matches_default_parse(self):
+        """Parsing with the inferred schema gives the default pandas frame"""
+        path = self.write_csv(self.df)
+
+        pd.testing.assert_frame_equal(DataLoader.load_dataset(path, use_sidecar=False), pd.read_csv(path, float_precision='round_trip'))
+        self.assertIs(CsvSchema.for_file(path), CsvSchema.for_file(path))
+
+    def test_falls_back_when_sample_is_wrong(self):
+        """A value outside the sample that contradicts the schema is still parsed"""
+        df = pd.DataFrame({'value': np.arange(5000) / 2})
+        df['value'] = df['value'].astype(object)
+        df.loc[4990, 'value'] = 'not a number'
+        path = self.write_csv(df)
+        CsvSchema.for_file(path).dtypes['value'] = 'float64'
+
+        chunks = list(DataLoader._read_csv_chunks(path, 1000))
+        streamed = pd.concat(chunks)
+        self.assertEqual(len(streamed), 5000)
+        self.assertEqual(list(streamed.index), list(range(5000)))
+        self.assertEqual(streamed['value'].iloc[4990], 'not a number')
+        pd.testing.assert_frame_equal(DataLoader.load_dataset(path, use_sidecar=False), pd.read_csv(path, float_precision='round_trip'))
+
+    def test_fallback_keeps_cached_schema_and_dtypes(self):
+        """A failed typed read neither changes the cached schema nor mixes dtypes in the progress path"""
+        df = pd.DataFrame({'ID': np.arange(25000), 'value': np.arange(25000) / 2})
+        df['value'] = df['value'].astype(object)
+        df.loc[24990, 'value'] = 'not a number'
+        path = self.write_csv(df)
+        schema = CsvSchema.for_file(path)
+        schema.dtypes['value'] = 'float64'
+
+        with_progress = DataLoader.load_dataset(path, use_sidecar=False, progress_callback=lambda *args: None)
+        streamed = pd.concat(chunk for chunk in DataLoader._read_csv_chunks(path, 10000))
+
+        self.assertEqual(schema.dtypes, {'ID': 'int64', 'value': 'float64'})
+        self.assertIs(CsvSchema.for_file(path), schema)
+        pd.testing.assert_frame_equal(with_progress, DataLoader.load_dataset(path, use_sidecar=False))
+        self.assertEqual(streamed['ID'].dtype, 'int64')
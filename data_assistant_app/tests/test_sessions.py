@@ -0,0 +1,34 @@
+import json
+from importlib import import_module
+from unittest import mock
+from django.conf import settings
+from django.test import TestCase
+
+class TestSessionWrites(TestCase):
+    """Test cases for writing sessions only when their content changes"""
+
+    def setUp(self):
+        """Start a session with a language set"""
+        self.store = import_module(settings.SESSION_ENGINE).SessionStore
+        self.client.post('/', {'action': 'change_language', 'language': 'es'})
+
+    def test_unchanged_language_is_not_saved(self):
+        """Page loads and repeated language switches do not write the session"""
+        with mock.patch.object(self.store, 'save') as save:
+            self.client.get('/')
+            self.client.post('/', {'action': 'change_language', 'language': 'es'})
+        save.assert_not_called()
+
+        self.client.post('/', {'action': 'change_language', 'language': 'en'})
+        self.assertEqual(self.client.session['language'], 'en')
+
+    def test_unchanged_chart_is_not_saved(self):
+        """Saving the same chart spec again does not write the session"""
+        chart_data = json.dumps({'type': 'bar', 'x': 'Ciudad', 'y': 'Edad', 'agg': 'sum'})
+        self.client.post('/', {'action': 'save_chart', 'chart_data': chart_data})
+
+        with mock.patch.object(self.store, 'save') as save:
+            response = self.client.post('/', {'action': 'save_chart', 'chart_data': chart_data})
+        save.assert_not_called()
+        self.assertEqual(response.json()['status'], 'success')
+        self.assertEqual(self.client.session['current_chart']['agg'], 'sum')
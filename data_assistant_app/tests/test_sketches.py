@@ -0,0 +1,117 @@
+import pandas as pd
+import numpy as np
+from django.test import TestCase
+from ..sketches import QuantileSketch, TopKCounter, CategoricalSketch
+from ..data_loader import DataLoader
+
+class TestQuantileSketch(TestCase):
+    """Test cases for the mergeable quantile sketch"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.values = np.random.default_rng(3).normal(size=50000)
+
+    def assert_rank_error_within(self, sketch, values, probs=(0.25, 0.5, 0.75)):
+        ordered = np.sort(values)
+        for prob, estimate in zip(probs, sketch.quantiles(probs)):
+            rank = np.searchsorted(ordered, estimate) / len(ordered)
+            self.assertLessEqual(abs(rank - prob), 2 * sketch.epsilon)
+
+    def test_exact_for_small_inputs(self):
+        """Sketch reports exact quantiles while nothing was compacted"""
+        sketch = QuantileSketch(epsilon=0.01)
+        sketch.update([1.0, 2.0, np.nan, 3.0, 4.0])
+
+        self.assertTrue(sketch.is_exact)
+        self.assertEqual(sketch.error_bound, 0.0)
+        self.assertEqual(sketch.quantiles([0.5]), [2.5])
+
+    def test_rank_error_within_bound(self):
+        """Approximate quartiles stay within the configured rank error"""
+        sketch = QuantileSketch(epsilon=0.01, seed=1)
+        for start in range(0, len(self.values), 1000):
+            sketch.update(self.values[start:start + 1000])
+
+        self.assertEqual(sketch.error_bound, 0.01)
+        self.assert_rank_error_within(sketch, self.values)
+
+    def test_merge_of_partial_sketches(self):
+        """Sketches built on separate parts can be merged"""
+        parts = [QuantileSketch(epsilon=0.01, seed=i) for i in range(4)]
+        for part, values in zip(parts, np.array_split(self.values, 4)):
+            part.update(values)
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+
+        self.assertEqual(merged.count, len(self.values))
+        self.assert_rank_error_within(merged, self.values)
+
+    def test_approx_analysis_reports_error_bound(self):
+        """analyze_dataset exposes the quantile method and its rank error"""
+        df = pd.DataFrame({'value': self.values})
+        exact = DataLoader.analyze_dataset(df)
+        approx = DataLoader.analyze_dataset(df, quantiles='approx', epsilon=0.01)
+
+        self.assertEqual(exact['quantiles'], {'method': 'exact', 'rank_error': 0.0})
+        self.assertEqual(approx['quantiles'], {'method': 'approx', 'rank_error': 0.01})
+        self.assertEqual(approx['numeric_stats']['value']['mean'], exact['numeric_stats']['value']['mean'])
+
+
+class TestTopKCounter(TestCase):
+    """Test cases for the Space-Saving top-k counter"""
+
+    def test_exact_below_capacity(self):
+        """Counts are exact while distinct values fit"""
+        counter = TopKCounter(capacity=10)
+        counter.update(pd.Series(['a', 'b', 'a', None]))
+        counter.update(pd.Series(['a', 'c']))
+
+        self.assertEqual(counter.top(), {'a': 3, 'b': 1, 'c': 1})
+
+    def test_heavy_hitters_survive_truncation(self):
+        """Frequent values are kept when capacity is exceeded"""
+        rng = np.random.default_rng(5)
+        counter = TopKCounter(capacity=20)
+        for _ in range(10):
+            noise = [f'id{i}' for i in rng.integers(0, 100000, 500)]
+            counter.update(pd.Series(['hot'] * 100 + ['warm'] * 50 + noise))
+
+        top = counter.top(2)
+        self.assertEqual(list(top), ['hot', 'warm'])
+        self.assertGreaterEqual(top['hot'], 1000)
+        self.assertLessEqual(len(counter.counts), 20)
+
+
+class TestCategoricalSketch(TestCase):
+    """Test cases for bounded categorical summaries"""
+
+    def test_distinct_exact_until_overflow(self):
+        """Distinct count is exact while the top-k counter holds every value"""
+        sketch = CategoricalSketch(capacity=10)
+        sketch.update(pd.Series(['a', 'b', 'b', None]))
+
+        self.assertEqual(sketch.distinct_count(), {'distinct': 2, 'approximate': False})
+
+    def test_high_cardinality_is_bounded(self):
+        """ID-like columns keep bounded state and estimate their cardinality"""
+        values = pd.Series([f'user_{i}' for i in range(20000)])
+        first, second = CategoricalSketch(capacity=100), CategoricalSketch(capacity=100)
+        first.update(values.iloc[:10000])
+        second.update(values.iloc[10000:])
+        first.merge(second)
+
+        distinct = first.distinct_count()
+        self.assertTrue(distinct['approximate'])
+        self.assertAlmostEqual(distinct['distinct'], 20000, delta=20000 * 0.05)
+        self.assertLessEqual(len(first.top()), 100)
+
+    def test_analysis_truncates_frequencies(self):
+        """analyze_dataset reports top values plus the distinct count"""
+        df = pd.DataFrame({'id': [f'id{i}' for i in range(5000)], 'city': ['NYC', 'LA'] * 2500})
+        analysis = DataLoader.analyze_dataset(df)
+
+        self.assertEqual(analysis['categorical_freqs']['city'], {'NYC': 2500, 'LA': 2500})
+        self.assertLessEqual(len(analysis['categorical_freqs']['id']), 20)
+        self.assertEqual(analysis['categorical_distinct']['city'], {'distinct': 2, 'approximate': False})
+        self.assertAlmostEqual(analysis['categorical_distinct']['id']['distinct'], 5000, delta=250)
@@ -0,0 +1,65 @@
+import pandas as pd
+import numpy as np
+import tempfile
+import os
+from django.test import TestCase
+from ..data_loader import DataLoader
+from ..streaming import StreamingAnalyzer
+
+class TestStreamingAnalysis(TestCase):
+    """Test cases for chunked (streaming) dataset analysis"""
+
+    def setUp(self):
+        """Set up test data"""
+        rng = np.random.default_rng(7)
+        self.df = pd.DataFrame({
+            'Age': rng.integers(18, 80, 500).astype(float),
+            'Income': rng.normal(50000, 8000, 500),
+            'City': rng.choice(['NYC', 'LA', 'Chicago'], 500),
+        })
+        self.df.loc[::7, 'Age'] = np.nan
+        self.df.loc[::11, 'City'] = None
+
+    def test_matches_in_memory_analysis(self):
+        """Streaming result has the same counts as analyze_dataset"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            self.df.to_csv(f.name, index=False)
+            temp_file = f.name
+
+        try:
+            streamed = DataLoader.analyze_large_dataset(temp_file, chunk_size=64)
+            expected = DataLoader.analyze_dataset(DataLoader.load_dataset(temp_file, use_sidecar=False))
+        finally:
+            os.unlink(temp_file)
+
+        self.assertEqual(streamed['summary'], expected['summary'])
+        self.assertEqual(streamed['missing_values'], expected['missing_values'])
+        self.assertEqual(streamed['rows_with_missing'], expected['rows_with_missing'])
+        self.assertEqual(streamed['categorical_freqs'], expected['categorical_freqs'])
+
+        for col in ['Age', 'Income']:
+            streamed_stats = streamed['numeric_stats'][col]
+            expected_stats = expected['numeric_stats'][col]
+            for key in ['mean', 'std', 'min', 'max']:
+                self.assertAlmostEqual(streamed_stats[key], expected_stats[key])
+            
+            # Quartiles come from a sketch and are approximate
+            tolerance = 0.05 * (expected_stats['max'] - expected_stats['min'])
+            for key in ['median', 'q1', 'q3']:
+                self.assertAlmostEqual(streamed_stats[key], expected_stats[key], delta=tolerance)
+
+    def test_merge_equals_sequential_update(self):
+        """Merging analyzers of two halves equals analyzing the whole"""
+        whole = StreamingAnalyzer()
+        whole.update(self.df)
+
+        first, second = StreamingAnalyzer(), StreamingAnalyzer()
+        first.update(self.df.iloc[:250])
+        second.update(self.df.iloc[250:])
+        first.merge(second)
+
+        merged, expected = first.result(), whole.result()
+        self.assertEqual(merged['missing_values'], expected['missing_values'])
+        self.assertEqual(merged['categorical_freqs'], expected['categorical_freqs'])
+        self.assertAlmostEqual(merged['numeric_stats']['Income']['mean'], expected['numeric_stats']['Income']['mean'])
+        self.assertAlmostEqual(merged['numeric_stats']['Income']['std'], expected['numeric_stats']['Income']['std'])
@@ -0,0 +1,77 @@
+import os
+import shutil
+import hashlib
+import tempfile
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from ..upload_handlers import StreamingUploadHandler
+from ..schema import CsvSchema
+from ..jobs import job_queue
+from ..upload_store import upload_store
+from .test_jobs import wait_for
+
+class TestStreamingUploadHandler(TestCase):
+    """Test cases for the single-pass upload handler"""
+
+    def setUp(self):
+        """Set up an isolated media directory"""
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.content = b"ID;Nombre;Ingresos\n" + b"".join(f"{i};N{i};{i},5\n".encode() for i in range(5000))
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root)
+
+    def test_chunks_are_hashed_counted_and_sniffed(self):
+        """One pass over the chunks yields hash, size, lines, format and delimiter"""
+        handler = StreamingUploadHandler()
+        handler.new_file('file', 'datos.csv', 'text/csv', len(self.content), 'utf-8')
+        for start in range(0, len(self.content), 4096):
+            self.assertIsNone(handler.receive_data_chunk(self.content[start:start + 4096], start))
+        upload = handler.file_complete(len(self.content))
+
+        self.assertEqual(upload.content_hash, hashlib.sha256(self.content).hexdigest())
+        self.assertEqual(upload.size, len(self.content))
+        self.assertEqual(upload.line_count, 5001)
+        self.assertEqual((upload.upload_format, upload.delimiter), ('text', ';'))
+        self.assertEqual(os.path.dirname(upload.temporary_file_path()), self.media_root)
+        upload.close()
+        self.assertEqual(os.listdir(self.media_root), [])
+
+    def test_upload_is_renamed_into_place(self):
+        """API uploads land in MEDIA_ROOT without leftover partial files"""
+        first = self.client.post('/api/upload/', {'file': SimpleUploadedFile('datos.csv', self.content)}).json()
+        second = self.client.post('/api/upload/', {'file': SimpleUploadedFile('datos.csv', self.content)}).json()
+        for response in (first, second):
+            wait_for(job_queue.get(response['job_id']))
+
+        self.assertFalse(first['duplicate'])
+        self.assertTrue(second['duplicate'])
+        self.assertEqual(second['filename'], first['filename'])
+        self.assertFalse([name for name in os.listdir(self.media_root) if name.endswith('.part')])
+        with open(os.path.join(self.media_root, first['filename']), 'rb') as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_content_must_match_extension(self):
+        """Uploads are rejected when the sniffed format differs from the extension; the sniffed delimiter is reused"""
+        as_excel = self.client.post('/api/upload/', {'file': SimpleUploadedFile('datos.xlsx', self.content)})
+        as_csv = self.client.post('/api/upload/', {'file': SimpleUploadedFile('datos.csv', b'PK\x03\x04' + self.content)})
+        no_delimiter = self.client.post('/api/upload/', {'file': SimpleUploadedFile('datos.csv', b'solo texto\n')})
+        accepted = self.client.post('/api/upload/', {'file': SimpleUploadedFile('datos.csv', self.content)}).json()
+        wait_for(job_queue.get(accepted['job_id']))
+
+        self.assertEqual(as_excel.status_code, 400)
+        self.assertEqual(as_csv.status_code, 400)
+        self.assertEqual(no_delimiter.status_code, 400)
+        self.assertEqual(CsvSchema.for_file(os.path.join(self.media_root, accepted['filename'])).sep, ';')
+
+    def test_failed_save_renders_the_error(self):
+        """An error before the stored name is known is reported instead of hidden"""
+        with mock.patch.object(upload_store, 'save', side_effect=OSError('disco lleno')):
+            response = self.client.post('/', {'datafile': SimpleUploadedFile('datos.csv', self.content)})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.context['filename'])
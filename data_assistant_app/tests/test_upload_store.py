@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+from django.test import TestCase, override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from ..upload_store import UploadStore
+
+class TestUploadStore(TestCase):
+    """Test cases for content-hash deduplication of uploads"""
+
+    def setUp(self):
+        """Set up an empty upload directory"""
+        self.root = tempfile.mkdtemp()
+        self.store = UploadStore(root=self.root)
+        self.content = b"ID,Nombre,Edad\n1,Juan,25\n2,Ana,30\n"
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_identical_content_maps_to_stored_copy(self):
+        """A re-upload of the same bytes returns the first stored file"""
+        first, first_duplicate = self.store.save(SimpleUploadedFile('datos.csv', self.content), 'datos_1.csv')
+        second, second_duplicate = self.store.save(SimpleUploadedFile('otro.csv', self.content), 'otro_2.csv')
+        other, other_duplicate = self.store.save(SimpleUploadedFile('datos.csv', self.content + b"3,Luis,41\n"), 'datos_3.csv')
+
+        self.assertEqual((first, first_duplicate), ('datos_1.csv', False))
+        self.assertEqual((second, second_duplicate), ('datos_1.csv', True))
+        self.assertEqual((other, other_duplicate), ('datos_3.csv', False))
+        stored = sorted(name for name in os.listdir(self.root) if not name.startswith('.'))
+        self.assertEqual(stored, ['datos_1.csv', 'datos_3.csv'])
+        with open(os.path.join(self.root, first), 'rb') as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_removed_files_are_stored_again(self):
+        """Forgotten or deleted files do not satisfy later uploads"""
+        first, _ = self.store.save(SimpleUploadedFile('datos.csv', self.content), 'datos_1.csv')
+        path = os.path.join(self.root, first)
+        os.remove(path)
+        self.store.forget(path)
+
+        again, duplicate = self.store.save(SimpleUploadedFile('datos.csv', self.content), 'datos_2.csv')
+        self.assertEqual((again, duplicate), ('datos_2.csv', False))
+        self.assertGreaterEqual(self.store.last_used(os.path.join(self.root, again)), os.path.getmtime(os.path.join(self.root, again)) - 1)
+
+    @override_settings(UPLOAD_DEDUPLICATION=False)
+    def test_deduplication_can_be_disabled(self):
+        """With UPLOAD_DEDUPLICATION off every upload gets its own file"""
+        self.store.save(SimpleUploadedFile('datos.csv', self.content), 'datos_1.csv')
+        second, duplicate = self.store.save(SimpleUploadedFile('datos.csv', self.content), 'datos_2.csv')
+        self.assertEqual((second, duplicate), ('datos_2.csv', False))
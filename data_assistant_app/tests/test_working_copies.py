@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from django.test import TestCase, override_settings
+from ..data_loader import DataLoader
+from ..working_copies import WorkingCopyStore
+
+class TestWorkingCopyStore(TestCase):
+    """Test cases for per-session cleaned working copies"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.spill_dir = tempfile.mkdtemp()
+        self.store = WorkingCopyStore(spill_dir=self.spill_dir)
+        self.original = pd.DataFrame({'Edad': [25, np.nan, 35, np.nan], 'Ciudad': ['Lima', None, 'Quito', 'Lima']})
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            self.original.to_csv(f.name, index=False)
+            self.temp_file = f.name
+
+    def tearDown(self):
+        os.unlink(self.temp_file)
+        shutil.rmtree(self.spill_dir)
+
+    def clean(self, session, strategy):
+        return self.store.apply(session, self.temp_file, lambda: self.original, strategy, DataLoader.clean_dataset)
+
+    def test_strategies_apply_incrementally_and_revert(self):
+        """Each strategy builds on the session's previous result; revert restores the original"""
+        self.clean('a', 'fill_zero')
+        dataset, strategy = self.clean('a', 'fill_mode')
+
+        self.assertEqual(strategy, 'fill_zero+fill_mode')
+        self.assertEqual(dataset['Edad'].tolist(), [25, 0, 35, 0])
+        self.assertEqual(dataset['Ciudad'].tolist(), ['Lima', 'Lima', 'Quito', 'Lima'])
+        self.assertTrue(self.original['Edad'].isnull().any())
+        self.assertIsNone(self.store.get('b', self.temp_file))
+
+        self.store.revert('a', self.temp_file)
+        self.assertIsNone(self.store.get('a', self.temp_file))
+
+    def test_copies_over_budget_spill_to_disk(self):
+        """Least recently used copies are spilled and read back intact"""
+        self.store = WorkingCopyStore(max_bytes=1, spill_dir=self.spill_dir)
+        expected, _ = self.clean('a', 'remove_missing')
+        self.clean('b', 'fill_zero')
+
+        self.assertEqual(len(os.listdir(self.spill_dir)), 1)
+        dataset, strategy = self.store.get('a', self.temp_file)
+        pd.testing.assert_frame_equal(dataset, expected)
+        self.assertEqual(strategy, 'remove_missing')
+        self.assertEqual(len(os.listdir(self.spill_dir)), 1)
+
+    def test_modified_file_drops_working_copy(self):
+        """A working copy does not outlive the file version it was made from"""
+        self.clean('a', 'fill_zero')
+        os.utime(self.temp_file, ns=(0, 0))
+
+        self.assertIsNone(self.store.get('a', self.temp_file))
+
+    def test_expired_and_orphaned_copies_are_removed(self):
+        """Unused copies expire, copies of deleted files are dropped and orphaned spills removed"""
+        self.store = WorkingCopyStore(max_bytes=1, spill_dir=self.spill_dir)
+        self.clean('a', 'fill_zero')
+        self.clean('b', 'fill_mode')
+        with override_settings(WORKING_COPY_MAX_AGE=0):
+            self.store.prune()
+        self.assertEqual(self.store.current_bytes, 0)
+        self.assertEqual(os.listdir(self.spill_dir), [])
+
+        self.clean('a', 'fill_zero')
+        self.store.discard_file(self.temp_file)
+        self.assertIsNone(self.store.get('a', self.temp_file))
+
+        # Spill files of a stopped process, and of this one, after a restart
+        for name in ('999999999-old.pkl', f'{os.getpid()}-live.pkl'):
+            open(os.path.join(self.spill_dir, name), 'wb').close()
+        self.store.remove_orphaned_spills()
+        self.assertEqual(os.listdir(self.spill_dir), [f'{os.getpid()}-live.pkl'])
+        self.store.clear()
+        self.assertEqual(os.listdir(self.spill_dir), [])
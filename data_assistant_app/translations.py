@@ -124,6 +124,7 @@ TRANSLATIONS = {
         'CHART_TYPE': 'Chart type',
         'X_AXIS': 'X axis',
         'Y_AXIS': 'Y axis',
+        'AGGREGATION': 'Aggregation',
         'GENERATE_CHART': 'Generate chart',
         'EXPORT_REPORT': 'Export Report',
         'DOWNLOAD_PDF': 'Download PDF',
@@ -133,6 +134,10 @@ TRANSLATIONS = {
         'DRAG_AND_DROP': 'Drag and drop your CSV or Excel file here, or click to browse',
         'CLEAN_ALL_FILES': 'Clean all files',
         'FILE_UPLOADED': 'File uploaded',
+        'PROCESSING_FILE': 'Processing file',
+        'BROWSE_ROWS': 'Browse rows',
+        'PREVIOUS': 'Previous',
+        'NEXT': 'Next',
         'DATASET_OVERVIEW': 'Dataset Overview',
         'ROWS': 'Rows',
         'COLUMNS': 'Columns',
@@ -358,6 +363,7 @@ TRANSLATIONS = {
         'CHART_TYPE': 'Tipo de gráfica',
         'X_AXIS': 'Eje X',
         'Y_AXIS': 'Eje Y',
+        'AGGREGATION': 'Agregación',
         'GENERATE_CHART': 'Generar gráfica',
         'EXPORT_REPORT': 'Exportar Reporte',
         'DOWNLOAD_PDF': 'Descargar PDF',
@@ -367,6 +373,10 @@ TRANSLATIONS = {
         'DRAG_AND_DROP': 'Arrastra y suelta tu archivo CSV o Excel aquí, o haz clic para explorar',
         'CLEAN_ALL_FILES': 'Limpiar todos los archivos',
         'FILE_UPLOADED': 'Archivo subido',
+        'PROCESSING_FILE': 'Procesando archivo',
+        'BROWSE_ROWS': 'Explorar filas',
+        'PREVIOUS': 'Anterior',
+        'NEXT': 'Siguiente',
         'DATASET_OVERVIEW': 'Vista General del Dataset',
         'ROWS': 'Filas',
         'COLUMNS': 'Columnas',
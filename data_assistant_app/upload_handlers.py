@@ -0,0 +1,100 @@
+"""
+Data Assistant App - Streaming Upload Handler
+
+Django upload handler that writes each uploaded file in chunks straight
+into MEDIA_ROOT (where UploadStore renames it into place) instead of
+buffering it in memory or in a temporary directory. While the chunks are
+written it computes the SHA-256 content hash, counts bytes and lines and
+keeps the head of the file, from which the format and the CSV delimiter
+are sniffed. Validation and deduplication then need no extra pass over
+the file.
+"""
+
+import os
+import hashlib
+import logging
+from django.core.files.uploadhandler import FileUploadHandler
+from django.core.files.uploadedfile import UploadedFile
+from .schema import CsvSchema, SNIFF_BYTES
+from .upload_store import upload_store
+
+logger = logging.getLogger(__name__)
+
+# Leading bytes identifying binary spreadsheet formats
+FORMAT_SIGNATURES = {
+    b'PK\x03\x04': 'xlsx',
+    b'\xd0\xcf\x11\xe0': 'xls',
+}
+
+
+class StreamedUploadedFile(UploadedFile):
+    """Uploaded file already written to MEDIA_ROOT, with what was learned while writing it"""
+
+    def __init__(self, path, name, content_type, size, charset, content_type_extra=None,
+                 content_hash=None, line_count=0, head=b''):
+        super().__init__(open(path, 'rb'), name, content_type, size, charset, content_type_extra)
+        self.path = path
+        self.content_hash = content_hash
+        self.line_count = line_count
+        self.head = head
+        self.upload_format = sniff_format(head)
+        self.delimiter = None
+        if self.upload_format == 'text':
+            self.delimiter = CsvSchema.sniff_delimiter(head.decode('utf-8', errors='replace'))
+
+    def temporary_file_path(self):
+        return self.path
+
+    def close(self):
+        # The file is gone once UploadStore has renamed it into place
+        self.file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class StreamingUploadHandler(FileUploadHandler):
+    """Writes, hashes and sniffs uploads in a single pass over their chunks"""
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.path = upload_store.temp_path()
+        self.destination = open(self.path, 'wb')
+        self.digest = hashlib.sha256()
+        self.line_count = 0
+        self.head = b''
+
+    def receive_data_chunk(self, raw_data, start):
+        self.destination.write(raw_data)
+        self.digest.update(raw_data)
+        self.line_count += raw_data.count(b'\n')
+        if len(self.head) < SNIFF_BYTES:
+            self.head += raw_data[:SNIFF_BYTES - len(self.head)]
+        # Returning None keeps the chunk from later handlers
+        return None
+
+    def file_complete(self, file_size):
+        self.destination.close()
+        upload = StreamedUploadedFile(
+            self.path, self.file_name, self.content_type, file_size, self.charset, self.content_type_extra,
+            content_hash=self.digest.hexdigest(), line_count=self.line_count, head=self.head,
+        )
+        logger.info(
+            f"Received {self.file_name}: {file_size} bytes, {self.line_count} lines, "
+            f"format={upload.upload_format}, delimiter={upload.delimiter!r}"
+        )
+        return upload
+
+    def upload_interrupted(self):
+        destination = getattr(self, 'destination', None)
+        if destination is not None:
+            destination.close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def sniff_format(head):
+    """'xlsx' or 'xls' from the file signature, 'text' otherwise"""
+    for signature, upload_format in FORMAT_SIGNATURES.items():
+        if head.startswith(signature):
+            return upload_format
+    return 'text'
@@ -0,0 +1,124 @@
+"""
+Data Assistant App - Deduplicated Upload Store
+
+Uploads are hashed (SHA-256) while they are streamed to disk. Content that
+was already uploaded maps to the stored copy instead of a new timestamped
+file, so its parsed dataset, sidecar, schema and analysis caches are
+reused and a repeated upload is served without parsing again. The
+hash -> filename index is a small JSON file in MEDIA_ROOT.
+"""
+
+import os
+import json
+import time
+import uuid
+import hashlib
+import threading
+import logging
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+
+logger = logging.getLogger(__name__)
+
+# Index of stored uploads by content hash, kept next to the files
+INDEX_FILENAME = '.upload_index.json'
+
+
+class UploadStore:
+    """Content-addressed saving of uploaded files into MEDIA_ROOT"""
+
+    def __init__(self, root=None):
+        self._root = root
+        self._lock = threading.Lock()
+
+    @property
+    def root(self):
+        return str(self._root or settings.MEDIA_ROOT)
+
+    @property
+    def enabled(self):
+        return getattr(settings, 'UPLOAD_DEDUPLICATION', True)
+
+    def save(self, uploaded_file, filename):
+        """Store an uploaded file under filename unless identical content is already stored.
+
+        Files received by StreamingUploadHandler are already on disk in
+        MEDIA_ROOT with their hash computed; they are renamed into place
+        instead of being copied. Returns (stored filename, True if it is an
+        existing copy).
+        """
+        content_hash = getattr(uploaded_file, 'content_hash', None)
+        if content_hash is not None:
+            return self._commit(uploaded_file.temporary_file_path(), content_hash, filename)
+        
+        temp_path = self.temp_path()
+        digest = hashlib.sha256()
+        try:
+            with open(temp_path, 'wb') as out:
+                for chunk in uploaded_file.chunks():
+                    digest.update(chunk)
+                    out.write(chunk)
+            return self._commit(temp_path, digest.hexdigest(), filename)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def temp_path(self):
+        """New path for a partially written upload, on the same filesystem as the stored files"""
+        os.makedirs(self.root, exist_ok=True)
+        return os.path.join(self.root, f".upload-{uuid.uuid4().hex}.part")
+
+    def last_used(self, file_path):
+        """Time the file was last uploaded (its mtime if it is not indexed)"""
+        filename = os.path.basename(file_path)
+        with self._lock:
+            for entry in self._read_index().values():
+                if entry['filename'] == filename:
+                    return entry['last_used']
+        return os.path.getmtime(file_path)
+
+    def forget(self, file_path):
+        """Drop the index entry of a file that was removed from MEDIA_ROOT"""
+        filename = os.path.basename(file_path)
+        with self._lock:
+            index = self._read_index()
+            remaining = {key: entry for key, entry in index.items() if entry['filename'] != filename}
+            if len(remaining) != len(index):
+                self._write_index(remaining)
+
+    def _commit(self, temp_path, content_hash, filename):
+        key = content_hash + os.path.splitext(filename)[1].lower()
+        with self._lock:
+            index = self._read_index()
+            entry = index.get(key)
+            if self.enabled and entry is not None and os.path.exists(os.path.join(self.root, entry['filename'])):
+                entry['last_used'] = time.time()
+                self._write_index(index)
+                logger.info(f"Upload {filename} matches stored file {entry['filename']}")
+                return entry['filename'], True
+
+            stored_name = FileSystemStorage(location=self.root).get_available_name(filename)
+            os.replace(temp_path, os.path.join(self.root, stored_name))
+            index[key] = {'filename': stored_name, 'last_used': time.time()}
+            self._write_index(index)
+            return stored_name, False
+
+    def _index_path(self):
+        return os.path.join(self.root, INDEX_FILENAME)
+
+    def _read_index(self):
+        try:
+            with open(self._index_path(), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        temp_path = self._index_path() + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(temp_path, self._index_path())
+
+
+# Shared upload store for the whole process
+upload_store = UploadStore()
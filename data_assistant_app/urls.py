@@ -15,5 +15,8 @@ urlpatterns = [
     # API endpoints
     path('api/upload/', views.api_upload_file, name='api_upload'),
     path('api/analysis/<str:filename>/', views.api_get_analysis, name='api_analysis'),
+    path('api/rows/<str:filename>/', views.api_get_rows, name='api_rows'),
+    path('api/chart/<str:filename>/', views.api_get_chart, name='api_chart'),
     path('api/clean/<str:filename>/', views.api_clean_data, name='api_clean'),
+    path('api/jobs/<str:job_id>/', views.api_job_status, name='api_job_status'),
 ]
\ No newline at end of file
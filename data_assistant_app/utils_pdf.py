@@ -7,8 +7,8 @@ class PDFDataPreparer:
     """Handles PDF data preparation and formatting"""
     
     @staticmethod
-    def prepare_pdf_data(dataset, analysis, chart_config=None):
-        """Prepare data structure for PDF generation"""
+    def prepare_pdf_data(dataset, analysis, chart=None):
+        """Prepare data structure for PDF generation; chart is the ChartAggregator output of the saved chart spec"""
         # Optimize: use preview_data instead of multiple .head(50) calls
         preview_data = dataset.head(50)
         
@@ -20,7 +20,8 @@ class PDFDataPreparer:
             'rows_with_missing': analysis['rows_with_missing'],
             'final_data': preview_data.to_dict('records'),
             'numeric_stats': analysis['numeric_stats'],
-            'categorical_freqs': analysis['categorical_freqs']
+            'categorical_freqs': analysis['categorical_freqs'],
+            'categorical_distinct': analysis.get('categorical_distinct', {})
         }
         
         # Handle NaN values for charts
@@ -34,47 +35,53 @@ class PDFDataPreparer:
         
         pdf_data['final_data'] = improved_data
         
-        # Configure custom chart
-        logger.info(f"Chart config received: {chart_config}")
-        if chart_config and chart_config.get('type') and chart_config.get('xColumn') and chart_config.get('yColumn'):
-            chart_type = chart_config.get('type')
-            x_col = chart_config.get('xColumn')
-            y_col = chart_config.get('yColumn')
-            labels = chart_config.get('labels', [])
-            data = chart_config.get('data', [])
+        # Configure custom chart from data regenerated for the session's chart spec
+        if chart and chart.get('labels') and chart.get('values'):
+            chart_type = chart['type']
+            x_col = chart['x']
+            y_col = chart.get('y')
+            labels = chart['labels']
+            data = chart['values']
             
-            logger.info(f"Processing chart: type={chart_type}, x_col={x_col}, y_col={y_col}, labels_count={len(labels)}, data_count={len(data)}")
+            logger.info(f"Processing chart: type={chart_type}, x_col={x_col}, y_col={y_col}, points={len(labels)}")
             
-            if x_col in dataset.columns and y_col in dataset.columns and labels and data:
-                logger.info(f"Creating chart with valid data: x_col={x_col}, y_col={y_col}")
-                if chart_type == 'bar':
-                    pdf_data['custom_chart'] = {
-                        'type': 'bars',
-                        'categories': labels,
-                        'values': data,
-                        'title': f'{y_col} by {x_col}'
-                    }
-                    logger.info(f"Bar chart created with {len(labels)} categories and {len(data)} values")
-                elif chart_type == 'scatter':
-                    pdf_data['custom_chart'] = {
-                        'type': 'scatter',
-                        'x_data': labels,
-                        'y_data': data,
-                        'x_label': x_col,
-                        'y_label': y_col,
-                        'title': f'Relationship between {x_col} and {y_col}'
-                    }
-                    logger.info(f"Scatter chart created with {len(labels)} x-values and {len(data)} y-values")
-                elif chart_type == 'line':
-                    pdf_data['custom_chart'] = {
-                        'type': 'line',
-                        'x_data': labels,
-                        'y_data': data,
-                        'x_label': x_col,
-                        'y_label': y_col,
-                        'title': f'{y_col} evolution by {x_col}'
-                    }
-                    logger.info(f"Line chart created with {len(labels)} x-values and {len(data)} y-values")
+            if chart_type == 'bar':
+                pdf_data['custom_chart'] = {
+                    'type': 'bars',
+                    'categories': labels,
+                    'values': data,
+                    'title': f"{y_col} by {x_col} ({chart.get('agg')})"
+                }
+                logger.info(f"Bar chart created with {len(labels)} categories")
+            elif chart_type == 'histogram':
+                pdf_data['custom_chart'] = {
+                    'type': 'bars',
+                    'categories': labels,
+                    'values': data,
+                    'title': f'Distribution of {x_col}'
+                }
+                logger.info(f"Histogram created with {len(labels)} bins")
+            elif chart_type == 'scatter':
+                pdf_data['custom_chart'] = {
+                    'type': 'scatter',
+                    'x_data': labels,
+                    'y_data': data,
+                    'counts': chart.get('counts'),
+                    'x_label': x_col,
+                    'y_label': y_col,
+                    'title': f'Relationship between {x_col} and {y_col}'
+                }
+                logger.info(f"Scatter chart created with {len(labels)} points")
+            elif chart_type == 'line':
+                pdf_data['custom_chart'] = {
+                    'type': 'line',
+                    'x_data': labels,
+                    'y_data': data,
+                    'x_label': x_col,
+                    'y_label': y_col,
+                    'title': f'{y_col} evolution by {x_col}'
+                }
+                logger.info(f"Line chart created with {len(labels)} points")
         
         # Fallback to default chart
         if 'custom_chart' not in pdf_data and 'Name' in dataset.columns and 'Income' in dataset.columns:
@@ -1,4 +1,5 @@
 from django.shortcuts import render, redirect
+from django.urls import reverse
 from django.core.files.storage import FileSystemStorage
 from django.contrib import messages
 from django.http import HttpResponse, JsonResponse
@@ -8,17 +9,32 @@ import logging
 from django.conf import settings
 from datetime import datetime
 from .pdf_generator import PDFGenerator
-from .data_loader import DataLoader
+from .data_loader import DataLoader, QUANTILE_METHODS
+from .cleaning import CLEANING_METHODS, REPORT_ATTR
+from .preview import RowPreview, DEFAULT_PAGE_ROWS
+from .charts import ChartAggregator, chart_cache
+from .dataset_cache import dataset_cache, file_fingerprint
+from .analysis_cache import analysis_cache
+from .sidecar import ColumnarSidecar
 from .utils_pdf import PDFDataPreparer
 from .error_handler import ErrorHandler
+from .jobs import job_queue
+from .upload_store import upload_store
+from .upload_handlers import sniff_format
+from .schema import CsvSchema, SNIFF_BYTES
+from .working_copies import working_copies
 from .translations import get_text
 import glob
+from urllib.parse import urlencode
 
 logger = logging.getLogger(__name__)
 
 # File extensions supported by the application
 SUPPORTED_EXTENSIONS = ["*.csv", "*.xlsx", "*.xls", "*.pdf"]
 
+# Upload extensions and the format their content must have (see upload_handlers.sniff_format)
+EXTENSION_FORMATS = {'.csv': 'text', '.xlsx': 'xlsx', '.xls': 'xls'}
+
 # Strategy mapping for data cleaning
 CLEANING_STRATEGIES = {
     'eliminar_nan': 'remove_missing',
@@ -39,13 +55,18 @@ def cleanup_old_files():
     """Auto-cleanup to prevent file accumulation"""
     try:
         all_files = get_all_files()
-        all_files.sort(key=os.path.getmtime)
+        # Re-uploads of a stored file count as recent use
+        all_files.sort(key=upload_store.last_used)
         
         files_to_remove = all_files[:-3] if len(all_files) > 3 else []
         
         for file_path in files_to_remove:
             try:
                 os.remove(file_path)
+                dataset_cache.invalidate(file_path)
+                ColumnarSidecar.remove(file_path)
+                upload_store.forget(file_path)
+                working_copies.discard_file(file_path)
                 ErrorHandler.log_file_operation("cleanup", file_path, success=True)
             except OSError as e:
                 ErrorHandler.log_file_operation("cleanup", file_path, success=False)
@@ -63,12 +84,18 @@ def purge_all_files():
         for file_path in all_files:
             try:
                 os.remove(file_path)
+                dataset_cache.invalidate(file_path)
+                ColumnarSidecar.remove(file_path)
+                upload_store.forget(file_path)
+                working_copies.discard_file(file_path)
                 removed_files.append(os.path.basename(file_path))
                 ErrorHandler.log_file_operation("purge", file_path, success=True)
             except OSError as e:
                 ErrorHandler.log_file_operation("purge", file_path, success=False)
                 logger.warning(f"Failed to remove {file_path}: {e}")
         
+        # Cleaned copies (and their spill files) of every session go with the data
+        working_copies.clear()
         return removed_files
                 
     except Exception as e:
@@ -82,8 +109,33 @@ def append_timestamp_to_filename(original_name):
     extension = os.path.splitext(original_name)[1]
     return f"{base_name}_{timestamp}{extension}"
 
-def render_home_with_analysis(request, dataset, filename, uploaded_file_url=None, error=None):
-    """Render home template with dataset analysis"""
+def get_cached_analysis(file_path, dataset, strategy=None):
+    """Analysis of dataset (the file after the cleaning strategy), served from the analysis cache"""
+    return analysis_cache.get_or_compute(file_path, lambda: DataLoader.analyze_dataset(dataset), strategy)
+
+def get_cached_chart(file_path, dataset, spec, strategy=None):
+    """Chart data of a chart spec over dataset (the file after the cleaning strategy), served from the chart cache"""
+    max_points = ChartAggregator.max_points()
+    return chart_cache.get_or_compute(
+        file_path, lambda: ChartAggregator.from_spec(dataset, spec, max_points), strategy, max_points=max_points, **spec
+    )
+
+def session_key(request):
+    """Key of the request's session, creating the session if it has none yet"""
+    if not request.session.session_key:
+        request.session.create()
+    return request.session.session_key
+
+def get_working_dataset(request, file_path):
+    """Return (dataset, strategy): the session's cleaned working copy, or the original with strategy None"""
+    key = request.session.session_key
+    working_copy = working_copies.get(key, file_path) if key else None
+    if working_copy is not None:
+        return working_copy
+    return DataLoader.get_dataset(file_path), None
+
+def render_home_with_analysis(request, dataset, filename, uploaded_file_url=None, error=None, job=None, strategy=None):
+    """Render home template with dataset analysis (or the progress of its upload job)"""
     # Get current language from session, default to English
     language = request.session.get('language', 'en')
     
@@ -91,6 +143,7 @@ def render_home_with_analysis(request, dataset, filename, uploaded_file_url=None
         'uploaded_file_url': uploaded_file_url,
         'filename': filename,
         'error': error,
+        'job_id': job.id if job else None,
         'summary': None,
         'missing_total': 0,
         'missing_by_column': {},
@@ -106,6 +159,7 @@ def render_home_with_analysis(request, dataset, filename, uploaded_file_url=None
             'CHART_TYPE': get_text('CHART_TYPE', language),
             'X_AXIS': get_text('X_AXIS', language),
             'Y_AXIS': get_text('Y_AXIS', language),
+            'AGGREGATION': get_text('AGGREGATION', language),
             'GENERATE_CHART': get_text('GENERATE_CHART', language),
             'EXPORT_REPORT': get_text('EXPORT_REPORT', language),
             'DOWNLOAD_PDF': get_text('DOWNLOAD_PDF', language),
@@ -115,6 +169,7 @@ def render_home_with_analysis(request, dataset, filename, uploaded_file_url=None
             'DRAG_AND_DROP': get_text('DRAG_AND_DROP', language),
             'CLEAN_ALL_FILES': get_text('CLEAN_ALL_FILES', language),
             'FILE_UPLOADED': get_text('FILE_UPLOADED', language),
+            'PROCESSING_FILE': get_text('PROCESSING_FILE', language),
             'DATASET_OVERVIEW': get_text('DATASET_OVERVIEW', language),
             'ROWS': get_text('ROWS', language),
             'COLUMNS': get_text('COLUMNS', language),
@@ -140,13 +195,16 @@ def render_home_with_analysis(request, dataset, filename, uploaded_file_url=None
             'APP_TITLE': get_text('APP_TITLE', language),
             'PROFESSIONAL_ASSISTANT': get_text('PROFESSIONAL_ASSISTANT', language),
             'APP_DESCRIPTION': get_text('APP_DESCRIPTION', language),
+            'BROWSE_ROWS': get_text('BROWSE_ROWS', language),
+            'PREVIOUS': get_text('PREVIOUS', language),
+            'NEXT': get_text('NEXT', language),
         }
     }
     
     if dataset is None:
         return render(request, 'home.html', context)
     
-    analysis = DataLoader.analyze_dataset(dataset)
+    analysis = get_cached_analysis(os.path.join(settings.MEDIA_ROOT, filename), dataset, strategy)
     
     # Update context with analysis data
     context.update({
@@ -154,7 +212,6 @@ def render_home_with_analysis(request, dataset, filename, uploaded_file_url=None
         'filename': filename,
         'summary': {
             'first_rows': dataset.head().to_html(classes='table table-striped', index=False, table_id='main-table'),
-            'last_rows': dataset.tail().to_html(classes='table table-striped', index=False),
             'rows': dataset.shape[0],
             'columns': dataset.shape[1],
             'data_types': dataset.dtypes.astype(str).to_dict(),
@@ -164,14 +221,20 @@ def render_home_with_analysis(request, dataset, filename, uploaded_file_url=None
         'missing_total': analysis['missing_values']['total'],
         'missing_by_column': analysis['missing_values']['by_column'],
         'rows_with_missing': analysis['rows_with_missing'],
+        'incomplete_rows': analysis['missing_values']['incomplete_rows'],
         'numeric_stats': analysis['numeric_stats'],
         'categorical_freqs': analysis['categorical_freqs'],
+        'categorical_summary': [
+            {'column': col, 'freqs': freqs, **analysis['categorical_distinct'][col]}
+            for col, freqs in analysis['categorical_freqs'].items()
+        ],
     })
     
     return render(request, 'home.html', context)
 
 def handle_file_upload(request):
-    """Handle new file upload with security validations"""
+    """Handle new file upload with security validations; parsing runs as a background job"""
+    filename = None
     try:
         datafile = request.FILES['datafile']
         
@@ -182,29 +245,59 @@ def handle_file_upload(request):
         
         cleanup_old_files()
         
-        new_filename = append_timestamp_to_filename(datafile.name)
+        filename, duplicate = upload_store.save(datafile, append_timestamp_to_filename(datafile.name))
+        if duplicate:
+            # Same content as a stored file: its parse and analysis are cached
+            ErrorHandler.log_data_operation("upload", filename, success=True, user_info="duplicate_upload")
+            return redirect(f"{reverse('home')}?{urlencode({'file': filename})}")
         fs = FileSystemStorage()
-        filename = fs.save(new_filename, datafile)
         file_path = os.path.join(settings.MEDIA_ROOT, filename)
         
-        dataset = DataLoader.load_dataset(file_path)
-        ErrorHandler.log_data_operation("upload", filename, success=True, user_info="file_upload")
+        job = job_queue.submit('upload', process_uploaded_file, file_path, filename, getattr(datafile, 'delimiter', None))
         
-        return render_home_with_analysis(request, dataset, filename, fs.url(filename))
+        return render_home_with_analysis(request, None, filename, fs.url(filename), job=job)
         
     except Exception as e:
         error_msg = ErrorHandler.handle_error(request, e, context="file_upload")
         ErrorHandler.log_data_operation("upload", datafile.name if 'datafile' in locals() else 'unknown', success=False)
         return render_home_with_analysis(request, None, filename, error=error_msg)
 
+def process_uploaded_file(job, file_path, filename, delimiter=None):
+    """Background job: parse an uploaded file, write its sidecar and analyze it.
+
+    delimiter is the CSV delimiter sniffed while the upload was received.
+    """
+    try:
+        job.set_stage('parsing')
+        if delimiter:
+            CsvSchema.for_file(file_path, sep=delimiter)
+        dataset = DataLoader.get_dataset(file_path, progress_callback=job.report_progress)
+        
+        job.set_stage('writing_sidecar')
+        ColumnarSidecar.write(file_path, dataset)
+        
+        job.set_stage('analyzing')
+        # Warms the analysis cache for the page the client is redirected to
+        analysis = get_cached_analysis(file_path, dataset)
+    except Exception:
+        ErrorHandler.log_data_operation("upload", filename, success=False)
+        raise
+    
+    ErrorHandler.log_data_operation("upload", filename, success=True, user_info="file_upload")
+    return {
+        'filename': filename,
+        'rows': len(dataset),
+        'columns': len(dataset.columns),
+        'missing_values': analysis['missing_values']['total'],
+    }
+
 def validate_uploaded_file(file):
     """Validate uploaded file for security and format"""
     try:
         # Validación de extensión
-        allowed_extensions = ['.csv', '.xlsx', '.xls']
         file_extension = os.path.splitext(file.name)[1].lower()
         
-        if file_extension not in allowed_extensions:
+        if file_extension not in EXTENSION_FORMATS:
             logger.warning(f"Invalid file extension: {file_extension}")
             return False
         
@@ -213,15 +306,29 @@ def validate_uploaded_file(file):
             logger.warning(f"File too large: {file.size} bytes")
             return False
         
-        # Validación básica de contenido
-        content = file.read(1024).decode('utf-8', errors='ignore')
-        file.seek(0)  # Reset file pointer
-        
-        # Verificar que contiene datos (al menos una coma o tab)
-        if not any(char in content for char in [',', '\t', ';']):
-            logger.warning("File doesn't appear to contain valid data")
+        # El formato detectado al recibir el archivo debe coincidir con la extensión
+        head = getattr(file, 'head', None)
+        if head is None:
+            head = file.read(SNIFF_BYTES)
+            file.seek(0)  # Reset file pointer
+        upload_format = getattr(file, 'upload_format', None) or sniff_format(head)
+        if upload_format != EXTENSION_FORMATS[file_extension]:
+            logger.warning(f"File content ({upload_format}) does not match its extension {file_extension}")
             return False
         
+        if upload_format == 'text':
+            # Texto delimitado: cabecera con un separador y al menos una fila de datos
+            content = head.decode('utf-8', errors='ignore')
+            delimiter = getattr(file, 'delimiter', None) or CsvSchema.sniff_delimiter(content)
+            first_line = content.split('\n', 1)[0]
+            if delimiter not in first_line:
+                logger.warning("File doesn't appear to contain valid data")
+                return False
+            line_count = getattr(file, 'line_count', None)
+            if line_count is not None and line_count < 1:
+                logger.warning("File has no data rows")
+                return False
+        
         return True
         
     except Exception as e:
@@ -236,19 +343,21 @@ def handle_data_cleaning(request):
         
         file_path = os.path.join(settings.MEDIA_ROOT, filename)
         
-        dataset = DataLoader.load_dataset(file_path)
-        
         if strategy == 'revertir_cambios':
-            # Revert to original data
-            dataset = DataLoader.load_dataset(file_path)
+            # Revert to original data (the cached dataset is never modified)
+            working_copies.revert(session_key(request), file_path)
+            dataset, applied = DataLoader.get_dataset(file_path), None
             ErrorHandler.log_data_operation("revert", filename, success=True)
         else:
-            # Apply cleaning strategy using mapping
+            # Apply cleaning strategy on top of the session's working copy
             clean_strategy = CLEANING_STRATEGIES.get(strategy, 'remove_missing')
-            dataset = DataLoader.clean_dataset(dataset, clean_strategy)
+            dataset, applied = working_copies.apply(
+                session_key(request), file_path, lambda: DataLoader.get_dataset(file_path),
+                clean_strategy, DataLoader.clean_dataset
+            )
             ErrorHandler.log_data_operation(f"clean_{clean_strategy}", filename, success=True)
         
-        return render_home_with_analysis(request, dataset, filename)
+        return render_home_with_analysis(request, dataset, filename, strategy=applied)
         
     except Exception as e:
         error_msg = ErrorHandler.handle_error(request, e, context="data_cleaning")
@@ -265,16 +374,25 @@ def handle_pdf_export(request):
         
         file_path = os.path.join(settings.MEDIA_ROOT, filename)
         
-        dataset = DataLoader.load_dataset(file_path)
-        analysis = DataLoader.analyze_dataset(dataset)
+        dataset, strategy = get_working_dataset(request, file_path)
+        analysis = get_cached_analysis(file_path, dataset, strategy)
         analysis['filename'] = filename
         
-        chart_config = request.session.get('current_chart', {})
-        logger.info(f"Retrieved chart config from session: {chart_config}")
+        chart_spec = request.session.get('current_chart')
+        logger.info(f"Retrieved chart spec from session: {chart_spec}")
+        chart = None
+        if chart_spec:
+            # The session holds only the spec; the chart data is regenerated (or read from the chart cache)
+            try:
+                chart = get_cached_chart(file_path, dataset, ChartAggregator.spec(chart_spec), strategy)
+            except ValueError as e:
+                logger.warning(f"Saved chart does not apply to {filename}: {e}")
         
         # Get current language for PDF
         language = request.session.get('language', 'en')
-        pdf_data = PDFDataPreparer.prepare_pdf_data(dataset, analysis, chart_config)
+        pdf_data = PDFDataPreparer.prepare_pdf_data(dataset, analysis, chart)
+        if strategy is not None:
+            pdf_data['cleaning_notes'] = dataset.attrs.get(REPORT_ATTR)
         
         # Generate PDF with language
         pdf_generator = PDFGenerator(language=language)
@@ -304,10 +422,11 @@ def handle_pdf_export(request):
 def handle_chart_save(request):
     """Handle chart configuration save"""
     try:
-        chart_data = json.loads(request.POST.get('chart_data', '{}'))
-        logger.info(f"Saving chart configuration: {chart_data}")
-        request.session['current_chart'] = chart_data
-        request.session.modified = True  # Ensure session is saved
+        # Only the compact spec is kept; the data is regenerated from the dataset when needed
+        chart_spec = ChartAggregator.spec(json.loads(request.POST.get('chart_data', '{}')))
+        logger.info(f"Saving chart configuration: {chart_spec}")
+        if request.session.get('current_chart') != chart_spec:
+            request.session['current_chart'] = chart_spec
         ErrorHandler.log_data_operation("chart_save", "session", success=True)
         logger.info("Chart configuration saved successfully")
         return JsonResponse({'status': 'success'})
@@ -346,6 +465,10 @@ def home(request):
         elif request.FILES.get('datafile'):
             return handle_file_upload(request)
     
+    # Show the analysis of an already processed upload (target of the upload job page)
+    if request.GET.get('file'):
+        return handle_file_view(request, request.GET['file'])
+    
     # Get current language from session, default to English
     language = request.session.get('language', 'en')
     
@@ -359,6 +482,7 @@ def home(request):
             'CHART_TYPE': get_text('CHART_TYPE', language),
             'X_AXIS': get_text('X_AXIS', language),
             'Y_AXIS': get_text('Y_AXIS', language),
+            'AGGREGATION': get_text('AGGREGATION', language),
             'GENERATE_CHART': get_text('GENERATE_CHART', language),
             'EXPORT_REPORT': get_text('EXPORT_REPORT', language),
             'DOWNLOAD_PDF': get_text('DOWNLOAD_PDF', language),
@@ -393,15 +517,31 @@ def home(request):
             'APP_TITLE': get_text('APP_TITLE', language),
             'PROFESSIONAL_ASSISTANT': get_text('PROFESSIONAL_ASSISTANT', language),
             'APP_DESCRIPTION': get_text('APP_DESCRIPTION', language),
+            'BROWSE_ROWS': get_text('BROWSE_ROWS', language),
+            'PREVIOUS': get_text('PREVIOUS', language),
+            'NEXT': get_text('NEXT', language),
         }
     })
 
+def handle_file_view(request, filename):
+    """Render the analysis of a file that is already stored in MEDIA_ROOT"""
+    filename = os.path.basename(filename)
+    file_path = os.path.join(settings.MEDIA_ROOT, filename)
+    try:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {filename}")
+        dataset, strategy = get_working_dataset(request, file_path)
+        return render_home_with_analysis(request, dataset, filename, FileSystemStorage().url(filename), strategy=strategy)
+    except Exception as e:
+        error_msg = ErrorHandler.handle_error(request, e, context="file_view")
+        return render_home_with_analysis(request, None, None, error=error_msg)
+
 def handle_language_change(request):
     """Handle language change request"""
     language = request.POST.get('language', 'en')
-    if language in ['en', 'es']:
+    # The session is only written when the language actually changes
+    if language in ['en', 'es'] and request.session.get('language', 'en') != language:
         request.session['language'] = language
-        request.session.modified = True
         logger.info(f"Language changed to: {language}")
     
     return JsonResponse({'success': True, 'language': language})
@@ -420,28 +560,21 @@ def api_upload_file(request):
             if not validate_uploaded_file(file):
                 return JsonResponse({'error': 'Invalid file format or size'}, status=400)
             
-            # Save file
-            fs = FileSystemStorage()
-            filename = fs.save(append_timestamp_to_filename(file.name), file)
+            # Save file (identical content maps to the stored copy and its caches)
+            filename, duplicate = upload_store.save(file, append_timestamp_to_filename(file.name))
             file_path = os.path.join(settings.MEDIA_ROOT, filename)
             
-            # Process file
-            try:
-                dataset = DataLoader.load_dataset(file_path)
-                analysis = DataLoader.analyze_dataset(dataset)
-                
-                return JsonResponse({
-                    'status': 'success',
-                    'filename': filename,
-                    'rows': len(dataset),
-                    'columns': len(dataset.columns),
-                    'missing_values': analysis['missing_values']['total'],
-                    'message': 'File processed successfully'
-                })
-                
-            except Exception as e:
-                logger.error(f"API processing error: {e}")
-                return JsonResponse({'error': 'File processing failed'}, status=500)
+            # Parse and analyze in the background; clients poll the job status
+            job = job_queue.submit('upload', process_uploaded_file, file_path, filename, getattr(file, 'delimiter', None))
+            
+            return JsonResponse({
+                'status': 'accepted',
+                'job_id': job.id,
+                'filename': filename,
+                'duplicate': duplicate,
+                'status_url': reverse('api_job_status', args=[job.id]),
+                'message': 'File received; processing started'
+            }, status=202)
                 
         except Exception as e:
             logger.error(f"API upload error: {e}")
@@ -449,6 +582,16 @@ def api_upload_file(request):
     
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
+def api_job_status(request, job_id):
+    """API endpoint reporting the stage, progress and result of a background job"""
+    if request.method == 'GET':
+        job = job_queue.get(job_id)
+        if job is None:
+            return JsonResponse({'error': 'Job not found'}, status=404)
+        return JsonResponse(job.to_dict())
+    
+    return JsonResponse({'error': 'Method not allowed'}, status=405)
+
 def api_get_analysis(request, filename):
     """API endpoint to get analysis results"""
     if request.method == 'GET':
@@ -458,16 +601,36 @@ def api_get_analysis(request, filename):
             if not os.path.exists(file_path):
                 return JsonResponse({'error': 'File not found'}, status=404)
             
-            dataset = DataLoader.load_dataset(file_path)
-            analysis = DataLoader.analyze_dataset(dataset)
+            # Files above the threshold are analyzed chunk by chunk
+            streaming = (
+                request.GET.get('mode') == 'streaming'
+                or os.path.getsize(file_path) >= settings.STREAMING_ANALYSIS_MIN_BYTES
+            )
+            quantiles = request.GET.get('quantiles', 'exact')
+            if quantiles not in QUANTILE_METHODS:
+                return JsonResponse({'error': f'Invalid quantiles mode: {quantiles}'}, status=400)
+            
+            if streaming:
+                analysis = analysis_cache.get_or_compute(
+                    file_path, lambda: DataLoader.analyze_large_dataset(file_path), mode='streaming'
+                )
+            else:
+                analysis = analysis_cache.get_or_compute(
+                    file_path,
+                    lambda: DataLoader.analyze_dataset(DataLoader.get_dataset(file_path), quantiles=quantiles),
+                    quantiles=quantiles
+                )
             
             return JsonResponse({
                 'status': 'success',
                 'filename': filename,
+                'streaming': streaming,
                 'summary': analysis['summary'],
                 'missing_values': analysis['missing_values'],
                 'numeric_stats': analysis['numeric_stats'],
-                'categorical_freqs': analysis['categorical_freqs']
+                'quantiles': analysis['quantiles'],
+                'categorical_freqs': analysis['categorical_freqs'],
+                'categorical_distinct': analysis['categorical_distinct']
             })
             
         except Exception as e:
@@ -476,29 +639,107 @@ def api_get_analysis(request, filename):
     
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
+def api_get_rows(request, filename):
+    """API endpoint serving a window of rows (offset, limit, columns, sort) of a parsed dataset"""
+    if request.method == 'GET':
+        try:
+            file_path = os.path.join(settings.MEDIA_ROOT, os.path.basename(filename))
+            
+            if not os.path.exists(file_path):
+                return JsonResponse({'error': 'File not found'}, status=404)
+            
+            try:
+                offset = int(request.GET.get('offset', 0))
+                limit = int(request.GET.get('limit', DEFAULT_PAGE_ROWS))
+            except ValueError:
+                return JsonResponse({'error': 'offset and limit must be integers'}, status=400)
+            columns = [col for col in request.GET.get('columns', '').split(',') if col]
+            sort = request.GET.get('sort') or None
+            
+            # The session's cleaned working copy if it has one, otherwise the cached original
+            dataset, strategy = get_working_dataset(request, file_path)
+            try:
+                window = RowPreview.window(
+                    dataset, offset, limit, columns, sort, cache_key=(file_fingerprint(file_path), strategy)
+                )
+            except ValueError as e:
+                return JsonResponse({'error': str(e)}, status=400)
+            
+            return JsonResponse({'status': 'success', 'filename': filename, **window})
+            
+        except Exception as e:
+            logger.error(f"API rows error: {e}")
+            return JsonResponse({'error': 'Row preview failed'}, status=500)
+    
+    return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+def api_get_chart(request, filename):
+    """API endpoint serving chart data (type, x, y, agg, bins, filters) aggregated over the whole dataset"""
+    if request.method == 'GET':
+        try:
+            file_path = os.path.join(settings.MEDIA_ROOT, os.path.basename(filename))
+            
+            if not os.path.exists(file_path):
+                return JsonResponse({'error': 'File not found'}, status=404)
+            
+            try:
+                spec = ChartAggregator.spec({
+                    'type': request.GET.get('type'),
+                    'x': request.GET.get('x'),
+                    'y': request.GET.get('y'),
+                    'agg': request.GET.get('agg'),
+                    'bins': request.GET.get('bins'),
+                    'filters': json.loads(request.GET.get('filters') or '{}'),
+                })
+            except (ValueError, json.JSONDecodeError) as e:
+                return JsonResponse({'error': str(e)}, status=400)
+            
+            # Charts follow the session's cleaned working copy, like the analysis
+            dataset, strategy = get_working_dataset(request, file_path)
+            try:
+                chart = get_cached_chart(file_path, dataset, spec, strategy)
+            except ValueError as e:
+                return JsonResponse({'error': str(e)}, status=400)
+            
+            return JsonResponse({'status': 'success', 'filename': filename, 'chart': chart})
+            
+        except Exception as e:
+            logger.error(f"API chart error: {e}")
+            return JsonResponse({'error': 'Chart aggregation failed'}, status=500)
+    
+    return JsonResponse({'error': 'Method not allowed'}, status=405)
+
 def api_clean_data(request, filename):
     """API endpoint to clean data"""
     if request.method == 'POST':
         try:
             strategy = request.POST.get('strategy', 'remove_missing')
+            if strategy not in CLEANING_METHODS:
+                return JsonResponse({'error': f'Invalid cleaning strategy: {strategy}'}, status=400)
             file_path = os.path.join(settings.MEDIA_ROOT, filename)
             
             if not os.path.exists(file_path):
                 return JsonResponse({'error': 'File not found'}, status=404)
             
-            dataset = DataLoader.load_dataset(file_path)
-            cleaned_dataset = DataLoader.clean_dataset(dataset, strategy)
-            
-            # Save cleaned dataset
             cleaned_filename = f"cleaned_{filename}"
             cleaned_path = os.path.join(settings.MEDIA_ROOT, cleaned_filename)
-            cleaned_dataset.to_csv(cleaned_path, index=False)
+            
+            if os.path.getsize(file_path) >= settings.STREAMING_ANALYSIS_MIN_BYTES:
+                # Large files are cleaned and exported chunk by chunk
+                lazy_dataset = DataLoader.load_large_dataset(file_path).clean(strategy)
+                cleaned_rows = lazy_dataset.to_csv(cleaned_path)
+                original_rows = lazy_dataset.rows_read
+            else:
+                dataset = DataLoader.get_dataset(file_path)
+                cleaned_dataset = DataLoader.clean_dataset(dataset, strategy)
+                cleaned_dataset.to_csv(cleaned_path, index=False)
+                original_rows, cleaned_rows = len(dataset), len(cleaned_dataset)
             
             return JsonResponse({
                 'status': 'success',
-                'original_rows': len(dataset),
-                'cleaned_rows': len(cleaned_dataset),
-                'removed_rows': len(dataset) - len(cleaned_dataset),
+                'original_rows': original_rows,
+                'cleaned_rows': cleaned_rows,
+                'removed_rows': original_rows - cleaned_rows,
                 'cleaned_filename': cleaned_filename,
                 'message': f'Data cleaned using {strategy} strategy'
             })
@@ -559,8 +800,11 @@ def get_total_rows_count():
         
         for file_path in all_files[:5]:  # Limit to last 5 files
             try:
-                dataset = DataLoader.load_dataset(file_path)
-                total_rows += len(dataset)
+                # Uploads warm the analysis cache, so this is usually a lookup
+                analysis = analysis_cache.get_or_compute(
+                    file_path, lambda: DataLoader.analyze_dataset(DataLoader.get_dataset(file_path))
+                )
+                total_rows += analysis['summary']['rows']
             except:
                 continue
         
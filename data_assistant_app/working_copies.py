@@ -0,0 +1,254 @@
+"""
+Data Assistant App - Session Working Copies
+
+Keeps the cleaned state of a dataset per session, so cleaning strategies
+build on each other and later actions (page views, PDF exports) see the
+cleaned data instead of the original file. The original stays in the
+shared dataset cache; a working copy only exists once a session has
+cleaned the file, so reverting just drops it. Working copies share a
+memory budget; the least recently used ones are spilled to disk and read
+back when their session needs them again. Copies unused for longer than a
+session lives, or whose source file is gone, are pruned; spill files left
+by processes that no longer run are removed at startup.
+"""
+
+import os
+import time
+import uuid
+import threading
+import logging
+from collections import OrderedDict
+import pandas as pd
+from django.conf import settings
+from .dataset_cache import file_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Default memory budget shared by all in-memory working copies
+DEFAULT_WORKING_COPY_MAX_BYTES = 256 * 1024 * 1024
+
+# Spilled working copies are stored here, inside MEDIA_ROOT
+SPILL_DIRNAME = '.working_copies'
+
+# Seconds between two pruning passes over the working copies
+PRUNE_INTERVAL = 60
+
+
+class WorkingCopy:
+    """Cleaned dataset of one session and file, in memory or spilled to disk"""
+
+    def __init__(self, fingerprint, dataset, strategies):
+        self.fingerprint = fingerprint
+        self.dataset = dataset
+        self.strategies = strategies
+        self.size = int(dataset.memory_usage(deep=True).sum())
+        self.spill_path = None
+        self.last_access = time.monotonic()
+
+    @property
+    def strategy(self):
+        """The applied strategies as one analysis-cache key, e.g. 'remove_missing+fill_zero'"""
+        return '+'.join(self.strategies)
+
+
+class WorkingCopyStore:
+    """Per-session working copies under a shared memory budget"""
+
+    def __init__(self, max_bytes=None, spill_dir=None, max_age=None):
+        self._max_bytes = max_bytes
+        self._spill_dir = spill_dir
+        self._max_age = max_age
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_prune = time.monotonic()
+        self.current_bytes = 0
+
+    @property
+    def max_bytes(self):
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return getattr(settings, 'WORKING_COPY_MAX_BYTES', DEFAULT_WORKING_COPY_MAX_BYTES)
+
+    @property
+    def max_age(self):
+        """Seconds a working copy is kept without being used (by default, the session lifetime)"""
+        if self._max_age is not None:
+            return self._max_age
+        return getattr(settings, 'WORKING_COPY_MAX_AGE', getattr(settings, 'SESSION_COOKIE_AGE', 3600))
+
+    @property
+    def spill_dir(self):
+        return str(self._spill_dir or os.path.join(settings.MEDIA_ROOT, SPILL_DIRNAME))
+
+    def get(self, session_key, file_path):
+        """Return (dataset, strategy) of the session's working copy, or None if it uses the original.
+
+        The dataset is shared and must not be mutated in place.
+        """
+        with self._lock:
+            self._prune_if_due()
+            copy = self._current((session_key, os.path.abspath(file_path)), file_path)
+            return (copy.dataset, copy.strategy) if copy is not None else None
+
+    def apply(self, session_key, file_path, load_original, strategy, clean):
+        """Clean the session's current state of file_path with clean(dataset, strategy), which must not mutate its input.
+
+        load_original() returns the unmodified dataset, used when the
+        session has no working copy yet; neither it nor the previous
+        working copy is modified. Returns (cleaned dataset, strategy chain).
+        """
+        key = (session_key, os.path.abspath(file_path))
+        with self._lock:
+            self._prune_if_due()
+            current = self._current(key, file_path)
+            base, strategies = (current.dataset, current.strategies) if current is not None else (None, [])
+        if base is None:
+            base = load_original()
+        copy = WorkingCopy(file_fingerprint(file_path), clean(base, strategy), strategies + [strategy])
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = copy
+            self.current_bytes += copy.size
+            self._evict_to_budget()
+        logger.info(f"Working copy of {file_path} for session {session_key}: {copy.strategy}")
+        return copy.dataset, copy.strategy
+
+    def revert(self, session_key, file_path):
+        """Go back to the original dataset by dropping the session's working copy"""
+        key = (session_key, os.path.abspath(file_path))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def discard_file(self, file_path):
+        """Drop the working copies of every session for file_path (e.g. the file was deleted)"""
+        path = os.path.abspath(file_path)
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == path]:
+                self._remove(key)
+
+    def prune(self):
+        """Drop working copies unused for longer than max_age or whose source file is gone"""
+        with self._lock:
+            self._prune()
+
+    def clear(self):
+        """Drop every working copy, including spill files of other processes"""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self._remove_spill_files(lambda pid: True)
+
+    def remove_orphaned_spills(self):
+        """Delete spill files of processes that are no longer running and expired ones"""
+        with self._lock:
+            self._remove_spill_files(lambda pid: pid != os.getpid() and not _process_running(pid))
+
+    def _prune_if_due(self):
+        if time.monotonic() - self._last_prune >= PRUNE_INTERVAL:
+            self._prune()
+
+    def _prune(self):
+        self._last_prune = time.monotonic()
+        expired = self._last_prune - self.max_age
+        for key, copy in list(self._entries.items()):
+            if copy.last_access < expired or not os.path.exists(key[1]):
+                self._remove(key)
+                logger.info(f"Dropped working copy of {key[1]} for session {key[0]}")
+        # Expired spill files of other (possibly stopped) processes
+        self._remove_spill_files(lambda pid: False)
+
+    def _remove_spill_files(self, should_remove):
+        """Remove spill files whose process id passes should_remove, or that outlived max_age.
+
+        A spill file is deleted when its copy is read back, so its age is
+        the time since the copy was last used.
+        """
+        if not os.path.isdir(self.spill_dir):
+            return
+        expired = time.time() - self.max_age
+        for name in os.listdir(self.spill_dir):
+            path = os.path.join(self.spill_dir, name)
+            pid = name.split('-', 1)[0]
+            if not name.endswith('.pkl'):
+                continue
+            try:
+                if not pid.isdigit() or should_remove(int(pid)) or os.path.getmtime(path) < expired:
+                    os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove spilled working copy {name}: {e}")
+
+    def _current(self, key, file_path):
+        copy = self._entries.get(key)
+        if copy is None:
+            return None
+        try:
+            fingerprint = file_fingerprint(file_path)
+        except OSError:
+            fingerprint = None
+        if copy.fingerprint != fingerprint:
+            # The file changed (or was removed) since it was cleaned
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        copy.last_access = time.monotonic()
+        if copy.dataset is None:
+            try:
+                self._load(copy)
+            except OSError as e:
+                # The spill file was removed (purge by another process)
+                logger.warning(f"Working copy of {file_path} lost: {e}")
+                self._entries.pop(key)
+                return None
+            self._evict_to_budget()
+        return copy
+
+    def _evict_to_budget(self):
+        # The most recently used copy stays in memory even if it alone exceeds the budget
+        for copy in list(self._entries.values())[:-1]:
+            if self.current_bytes <= self.max_bytes:
+                break
+            if copy.dataset is not None:
+                self._spill(copy)
+
+    def _spill(self, copy):
+        os.makedirs(self.spill_dir, exist_ok=True)
+        # The process id in the name tells which spill files are orphaned after a restart
+        copy.spill_path = os.path.join(self.spill_dir, f"{os.getpid()}-{uuid.uuid4().hex}.pkl")
+        # Pickle keeps the row index and dtypes (categoricals, dates) exactly
+        copy.dataset.to_pickle(copy.spill_path)
+        copy.dataset = None
+        self.current_bytes -= copy.size
+        logger.info(f"Working copy spilled to disk: {copy.spill_path} ({copy.size} bytes)")
+
+    def _load(self, copy):
+        copy.dataset = pd.read_pickle(copy.spill_path)
+        os.remove(copy.spill_path)
+        copy.spill_path = None
+        self.current_bytes += copy.size
+
+    def _remove(self, key):
+        copy = self._entries.pop(key)
+        if copy.dataset is not None:
+            self.current_bytes -= copy.size
+        elif copy.spill_path and os.path.exists(copy.spill_path):
+            os.remove(copy.spill_path)
+
+
+def _process_running(pid):
+    if os.name == 'nt':
+        # os.kill would terminate the process on Windows; expired files still go by age
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# Shared working-copy store for the whole process
+working_copies = WorkingCopyStore()
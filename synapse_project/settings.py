@@ -68,7 +68,7 @@ WSGI_APPLICATION = 'synapse_project.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.environ.get('DATABASE_PATH', BASE_DIR / 'db.sqlite3'),
     }
 }
 
@@ -106,9 +106,94 @@ MEDIA_ROOT = BASE_DIR / 'media'
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 
-# Session configuration
+# Uploads are written in chunks straight into MEDIA_ROOT, hashed and sniffed on the way
+FILE_UPLOAD_HANDLERS = ['data_assistant_app.upload_handlers.StreamingUploadHandler']
+
+# Django caches: analysis results go to a compressed file cache that survives restarts
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'analysis': {
+        'BACKEND': os.environ.get('ANALYSIS_CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('ANALYSIS_CACHE_LOCATION', str(BASE_DIR / 'cache' / 'analysis')),
+        'TIMEOUT': int(os.environ.get('ANALYSIS_CACHE_TIMEOUT', 7 * 24 * 3600)),  # 7 days
+        'OPTIONS': {'MAX_ENTRIES': 1000},
+    },
+}
+ANALYSIS_CACHE_ALIAS = 'analysis'
+
+# Session store: 'file' (file cache shared by all workers), 'memory' (per-process
+# local memory, single-worker deployments) or 'db' (database rows in db.sqlite3)
+SESSION_MODE = os.environ.get('SESSION_MODE', 'file')
+if SESSION_MODE == 'db':
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+else:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
+    SESSION_CACHE_ALIAS = 'sessions'
+    if SESSION_MODE == 'memory':
+        CACHES['sessions'] = {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'sessions',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    else:
+        CACHES['sessions'] = {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('SESSION_CACHE_LOCATION', str(BASE_DIR / 'cache' / 'sessions')),
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+
+# Parsed dataset cache (total DataFrame memory kept in process)
+DATASET_CACHE_MAX_BYTES = int(os.environ.get('DATASET_CACHE_MAX_BYTES', 512 * 1024 * 1024))  # 512MB
+
+# Narrow dtypes of parsed datasets (downcast numbers, categorical/Arrow strings)
+DATASET_OPTIMIZE_MEMORY = os.environ.get('DATASET_OPTIMIZE_MEMORY', 'False').lower() == 'true'
+DATASET_CATEGORY_MAX_RATIO = float(os.environ.get('DATASET_CATEGORY_MAX_RATIO', 0.5))
+
+# CSV schema inference: rows sampled from the head plus blocks at random offsets
+CSV_SCHEMA_SAMPLE_ROWS = int(os.environ.get('CSV_SCHEMA_SAMPLE_ROWS', 1000))
+CSV_SCHEMA_SAMPLE_BLOCKS = int(os.environ.get('CSV_SCHEMA_SAMPLE_BLOCKS', 10))
+CSV_PARSE_DATES = os.environ.get('CSV_PARSE_DATES', 'False').lower() == 'true'
+
+# CSV parser backend: 'auto' (pyarrow when installed), 'pyarrow' or 'c'
+CSV_PARSER_ENGINE = os.environ.get('CSV_PARSER_ENGINE', 'auto')
+
+# Files at or above this size are analyzed in streaming mode by the API
+STREAMING_ANALYSIS_MIN_BYTES = int(os.environ.get('STREAMING_ANALYSIS_MIN_BYTES', 100 * 1024 * 1024))  # 100MB
+
+# Normalized rank error of approximate quartiles (streaming and ?quantiles=approx)
+QUANTILE_SKETCH_EPSILON = float(os.environ.get('QUANTILE_SKETCH_EPSILON', 0.01))
+
+# Most frequent values reported per categorical column (others are summarized by a distinct count)
+CATEGORICAL_TOP_K = int(os.environ.get('CATEGORICAL_TOP_K', 20))
+
+# Worker processes for analysis (1 disables the process pool); frames with fewer cells than the threshold are analyzed serially
+ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', 1))
+ANALYSIS_PARALLEL_MIN_CELLS = int(os.environ.get('ANALYSIS_PARALLEL_MIN_CELLS', 5_000_000))
+
+# Background jobs (upload parsing/analysis) run on an in-process thread pool
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+JOB_TTL_SECONDS = int(os.environ.get('JOB_TTL_SECONDS', 3600))
+
+# pandas copy-on-write for the whole process (opt-in): cleaned copies share untouched columns with the original
+PANDAS_COPY_ON_WRITE = os.environ.get('PANDAS_COPY_ON_WRITE', 'False').lower() == 'true'
+
+# Memory shared by per-session cleaned working copies; older ones spill to disk
+WORKING_COPY_MAX_BYTES = int(os.environ.get('WORKING_COPY_MAX_BYTES', 256 * 1024 * 1024))  # 256MB
+
+# Uploads with the same content as a stored file reuse that file and its caches
+UPLOAD_DEDUPLICATION = os.environ.get('UPLOAD_DEDUPLICATION', 'True').lower() == 'true'
+
+# Most points or categories returned by the chart API for one chart
+CHART_MAX_POINTS = int(os.environ.get('CHART_MAX_POINTS', 1000))
+
+# Session configuration (sessions are written only when their content changes)
 SESSION_COOKIE_AGE = 3600  # 1 hour
-SESSION_SAVE_EVERY_REQUEST = True
+SESSION_SAVE_EVERY_REQUEST = os.environ.get('SESSION_SAVE_EVERY_REQUEST', 'False').lower() == 'true'
+
+# Cleaned working copies unused for this long are dropped (default: session lifetime)
+WORKING_COPY_MAX_AGE = int(os.environ.get('WORKING_COPY_MAX_AGE', SESSION_COOKIE_AGE))
 
 # Security settings
 SECURE_BROWSER_XSS_FILTER = True